@@ -0,0 +1,188 @@
+"""
+Skompilowane poprawne odpowiedzi (matchery) do szybkiego sprawdzania odpowiedzi użytkownika.
+
+Poprawna odpowiedź jest zamieniana raz na obiekt z gotową wartością (liczba całkowita, ułamek
+jako para licznik/mianownik, liczba zmiennoprzecinkowa z tolerancją albo napis), a matchery są
+zapamiętywane według typu i wartości odpowiedzi, więc kolejne sesje i pytania o tej samej odpowiedzi
+korzystają z tego samego obiektu.
+
+Odpowiedzi użytkownika są parsowane bez wyjątków dla typowych zapisów: same cyfry ASCII i ułamki "3/4"
+metodami napisów, inne (" -12 ", "0.5") wyrażeniem regularnym. Napisy bez żadnej cyfry są odrzucane od razu,
+a pozostałe nietypowe zapisy (np. "1_000", "1e3" w ułamkach, cyfry spoza ASCII) przekazywane do
+int()/float()/Fraction(), dzięki czemu wynik jest identyczny jak przy bezpośrednim użyciu tych funkcji.
+"""
+import re
+from fractions import Fraction
+
+MATCHER_CACHE_SIZE = 65536
+FLOAT_TOLERANCE = 1e-6
+
+_INT_PATTERN = re.compile(r'\s*[+-]?\d+\s*', re.ASCII)
+_FRACTION_PATTERN = re.compile(r'\s*([+-]?\d+)(?:/(\d+))?\s*', re.ASCII)
+_FLOAT_PATTERN = re.compile(r'\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*', re.ASCII)
+_DIGIT = re.compile(r'\d')
+
+
+def _is_ascii_digits(text):
+    return text.isdigit() and text.isascii()
+
+
+def parse_int(text):
+    """Zwraca int(text) albo None, gdy napis nie jest liczbą całkowitą."""
+    if text.__class__ is str:
+        if _is_ascii_digits(text) or _INT_PATTERN.fullmatch(text):
+            return int(text)
+        if not _DIGIT.search(text):
+            return None
+    try:
+        return int(text)
+    except ValueError:
+        return None
+
+
+def parse_float(text):
+    """Zwraca float(text) albo None, gdy napis nie jest liczbą (float('nan') i 'inf' nie zawierają cyfr)."""
+    if text.__class__ is str:
+        if _is_ascii_digits(text) or _FLOAT_PATTERN.fullmatch(text):
+            return float(text)
+        if not _DIGIT.search(text):
+            return None
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def parse_fraction(text):
+    """
+    Zwraca parę (licznik, mianownik > 0) równą Fraction(text) albo None dla nieprawidłowego zapisu.
+    Mianownik zero zgłasza ZeroDivisionError, tak jak Fraction.
+    """
+    if text.__class__ is str:
+        numerator, slash, denominator = text.partition('/')
+        if _is_ascii_digits(numerator) and (not slash or _is_ascii_digits(denominator) and int(denominator)):
+            return int(numerator), int(denominator) if slash else 1
+        match = _FRACTION_PATTERN.fullmatch(text)
+        if match:
+            numerator, denominator = match.groups()
+            if denominator is None:
+                return int(numerator), 1
+            if int(denominator):
+                return int(numerator), int(denominator)
+        elif not _DIGIT.search(text):
+            return None
+    try:
+        fraction = Fraction(text)
+    except ValueError:
+        return None
+    return fraction.numerator, fraction.denominator
+
+
+class IntAnswer:
+    """Odpowiedź porównywana z int(odpowiedź_użytkownika)."""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def matches(self, user_answer_str):
+        # Najczęstszy przypadek (same cyfry ASCII) bez wywoływania parse_int
+        if user_answer_str.__class__ is str and user_answer_str.isdigit() and user_answer_str.isascii():
+            return int(user_answer_str) == self.value
+        user_answer = parse_int(user_answer_str)
+        return user_answer is not None and user_answer == self.value
+
+
+class FloatAnswer:
+    """Odpowiedź zmiennoprzecinkowa porównywana z tolerancją."""
+
+    __slots__ = ('value', 'tolerance')
+
+    def __init__(self, value, tolerance=FLOAT_TOLERANCE):
+        self.value = value
+        self.tolerance = tolerance
+
+    def matches(self, user_answer_str):
+        user_answer = parse_float(user_answer_str)
+        return user_answer is not None and abs(user_answer - self.value) < self.tolerance
+
+
+class TextAnswer:
+    """Odpowiedź porównywana dosłownie z napisem."""
+
+    __slots__ = ('text',)
+
+    def __init__(self, text):
+        self.text = text
+
+    def matches(self, user_answer_str):
+        return user_answer_str == self.text
+
+
+class FractionAnswer:
+    """
+    Odpowiedź ułamkowa w postaci skróconej pary (licznik, mianownik); porównanie przez mnożenie na krzyż.
+    Błąd zamiany poprawnej odpowiedzi na ułamek jest zgłaszany dopiero przy sprawdzaniu
+    poprawnie zapisanej odpowiedzi użytkownika - w tej samej kolejności co przy Fraction(...) == Fraction(...).
+    """
+
+    __slots__ = ('numerator', 'denominator', 'error')
+
+    def __init__(self, correct_answer):
+        self.numerator = self.denominator = None
+        self.error = None
+        try:
+            fraction = Fraction(str(correct_answer))
+            self.numerator, self.denominator = fraction.numerator, fraction.denominator
+        except (ValueError, ZeroDivisionError) as e:
+            self.error = e
+
+    def matches(self, user_answer_str):
+        user_answer = parse_fraction(user_answer_str)
+        if user_answer is None:
+            return False
+        if self.error is not None:
+            raise self.error
+        return user_answer[0] * self.denominator == self.numerator * user_answer[1]
+
+
+def _compile_arithmetic(correct_answer):
+    if isinstance(correct_answer, float):
+        return FloatAnswer(correct_answer)
+    if isinstance(correct_answer, int):
+        return IntAnswer(correct_answer)
+    # Odpowiedź nieoczekiwanego typu porównujemy jako napis
+    return TextAnswer(str(correct_answer))
+
+
+def _cached(compile_answer):
+    """
+    Zwraca funkcję podającą matcher odpowiedzi z pamięci podręcznej (klucz: typ i wartość odpowiedzi,
+    bo np. 1 i 1.0 są porównywane inaczej). Po przekroczeniu MATCHER_CACHE_SIZE pamięć jest czyszczona;
+    odpowiedzi niehaszowalne (np. lista z JSON) są kompilowane za każdym razem.
+    """
+    matchers = {}
+
+    def matcher(correct_answer):
+        key = (correct_answer.__class__, correct_answer)
+        try:
+            return matchers[key]
+        except KeyError:
+            if len(matchers) >= MATCHER_CACHE_SIZE:
+                matchers.clear()
+            compiled = matchers[key] = compile_answer(correct_answer)
+            return compiled
+        except TypeError:
+            return compile_answer(correct_answer)
+
+    matcher.cache = matchers
+    return matcher
+
+
+# Matcher odpowiedzi całkowitej: int(odpowiedź_użytkownika) == correct_answer
+int_answer = _cached(IntAnswer)
+# Matcher odpowiedzi ułamkowej: Fraction(odpowiedź_użytkownika) == Fraction(str(correct_answer))
+fraction_answer = _cached(FractionAnswer)
+# Matcher według typu odpowiedzi: float z tolerancją, int albo napis
+arithmetic_answer = _cached(_compile_arithmetic)
@@ -0,0 +1,197 @@
+"""
+Wektorowe (NumPy) parsowanie odpowiedzi do oceniania wielu odpowiedzi naraz.
+
+Funkcje zwracają oprócz wartości maskę wpisów rozpoznanych na szybkiej ścieżce:
+prostych liczb zapisanych cyframi ASCII, dla których wynik jest identyczny z int()/Fraction().
+Pozostałe wpisy (np. "1_000", "0.5", liczby spoza zakresu 64 bitów) należy ocenić
+zwykłą metodą check_answer, aby wyniki zgadzały się ze ścieżką skalarną.
+"""
+
+# Limity cyfr gwarantujące brak przepełnienia int64 (także przy mnożeniu na krzyż ułamków)
+MAX_INT_DIGITS = 18
+MAX_FRACTION_DIGITS = 9
+
+# Stany automatu rozpoznającego napisy postaci "\s*[+-]?cyfry(/cyfry)?\s*"
+_LEADING, _SIGN, _NUMERATOR, _SLASH, _DENOMINATOR, _TRAILING, _INVALID = range(7)
+# Klasy znaków; kod 0 to dopełnienie krótszych napisów w tablicy NumPy
+_OTHER, _DIGIT, _SPACE, _SIGN_CHAR, _SLASH_CHAR, _PAD = range(6)
+
+_TRANSITIONS = {
+    _LEADING: {_SPACE: _LEADING, _SIGN_CHAR: _SIGN, _DIGIT: _NUMERATOR, _PAD: _TRAILING},
+    _SIGN: {_DIGIT: _NUMERATOR},
+    _NUMERATOR: {_DIGIT: _NUMERATOR, _SLASH_CHAR: _SLASH, _SPACE: _TRAILING, _PAD: _TRAILING},
+    _SLASH: {_DIGIT: _DENOMINATOR},
+    _DENOMINATOR: {_DIGIT: _DENOMINATOR, _SPACE: _TRAILING, _PAD: _TRAILING},
+    _TRAILING: {_SPACE: _TRAILING, _PAD: _TRAILING},
+}
+
+
+def _automaton(np, allow_denominator):
+    """Buduje tablicę klas znaków ASCII i spłaszczoną tablicę przejść (indeks: stan * 6 + klasa)."""
+    classes = np.full(129, _OTHER, dtype=np.int8)
+    classes[ord('0'):ord('9') + 1] = _DIGIT
+    classes[[9, 10, 11, 12, 13, ord(' ')]] = _SPACE
+    classes[[ord('+'), ord('-')]] = _SIGN_CHAR
+    classes[0] = _PAD
+    if allow_denominator:
+        classes[ord('/')] = _SLASH_CHAR
+    transitions = np.full((_INVALID + 1) * (_PAD + 1), _INVALID, dtype=np.int8)
+    for state, moves in _TRANSITIONS.items():
+        for char_class, next_state in moves.items():
+            transitions[state * (_PAD + 1) + char_class] = next_state
+    return classes, transitions
+
+
+def _as_text(np, values):
+    """
+    Zamienia kolekcję na tablicę napisów i maskę wpisów nadających się na szybką ścieżkę.
+    Wpisy niebędące napisami oraz napisy ze znakiem NUL (NumPy obcina go na końcu) są wyłączane.
+    """
+    if isinstance(values, np.ndarray) and values.dtype.kind == 'U':
+        return values.reshape(-1), np.ones(values.size, dtype=bool)
+    values = list(values)
+    if set(map(type, values)) <= {str} and '\x00' not in ''.join(values):
+        usable = np.ones(len(values), dtype=bool)
+    else:
+        usable = np.fromiter((type(v) is str and '\x00' not in v for v in values), dtype=bool, count=len(values))
+        values = [v if ok else "" for v, ok in zip(values, usable)]
+    return np.asarray(values, dtype=np.str_).reshape(len(values)), usable
+
+
+def _scan_numbers(np, text, allow_denominator, max_digits):
+    """
+    Rozpoznaje i oblicza liczby jednym przejściem po kolumnach znaków (kody UCS-4).
+    Zwraca krotkę (liczniki, mianowniki, maska) - mianownik 1, gdy napis nie zawiera '/'.
+    Akceptowane są tylko białe znaki ASCII, co pokrywa się z regułami int() i Fraction().
+    """
+    n = len(text)
+    classes, transitions = _automaton(np, allow_denominator)
+    codes = np.ascontiguousarray(text).view(np.uint32).reshape(n, -1)
+    state = np.full(n, _LEADING, dtype=np.int8)
+    negative = np.zeros(n, dtype=bool)
+    numerators = np.zeros(n, dtype=np.int64)
+    denominators = np.zeros(n, dtype=np.int64)
+    numerator_digits = np.zeros(n, dtype=np.int64)
+    denominator_digits = np.zeros(n, dtype=np.int64)
+
+    for column in codes.T:
+        negative |= (state == _LEADING) & (column == ord('-'))
+        state = np.take(transitions, state * (_PAD + 1) + np.take(classes, np.minimum(column, 128)))
+        digit = column.astype(np.int64) - ord('0')
+
+        in_numerator = state == _NUMERATOR
+        numerators = np.where(in_numerator, numerators * 10 + digit, numerators)
+        numerator_digits += in_numerator
+        if allow_denominator:
+            in_denominator = state == _DENOMINATOR
+            denominators = np.where(in_denominator, denominators * 10 + digit, denominators)
+            denominator_digits += in_denominator
+
+    ok = (state != _INVALID) & (state != _LEADING) & (state != _SIGN) & (state != _SLASH) \
+        & (numerator_digits > 0) & (numerator_digits <= max_digits) & (denominator_digits <= max_digits)
+    numerators = np.where(ok, np.where(negative, -numerators, numerators), 0)
+    denominators = np.where(ok & (denominator_digits > 0), denominators, 1)
+    return numerators, denominators, ok
+
+
+def parse_int_batch(answers):
+    """
+    Parsuje odpowiedzi jako liczby całkowite.
+    Zwraca krotkę (wartości: int64, maska_szybkiej_ścieżki: bool).
+    """
+    import numpy as np
+
+    text, usable = _as_text(np, answers)
+    values, _, ok = _scan_numbers(np, text, allow_denominator=False, max_digits=MAX_INT_DIGITS)
+    return values, ok & usable
+
+
+def parse_fraction_batch(answers):
+    """
+    Parsuje odpowiedzi postaci "licznik/mianownik" albo liczby całkowite.
+    Zwraca krotkę (liczniki: int64, mianowniki: int64, maska_szybkiej_ścieżki: bool).
+    Mianownik zero nie trafia na szybką ścieżkę (Fraction zgłasza wtedy wyjątek).
+    """
+    import numpy as np
+
+    text, usable = _as_text(np, answers)
+    numerators, denominators, ok = _scan_numbers(np, text, allow_denominator=True, max_digits=MAX_FRACTION_DIGITS)
+    return numerators, denominators, ok & usable & (denominators != 0)
+
+
+def _int_answers(np, correct_answers):
+    """
+    Zamienia poprawne odpowiedzi na tablicę int64.
+    Zwraca krotkę (wartości, maska) - maska wskazuje odpowiedzi typu int mieszczące się w 64 bitach.
+    """
+    if isinstance(correct_answers, np.ndarray) and correct_answers.dtype.kind in 'iu':
+        return correct_answers.astype(np.int64), np.ones(len(correct_answers), dtype=bool)
+    if all(type(answer) is int for answer in correct_answers):
+        try:
+            values = np.fromiter(correct_answers, dtype=np.int64, count=len(correct_answers))
+            return values, np.ones(len(correct_answers), dtype=bool)
+        except OverflowError:
+            pass
+    limit = 2 ** 63
+    values = np.zeros(len(correct_answers), dtype=np.int64)
+    mask = np.zeros(len(correct_answers), dtype=bool)
+    for i, answer in enumerate(correct_answers):
+        if isinstance(answer, int) and -limit < answer < limit:
+            values[i] = answer
+            mask[i] = True
+    return values, mask
+
+
+def _grade_with_fallback(fast_results, fast_mask, user_answers, correct_answers, check_answer):
+    """
+    Łączy wyniki szybkiej ścieżki z oceną skalarną (check_answer) dla pozostałych wpisów.
+    Zwraca listę wartości bool w kolejności odpowiedzi.
+    """
+    results = fast_results.tolist()
+    for i in (~fast_mask).nonzero()[0].tolist():
+        results[i] = check_answer(user_answers[i], correct_answers[i])
+    return results
+
+
+def _as_lists(user_answers, correct_answers):
+    # Tablice NumPy zostawiamy bez zmian - szybka ścieżka korzysta z nich bez konwersji
+    if not hasattr(user_answers, '__array__'):
+        user_answers = list(user_answers)
+    if not hasattr(correct_answers, '__array__'):
+        correct_answers = list(correct_answers)
+    if len(user_answers) != len(correct_answers):
+        raise ValueError("Liczba odpowiedzi użytkownika musi być równa liczbie poprawnych odpowiedzi.")
+    return user_answers, correct_answers
+
+
+def grade_int_batch(user_answers, correct_answers, check_answer):
+    """
+    Ocenia odpowiedzi całkowitoliczbowe: parsowanie i porównanie na tablicach int64.
+    check_answer: skalarna metoda quizu używana dla wpisów spoza szybkiej ścieżki.
+    """
+    import numpy as np
+
+    user_answers, correct_answers = _as_lists(user_answers, correct_answers)
+    user_values, parsed = parse_int_batch(user_answers)
+    correct_values, is_int = _int_answers(np, correct_answers)
+    fast = parsed & is_int
+    return _grade_with_fallback(user_values == correct_values, fast, user_answers, correct_answers, check_answer)
+
+
+def grade_fraction_batch(user_answers, correct_answers, check_answer):
+    """
+    Ocenia odpowiedzi ułamkowe: pary licznik/mianownik porównywane przez mnożenie na krzyż.
+    check_answer: skalarna metoda quizu używana dla wpisów spoza szybkiej ścieżki.
+    """
+    user_answers, correct_answers = _as_lists(user_answers, correct_answers)
+    # Ścieżka skalarna porównuje z Fraction(str(poprawna_odpowiedź))
+    if getattr(correct_answers, 'dtype', None) is not None and correct_answers.dtype.kind == 'U':
+        correct_text = correct_answers
+    else:
+        correct_text = [answer if type(answer) is str else str(answer) if type(answer) is int else None
+                        for answer in correct_answers]
+    user_numerators, user_denominators, user_parsed = parse_fraction_batch(user_answers)
+    correct_numerators, correct_denominators, correct_parsed = parse_fraction_batch(correct_text)
+    fast = user_parsed & correct_parsed
+    equal = user_numerators * correct_denominators == correct_numerators * user_denominators
+    return _grade_with_fallback(equal, fast, user_answers, correct_answers, check_answer)
@@ -0,0 +1,381 @@
+"""
+Testy wydajności głównych ścieżek aplikacji na danych syntetycznych.
+
+Pomiary (N - rozmiar danych z listy --rozmiary):
+  quiz_manager.init             - utworzenie QuizManager (wykrywanie quizów z zapamiętanym wynikiem)
+  quiz_registry.discover_cold   - wykrywanie klas quizów bez pamięci podręcznej
+  questions.load[N]             - QuizManager._load_quiz_questions dla N pytań
+  questions.sample[N]           - get_quiz_instance_and_questions (5 pytań z N)
+  questions.memory[N]           - pamięć zajęta przez N wczytanych pytań
+  check_answer[quiz]            - jedno sprawdzenie odpowiedzi w danym quizie
+  results.save[N]               - UserProgress.save_results (jeden wynik) do pliku z N wcześniejszymi wynikami
+  results.load[N]               - UserProgress.load_results dla N wyników
+  results.memory[N]             - pamięć zajęta przez N wyników z UserProgress.load_results
+  results.analyze[N]            - UserProgress.analyze_progress bez zapisanych agregatów
+  chart_render[N]               - ChartRenderer.render: wykres N wyników do pliku PNG bez ekranu
+Czasy w sekundach, a pomiary pamięci (nazwy z '.memory') w bajtach - mediana i minimum z kilku powtórzeń -
+są zapisywane do pliku JSON; podanie wzorca
+(wcześniej zapisanego pliku) zgłasza regresje - pomiary, których mediana wzrosła o więcej niż próg.
+
+Uruchomienie: python -m core.benchmarks [--rozmiary 1000 10000] [--powtorzenia 5] [--wynik plik.json]
+              [--wzorzec plik.json] [--prog 0.25] [--tylko fragment_nazwy]
+
+Domyślne rozmiary to 10^3-10^5. Pomiar dla 10^6 pytań i wyników trwa kilka minut, więc jest włączany
+jawnie: python -m core.benchmarks --rozmiary 1000 10000 100000 1000000 (albo --rozmiary 1000000).
+
+Wzorzec przechowywany w repozytorium: benchmarks/baseline.json (domyślne rozmiary i liczba powtórzeń),
+utworzony poleceniem python -m core.benchmarks --wynik benchmarks/baseline.json.
+W CI pomiary są porównywane z tym plikiem poleceniem python -m core.benchmarks --wzorzec benchmarks/baseline.json
+- kod wyjścia 1 oznacza regresję. Wzorzec należy odświeżyć tym samym poleceniem z --wynik po zamierzonej
+zmianie wydajności albo zmianie maszyny, na której działa CI.
+"""
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from core.result_writer import format_timestamp
+
+PROJECT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+QUIZ_DIR = os.path.join(PROJECT_DIR, "quizzes")
+RESULTS_VERSION = 1
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+DEFAULT_RUNS = 5
+DEFAULT_THRESHOLD = 0.25
+# Liczba wywołań w jednym pomiarze bardzo krótkich operacji (wynik jest dzielony przez tę liczbę)
+CHECK_ANSWER_CALLS = 2_000
+SAVE_RESULTS_CALLS = 200
+ARITHMETIC_QUIZ = "Podstawowa Arytmetyka"
+FRACTIONS_QUIZ = "Ułamki"
+POWERS_QUIZ = "Potęgi"
+
+
+def generate_questions(count, seed=0):
+    """Zwraca słownik {nazwa_quizu: pytania} z count pytaniami rozdzielonymi między trzy quizy."""
+    rng = random.Random(seed)
+    questions = {ARITHMETIC_QUIZ: [], FRACTIONS_QUIZ: [], POWERS_QUIZ: []}
+    for i in range(count):
+        kind = i % 3
+        a, b = rng.randint(1, 99), rng.randint(1, 99)
+        if kind == 0:
+            questions[ARITHMETIC_QUIZ].append({"question": f"Ile to {a} + {b}?", "answer": a + b})
+        elif kind == 1:
+            questions[FRACTIONS_QUIZ].append({"question": f"Ile to 1/{a} + 1/{b}?", "answer": f"{a + b}/{a * b}"})
+        else:
+            exponent = b % 5
+            questions[POWERS_QUIZ].append({"question": f"Ile to {a}^{exponent}?", "answer": a ** exponent})
+    return questions
+
+
+def generate_answers(quiz_name, count, seed=0):
+    """Zwraca listę par (odpowiedź_użytkownika, poprawna_odpowiedź); co czwarta odpowiedź jest błędna."""
+    rng = random.Random(seed)
+    answers = []
+    for i in range(count):
+        a, b = rng.randint(1, 99), rng.randint(1, 99)
+        if quiz_name == FRACTIONS_QUIZ:
+            correct = f"{a}/{b}"
+            user_answer = f"{2 * a}/{2 * b}"
+        else:
+            correct = a * b
+            user_answer = str(correct)
+        answers.append(("x" if i % 4 == 3 else user_answer, correct))
+    return answers
+
+
+def generate_results_file(path, count, seed=0, start=1_600_000_000):
+    """Zapisuje plik wyników CSV z count wynikami trzech quizów w kolejnych minutach od start."""
+    rng = random.Random(seed)
+    quizzes = (ARITHMETIC_QUIZ, FRACTIONS_QUIZ, POWERS_QUIZ)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Timestamp', 'Quiz', 'Score', 'TotalQuestions'])
+        for i in range(count):
+            writer.writerow([format_timestamp(start + 60 * i), quizzes[i % 3], rng.randint(0, 5), 5])
+
+
+def time_call(function, number=1):
+    """Zwraca średni czas (sekundy) jednego z number wywołań function."""
+    start = time.perf_counter()
+    for _ in range(number):
+        function()
+    return (time.perf_counter() - start) / number
+
+
+def memory_call(function):
+    """Zwraca liczbę bajtów zaalokowanych przez function i nadal zajętych przez zwrócony wynik (tracemalloc)."""
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = function()
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    return size
+
+
+def is_memory_benchmark(name):
+    """Sprawdza, czy pomiar o podanej nazwie mierzy pamięć (wynik w bajtach) zamiast czasu."""
+    return ".memory[" in name
+
+
+class BenchmarkSuite:
+    """
+    Zestaw pomiarów w katalogu roboczym z danymi syntetycznymi.
+    Każdy pomiar to funkcja bez argumentów zwracająca zmierzoną wartość: czas w sekundach albo,
+    dla pomiarów pamięci (nazwy z '.memory'), liczbę bajtów (przygotowanie danych nie jest mierzone).
+    """
+
+    def __init__(self, workdir, sizes=DEFAULT_SIZES):
+        self.workdir = workdir
+        self.sizes = tuple(sizes)
+        # Dane wczytane raz dla kolejnych powtórzeń pomiarów tego samego rozmiaru
+        self._managers = {}
+        self._columns = {}
+
+    def _path(self, name):
+        return os.path.join(self.workdir, name)
+
+    def _questions_file(self, size):
+        path = self._path(f"questions_{size}.json")
+        if not os.path.exists(path):
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(generate_questions(size), f, ensure_ascii=False)
+        return path
+
+    def _results_file(self, size):
+        path = self._path(f"results_{size}.csv")
+        if not os.path.exists(path):
+            generate_results_file(path, size)
+        return path
+
+    def _quiz_manager(self, size=None):
+        from core.quiz_manager import QuizManager
+
+        data_file = self._questions_file(size) if size else os.path.join(QUIZ_DIR, "quiz_data.json")
+        with contextlib.redirect_stdout(io.StringIO()):
+            return QuizManager(quiz_data_file=data_file)
+
+    def benchmarks(self):
+        """Zwraca listę par (nazwa_pomiaru, funkcja_pomiaru)."""
+        benchmarks = [
+            ("quiz_manager.init", lambda: time_call(self._quiz_manager)),
+            ("quiz_registry.discover_cold", self._discover_cold),
+        ]
+        for size in self.sizes:
+            benchmarks.append((f"questions.load[{size}]", lambda size=size: self._load_questions(size)))
+            benchmarks.append((f"questions.sample[{size}]", lambda size=size: self._sample_questions(size)))
+            benchmarks.append((f"questions.memory[{size}]", lambda size=size: self._questions_memory(size)))
+        for quiz_name in (ARITHMETIC_QUIZ, FRACTIONS_QUIZ, POWERS_QUIZ):
+            benchmarks.append((f"check_answer[{quiz_name}]",
+                               lambda quiz_name=quiz_name: self._check_answer(quiz_name)))
+        for size in self.sizes:
+            benchmarks.append((f"results.save[{size}]", lambda size=size: self._save_results(size)))
+            benchmarks.append((f"results.load[{size}]", lambda size=size: self._load_results(size)))
+            benchmarks.append((f"results.memory[{size}]", lambda size=size: self._results_memory(size)))
+            benchmarks.append((f"results.analyze[{size}]", lambda size=size: self._analyze_progress(size)))
+            benchmarks.append((f"chart_render[{size}]", lambda size=size: self._render_chart(size)))
+        return benchmarks
+
+    def _discover_cold(self):
+        from core.quiz_registry import QuizRegistry
+
+        quiz_dir = self._path("quizzes")
+        shutil.rmtree(quiz_dir, ignore_errors=True)
+        shutil.copytree(QUIZ_DIR, quiz_dir, ignore=shutil.ignore_patterns("__pycache__", "*.json"))
+        registry = QuizRegistry(quiz_dir)
+        with contextlib.redirect_stdout(io.StringIO()):
+            return time_call(registry.discover)
+
+    def _sized_quiz_manager(self, size):
+        if size not in self._managers:
+            self._managers[size] = self._quiz_manager(size)
+        return self._managers[size]
+
+    def _load_questions(self, size):
+        return time_call(self._sized_quiz_manager(size)._load_quiz_questions)
+
+    def _sample_questions(self, size):
+        quiz_manager = self._sized_quiz_manager(size)
+        return time_call(lambda: quiz_manager.get_quiz_instance_and_questions(ARITHMETIC_QUIZ, 5), number=100)
+
+    def _questions_memory(self, size):
+        return memory_call(self._sized_quiz_manager(size)._load_quiz_questions)
+
+    def _check_answer(self, quiz_name):
+        quiz_instance = self._quiz_manager().available_quizzes[quiz_name]()
+        answers = generate_answers(quiz_name, CHECK_ANSWER_CALLS)
+        check_answer = quiz_instance.check_answer
+        start = time.perf_counter()
+        for user_answer, correct_answer in answers:
+            check_answer(user_answer, correct_answer)
+        return (time.perf_counter() - start) / len(answers)
+
+    def _user_progress(self, data_file):
+        from core.user_progress import UserProgress
+
+        aggregates_file = os.path.splitext(data_file)[0] + "_aggregates.json"
+        if os.path.exists(aggregates_file):
+            os.remove(aggregates_file)
+        return UserProgress(data_file=data_file)
+
+    def _save_results(self, size):
+        # Każdy pomiar dopisuje do świeżej kopii pliku z size wynikami
+        data_file = self._path(f"save_results_{size}.csv")
+        shutil.copyfile(self._results_file(size), data_file)
+        user_progress = self._user_progress(data_file)
+        save = lambda: user_progress.save_results(ARITHMETIC_QUIZ, 3, 5)
+        with contextlib.redirect_stdout(io.StringIO()):
+            # Pierwszy zapis tworzy agregaty z istniejących wyników - mierzone są kolejne dopisania
+            save()
+            return time_call(save, number=SAVE_RESULTS_CALLS)
+
+    def _load_results(self, size):
+        user_progress = self._user_progress(self._results_file(size))
+        return time_call(user_progress.load_results)
+
+    def _results_memory(self, size):
+        user_progress = self._user_progress(self._results_file(size))
+        return memory_call(user_progress.load_results)
+
+    def _analyze_progress(self, size):
+        user_progress = self._user_progress(self._results_file(size))
+        with contextlib.redirect_stdout(io.StringIO()):
+            return time_call(user_progress.analyze_progress)
+
+    def _render_chart(self, size):
+        # Renderer rysuje na własnej figurze z płótnem Agg - bez pyplot i zmiany backendu całego procesu
+        from core.chart_renderer import ChartRenderer
+        from core.columnar_results import ColumnarResults, csv_to_columnar
+
+        if size not in self._columns:
+            directory = self._path(f"results_{size}_columns")
+            shutil.rmtree(directory, ignore_errors=True)
+            csv_to_columnar(self._results_file(size), directory)
+            self._columns[size] = ColumnarResults(directory).columns()
+        columns = self._columns[size]
+        renderer = ChartRenderer(self._path("charts"))
+        return time_call(lambda: renderer.render(columns['timestamps'], columns['scores'], columns['totals'],
+                                                 filename="plot.png"))
+
+    def run(self, runs=DEFAULT_RUNS, only=None, report=None):
+        """
+        Wykonuje pomiary runs razy i zwraca słownik {nazwa: {'median', 'min', 'runs'}}
+        (czasy w sekundach, pomiary pamięci w bajtach).
+        only: wykonuje tylko pomiary, których nazwa zawiera ten fragment
+        report: funkcja wywoływana z (nazwa, wynik) po każdym pomiarze
+        """
+        results = {}
+        for name, measure in self.benchmarks():
+            if only and only not in name:
+                continue
+            # Pierwsze wywołanie (importy, wczytanie danych, pamięci podręczne) nie jest liczone
+            measure()
+            times = [measure() for _ in range(runs)]
+            results[name] = {'median': statistics.median(times), 'min': min(times), 'runs': runs}
+            if report is not None:
+                report(name, results[name])
+        return results
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, runs=DEFAULT_RUNS, only=None, report=None):
+    """Wykonuje zestaw pomiarów w katalogu tymczasowym i zwraca dokument wyników (jak save_results)."""
+    workdir = tempfile.mkdtemp(prefix="math_trainer_bench_")
+    try:
+        results = BenchmarkSuite(workdir, sizes).run(runs, only, report)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return {'version': RESULTS_VERSION, 'python': platform.python_version(), 'platform': platform.platform(),
+            'sizes': list(sizes), 'results': results}
+
+
+def save_results(document, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, ensure_ascii=False, indent=2)
+
+
+def load_results(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        document = json.load(f)
+    if document.get('version') != RESULTS_VERSION:
+        raise ValueError(f"Nieobsługiwana wersja pliku wyników pomiarów: {document.get('version')}")
+    return document
+
+
+def compare_results(current, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Porównuje mediany pomiarów obecnych z wzorcem (dokumenty jak z run_benchmarks).
+    Zwraca listę regresji (nazwa, mediana_wzorca, mediana_obecna) - pomiarów wolniejszych
+    (lub zajmujących więcej pamięci) o ponad threshold (np. 0.25 = 25%). Pomiary nieobecne we wzorcu są pomijane.
+    """
+    regressions = []
+    for name, result in current['results'].items():
+        reference = baseline['results'].get(name)
+        if reference is not None and result['median'] > reference['median'] * (1 + threshold):
+            regressions.append((name, reference['median'], result['median']))
+    return regressions
+
+
+def _format_value(name, value):
+    if is_memory_benchmark(name):
+        return f"{value / 1024 ** 2:9.2f} MiB"
+    return _format_time(value)
+
+
+def _format_time(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:9.2f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:9.2f} ms"
+    return f"{seconds:9.2f} s "
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Testy wydajności Trenera Matematycznego na danych syntetycznych.")
+    parser.add_argument("--rozmiary", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="liczby pytań i wyników w pomiarach zależnych od rozmiaru danych")
+    parser.add_argument("--powtorzenia", type=int, default=DEFAULT_RUNS, help="liczba powtórzeń każdego pomiaru")
+    parser.add_argument("--tylko", help="wykonuje tylko pomiary, których nazwa zawiera ten fragment")
+    parser.add_argument("--wynik", help="plik JSON, do którego zapisać wyniki")
+    parser.add_argument("--wzorzec", help="plik JSON z wynikami wzorcowymi do porównania")
+    parser.add_argument("--prog", type=float, default=DEFAULT_THRESHOLD,
+                        help="dopuszczalny względny wzrost mediany względem wzorca (np. 0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    def report(name, result):
+        print(f"{name:45s} mediana {_format_value(name, result['median'])}   "
+              f"min {_format_value(name, result['min'])}")
+
+    document = run_benchmarks(args.rozmiary, args.powtorzenia, args.tylko, report)
+    if args.wynik:
+        save_results(document, args.wynik)
+        print(f"Wyniki zapisane do pliku: {args.wynik}")
+    if not args.wzorzec:
+        return 0
+
+    regressions = compare_results(document, load_results(args.wzorzec), args.prog)
+    if not regressions:
+        print(f"Brak regresji względem wzorca (próg {args.prog:.0%}).")
+        return 0
+    print(f"Regresje względem wzorca (próg {args.prog:.0%}):")
+    for name, reference, current in regressions:
+        print(f"  {name}: {_format_value(name, reference).strip()} -> {_format_value(name, current).strip()} "
+              f"({current / reference - 1:+.0%})")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""
+Renderowanie wykresów postępów bez ekranu (backend Agg), np. do raportów dla wielu quizów.
+
+Renderer korzysta bezpośrednio z matplotlib.figure.Figure i FigureCanvasAgg - nie używa pyplot,
+więc nie zależy od backendu interfejsu graficznego i nie otwiera okien. Jedna figura i jedne osie
+są czyszczone i używane ponownie dla kolejnych wykresów.
+"""
+import hashlib
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from core.progress_series import DEFAULT_MAX_POINTS, MARKER_LIMIT, prepare_series
+
+OVERALL_CHART = "postepy_ogolne.png"
+
+
+def chart_filename(quiz_name):
+    """Zwraca bezpieczną i jednoznaczną nazwę pliku wykresu quizu (None - wykres ogólny)."""
+    if quiz_name is None:
+        return OVERALL_CHART
+    slug = re.sub(r'[^\w-]+', '_', quiz_name).strip('_')[:60] or "quiz"
+    digest = hashlib.sha1(quiz_name.encode('utf-8')).hexdigest()[:8]
+    return f"postepy_{slug}_{digest}.png"
+
+
+class ChartRenderer:
+    """Renderuje wykresy postępów do plików PNG w podanym katalogu, używając jednej figury."""
+
+    def __init__(self, output_dir, figsize=(10, 6), dpi=100, bucket=None, max_points=DEFAULT_MAX_POINTS):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        self.output_dir = os.path.abspath(output_dir)
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.dpi = dpi
+        self.bucket = bucket
+        self.max_points = max_points
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(self.figure)
+        self.axes = self.figure.add_subplot()
+
+    def render(self, timestamps, scores, totals, quiz_name=None, filename=None):
+        """
+        Renderuje wykres jednej serii wyników (tablice jak w plot_progress_columns).
+        Zwraca ścieżkę zapisanego pliku albo None, gdy brak danych lub zapis się nie powiódł.
+        """
+        import numpy as np
+
+        if len(timestamps) == 0:
+            return None
+        dates, percentages, band = prepare_series(np.asarray(timestamps, dtype=np.int64), np.asarray(scores),
+                                              np.asarray(totals), self.bucket, self.max_points)
+        axes = self.axes
+        axes.clear()
+        axes.plot(dates, percentages, marker='o' if len(dates) <= MARKER_LIMIT else None, linestyle='-')
+        if band is not None:
+            axes.fill_between(dates, band[0], band[1], alpha=0.2)
+        axes.set_title(f'Postępy w quizie: {quiz_name}' if quiz_name else 'Ogólne postępy w quizach')
+        axes.set_xlabel('Data i czas')
+        axes.set_ylabel('Procent poprawnych odpowiedzi (%)')
+        axes.grid(True)
+        axes.tick_params(axis='x', labelrotation=45)
+        self.figure.tight_layout()
+
+        path = os.path.join(self.output_dir, filename or chart_filename(quiz_name))
+        try:
+            self.figure.savefig(path, dpi=self.dpi)
+        except Exception as e:
+            print(f"Błąd zapisu wykresu do pliku {path}: {e}")
+            return None
+        return path
+
+    def render_dataset(self, timestamps, quiz_ids, scores, totals, quiz_names):
+        """
+        Renderuje wykres ogólny i wykresy wszystkich quizów w jednym przebiegu.
+        quiz_ids: numery quizów (indeksy w quiz_names) dla kolejnych wyników
+        Zwraca słownik {nazwa_quizu albo None dla wykresu ogólnego: ścieżka}.
+        """
+        paths = {None: self.render(timestamps, scores, totals)}
+        for indices, quiz_name in zip(_group_indices(quiz_ids, len(quiz_names)), quiz_names):
+            if len(indices):
+                paths[quiz_name] = self.render(timestamps[indices], scores[indices], totals[indices], quiz_name)
+        return paths
+
+
+def _group_indices(quiz_ids, count):
+    """Dzieli indeksy wyników na grupy per quiz jednym sortowaniem (zachowując kolejność w grupie)."""
+    import numpy as np
+
+    quiz_ids = np.asarray(quiz_ids)
+    order = np.argsort(quiz_ids, kind='stable')
+    bounds = np.searchsorted(quiz_ids[order], np.arange(count + 1))
+    return [order[bounds[i]:bounds[i + 1]] for i in range(count)]
+
+
+# Renderer procesu roboczego (tworzony raz na proces i używany dla wszystkich jego zadań)
+_worker_renderer = None
+
+
+def _init_worker(output_dir, options):
+    global _worker_renderer
+    _worker_renderer = ChartRenderer(output_dir, **options)
+
+
+def _render_in_worker(task):
+    timestamps, scores, totals, quiz_name = task
+    return quiz_name, _worker_renderer.render(timestamps, scores, totals, quiz_name)
+
+
+def results_to_columns(results):
+    """
+    Zamienia listę wyników (rekordy lub słowniki, jak z UserProgress.load_results) na kolumny:
+    (znaczniki_czasu: int64 sekund, numery_quizów, wyniki, liczby_pytań, nazwy_quizów).
+    """
+    import numpy as np
+
+    quiz_names = list(dict.fromkeys(result['Quiz'] for result in results))
+    ids = {name: i for i, name in enumerate(quiz_names)}
+    count = len(results)
+    timestamps = np.array([result['Timestamp'] for result in results], dtype='datetime64[s]').astype(np.int64)
+    quiz_ids = np.fromiter((ids[result['Quiz']] for result in results), dtype=np.int64, count=count)
+    scores = np.fromiter((result['Score'] for result in results), dtype=np.int64, count=count)
+    totals = np.fromiter((result['TotalQuestions'] for result in results), dtype=np.int64, count=count)
+    return timestamps, quiz_ids, scores, totals, quiz_names
+
+
+def render_progress_charts(output_dir, timestamps, quiz_ids, scores, totals, quiz_names, workers=None, **options):
+    """
+    Renderuje wykres ogólny i wykresy wszystkich quizów do katalogu output_dir.
+    workers: liczba procesów roboczych (None lub 1 - renderowanie w bieżącym procesie)
+    options: parametry ChartRenderer (figsize, dpi, bucket, max_points)
+    Zwraca słownik {nazwa_quizu albo None dla wykresu ogólnego: ścieżka albo None}.
+    """
+    import numpy as np
+
+    timestamps, quiz_ids, scores, totals = (np.asarray(column) for column in (timestamps, quiz_ids, scores, totals))
+    if not workers or workers <= 1:
+        return ChartRenderer(output_dir, **options).render_dataset(timestamps, quiz_ids, scores, totals, quiz_names)
+
+    tasks = [(timestamps, scores, totals, None)]
+    for indices, quiz_name in zip(_group_indices(quiz_ids, len(quiz_names)), quiz_names):
+        if len(indices):
+            tasks.append((timestamps[indices], scores[indices], totals[indices], quiz_name))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(output_dir, options)) as executor:
+        return dict(executor.map(_render_in_worker, tasks))
@@ -0,0 +1,299 @@
+"""
+Kolumnowy, binarny format pliku wyników.
+
+Katalog wyników zawiera osobny plik dla każdej kolumny (tablice stałej szerokości, little-endian)
+oraz tablicę nazw quizów:
+  timestamps.i8 - znacznik czasu jako liczba sekund od 1970-01-01 00:00:00 czasu lokalnego
+                  (bez strefy czasowej, dokładnie tak, jak zapisuje go results.csv),
+  quiz_ids.i4   - numer quizu w tablicy nazw,
+  scores.i4     - liczba poprawnych odpowiedzi,
+  totals.i4     - liczba pytań,
+  quizzes.lst   - nazwy quizów, po jednej w linii, w kolejności pierwszego wystąpienia.
+
+Kolumny są odczytywane przez mapowanie pamięci (numpy.memmap), bez kopiowania i parsowania.
+Konwersja z/do CSV: python -m core.columnar_results do-kolumn|do-csv <źródło> <cel>
+"""
+import argparse
+import calendar
+import csv
+import os
+import time
+
+from core.progress_aggregates import empty_summary
+from core.result_records import ResultRecord
+from core.result_writer import BufferedResultWriter, TIMESTAMP_FORMAT, lock_file, unlock_file
+
+CSV_HEADER = ['Timestamp', 'Quiz', 'Score', 'TotalQuestions']
+
+
+def timestamp_to_epoch(timestamp):
+    """Zamienia znacznik czasu 'RRRR-MM-DD GG:MM:SS' na liczbę sekund (bez strefy czasowej)."""
+    if isinstance(timestamp, int):
+        return timestamp
+    return calendar.timegm(time.strptime(timestamp, TIMESTAMP_FORMAT))
+
+
+def epoch_to_timestamp(epoch):
+    """Odwrotność timestamp_to_epoch."""
+    return time.strftime(TIMESTAMP_FORMAT, time.gmtime(epoch))
+
+
+class ColumnarResults:
+    """Wyniki quizów w formacie kolumnowym (patrz opis modułu)."""
+
+    MANIFEST_FILE = "quizzes.lst"
+    LOCK_FILE = "lock"
+    # Nazwa kolumny -> (plik, typ NumPy)
+    COLUMNS = {
+        'timestamps': ("timestamps.i8", '<i8'),
+        'quiz_ids': ("quiz_ids.i4", '<i4'),
+        'scores': ("scores.i4", '<i4'),
+        'totals': ("totals.i4", '<i4'),
+    }
+
+    def __init__(self, directory):
+        self.directory = os.path.abspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self.manifest_file = os.path.join(self.directory, self.MANIFEST_FILE)
+
+    def _column_path(self, name):
+        return os.path.join(self.directory, self.COLUMNS[name][0])
+
+    def _item_size(self, name):
+        return int(self.COLUMNS[name][1][2:])
+
+    def __len__(self):
+        """Liczba pełnych wierszy (przerwany zapis może zostawić dłuższe kolumny - nadmiar jest pomijany)."""
+        lengths = []
+        for name in self.COLUMNS:
+            try:
+                lengths.append(os.path.getsize(self._column_path(name)) // self._item_size(name))
+            except FileNotFoundError:
+                return 0
+        return min(lengths)
+
+    def quiz_names(self):
+        """Zwraca tablicę nazw quizów (indeks na liście to numer quizu w kolumnie quiz_ids)."""
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                return f.read().splitlines()
+        except FileNotFoundError:
+            return []
+
+    def append(self, rows, sync=False):
+        """
+        Dopisuje wiersze [znacznik_czasu, quiz, wynik, liczba_pytań] pod blokadą katalogu.
+        sync: wymusza zapis na dysk (fsync) przed zwolnieniem blokady
+        """
+        import numpy as np
+
+        rows = list(rows)
+        with open(os.path.join(self.directory, self.LOCK_FILE), 'a+b') as lock:
+            lock_file(lock)
+            try:
+                names = self.quiz_names()
+                ids = {name: i for i, name in enumerate(names)}
+                new_names = []
+                quiz_ids = []
+                for _, quiz_name, _, _ in rows:
+                    if quiz_name not in ids:
+                        if not quiz_name or '\n' in quiz_name or '\r' in quiz_name:
+                            raise ValueError(f"Nieprawidłowa nazwa quizu: {quiz_name!r}")
+                        ids[quiz_name] = len(ids)
+                        new_names.append(quiz_name)
+                    quiz_ids.append(ids[quiz_name])
+
+                # Nowe nazwy trafiają do tablicy nazw przed wierszami, które się do nich odwołują
+                if new_names:
+                    with open(self.manifest_file, 'a', encoding='utf-8') as f:
+                        f.write("".join(name + "\n" for name in new_names))
+                        if sync:
+                            f.flush()
+                            os.fsync(f.fileno())
+
+                values = {
+                    'timestamps': [timestamp_to_epoch(row[0]) for row in rows],
+                    'quiz_ids': quiz_ids,
+                    'scores': [int(row[2]) for row in rows],
+                    'totals': [int(row[3]) for row in rows],
+                }
+                length = len(self)
+                for name, (_, dtype) in self.COLUMNS.items():
+                    with open(self._column_path(name), 'ab') as f:
+                        # Obcięcie pozostałości po przerwanym zapisie, aby kolumny były wyrównane
+                        f.truncate(length * self._item_size(name))
+                        f.write(np.asarray(values[name], dtype=dtype).tobytes())
+                        if sync:
+                            f.flush()
+                            os.fsync(f.fileno())
+            finally:
+                unlock_file(lock)
+
+    def columns(self):
+        """
+        Zwraca słownik {nazwa_kolumny: tablica NumPy} z kolumnami zmapowanymi w pamięci (tylko do odczytu).
+        """
+        import numpy as np
+
+        length = len(self)
+        columns = {}
+        for name, (_, dtype) in self.COLUMNS.items():
+            if length == 0:
+                columns[name] = np.zeros(0, dtype=dtype)
+            else:
+                columns[name] = np.memmap(self._column_path(name), dtype=dtype, mode='r', shape=(length,))
+        return columns
+
+    def summaries(self):
+        """
+        Zwraca podsumowania per quiz w formacie ProgressAggregates (count, total_score, total_questions,
+        min_score, max_score, last_timestamp), obliczone wektorowo na kolumnach.
+        """
+        import numpy as np
+
+        names = self.quiz_names()
+        columns = self.columns()
+        quiz_ids = columns['quiz_ids']
+        count = np.bincount(quiz_ids, minlength=len(names))
+        total_score = np.bincount(quiz_ids, weights=columns['scores'], minlength=len(names))
+        total_questions = np.bincount(quiz_ids, weights=columns['totals'], minlength=len(names))
+        min_score = np.full(len(names), np.iinfo(np.int64).max, dtype=np.int64)
+        max_score = np.full(len(names), np.iinfo(np.int64).min, dtype=np.int64)
+        last = np.full(len(names), np.iinfo(np.int64).min, dtype=np.int64)
+        np.minimum.at(min_score, quiz_ids, columns['scores'])
+        np.maximum.at(max_score, quiz_ids, columns['scores'])
+        np.maximum.at(last, quiz_ids, columns['timestamps'])
+
+        summaries = {}
+        for i, name in enumerate(names):
+            if not count[i]:
+                continue
+            summaries[name] = empty_summary()
+            summaries[name].update(count=int(count[i]), total_score=int(total_score[i]),
+                                   total_questions=int(total_questions[i]), min_score=int(min_score[i]),
+                                   max_score=int(max_score[i]), last_timestamp=epoch_to_timestamp(int(last[i])))
+        return summaries
+
+    def to_results(self):
+        """Zwraca wyniki jako listę słowników w formacie UserProgress.load_results."""
+        import numpy as np
+
+        names = self.quiz_names()
+        columns = self.columns()
+        timestamps = np.datetime_as_string(columns['timestamps'].astype('datetime64[s]'))
+        return [{'Timestamp': timestamp.replace('T', ' '), 'Quiz': names[quiz_id], 'Score': score,
+                 'TotalQuestions': total}
+                for timestamp, quiz_id, score, total in zip(timestamps.tolist(), columns['quiz_ids'].tolist(),
+                                                            columns['scores'].tolist(), columns['totals'].tolist())]
+
+    def iter_records(self, quiz_name=None, since=None, until=None, newest_first=False, offset=0, chunk_size=4096):
+        """
+        Generator rekordów ResultRecord w kolejności zapisu (newest_first - od końca).
+        Filtry quizu i przedziału czasu [since, until) są liczone maskami na kolumnach,
+        a rekordy powstają porcjami po chunk_size wierszy.
+        offset: pomija tyle pierwszych wybranych wyników (np. już przetworzonych)
+        """
+        import numpy as np
+
+        columns = self.columns()
+        names = self.quiz_names()
+        length = len(columns['timestamps'])
+        mask = None
+        if quiz_name is not None:
+            if quiz_name not in names:
+                return
+            mask = columns['quiz_ids'] == names.index(quiz_name)
+        for bound, compare in ((since, np.greater_equal), (until, np.less)):
+            if bound is not None:
+                selected = compare(columns['timestamps'], timestamp_to_epoch(bound))
+                mask = selected if mask is None else mask & selected
+
+        if mask is None:
+            first, last = (0, length - offset) if newest_first else (offset, length)
+            starts = range(first, last, chunk_size)
+            chunks = (slice(start, min(start + chunk_size, last))
+                      for start in (reversed(starts) if newest_first else starts))
+        else:
+            indices = np.flatnonzero(mask)
+            if newest_first:
+                indices = indices[::-1]
+            chunks = (indices[start:start + chunk_size] for start in range(offset, len(indices), chunk_size))
+
+        for chunk in chunks:
+            timestamps = np.datetime_as_string(columns['timestamps'][chunk].astype('datetime64[s]'))
+            records = [ResultRecord(timestamp.replace('T', ' '), names[quiz_id], score, total)
+                       for timestamp, quiz_id, score, total in zip(
+                           timestamps.tolist(), columns['quiz_ids'][chunk].tolist(),
+                           columns['scores'][chunk].tolist(), columns['totals'][chunk].tolist())]
+            if newest_first and isinstance(chunk, slice):
+                records.reverse()
+            yield from records
+
+
+class BufferedColumnarWriter(BufferedResultWriter):
+    """Zapis wyników z opóźnieniem (jak BufferedResultWriter) do magazynu kolumnowego."""
+
+    def __init__(self, store, flush_interval=1.0, flush_size=256):
+        self.store = store
+        super().__init__(store.directory, flush_interval, flush_size)
+
+    def _write_batch(self, rows, sync):
+        if rows:
+            self.store.append(rows, sync)
+
+
+def csv_to_columnar(csv_path, directory, chunk_size=65536):
+    """
+    Konwertuje plik wyników CSV do formatu kolumnowego (dopisując do istniejących wyników).
+    Wiersze z nieprawidłowymi danymi są pomijane, tak jak w UserProgress.load_results.
+    Zwraca liczbę przeniesionych wierszy.
+    """
+    store = ColumnarResults(directory)
+    converted = 0
+    chunk = []
+    with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        next(reader, None)  # Pominięcie nagłówka
+        for row in reader:
+            if len(row) != 4:
+                continue
+            try:
+                chunk.append([timestamp_to_epoch(row[0]), row[1], int(row[2]), int(row[3])])
+            except ValueError:
+                print(f"Ostrzeżenie: Nieprawidłowy format danych w wierszu CSV: {row}.")
+                continue
+            if len(chunk) >= chunk_size:
+                store.append(chunk)
+                converted += len(chunk)
+                chunk = []
+    if chunk:
+        store.append(chunk)
+        converted += len(chunk)
+    return converted
+
+
+def columnar_to_csv(directory, csv_path):
+    """Zapisuje wyniki z formatu kolumnowego do pliku CSV (z nagłówkiem). Zwraca liczbę wierszy."""
+    results = ColumnarResults(directory).to_results()
+    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADER)
+        writer.writerows([result[column] for column in CSV_HEADER] for result in results)
+    return len(results)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Konwersja pliku wyników między CSV a formatem kolumnowym.")
+    parser.add_argument("kierunek", choices=["do-kolumn", "do-csv"])
+    parser.add_argument("zrodlo", help="plik CSV albo katalog wyników kolumnowych")
+    parser.add_argument("cel", help="katalog wyników kolumnowych albo plik CSV")
+    args = parser.parse_args(argv)
+    if args.kierunek == "do-kolumn":
+        count = csv_to_columnar(args.zrodlo, args.cel)
+    else:
+        count = columnar_to_csv(args.zrodlo, args.cel)
+    print(f"Przeniesiono wierszy: {count}")
+
+
+if __name__ == "__main__":
+    main()
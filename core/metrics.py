@@ -0,0 +1,193 @@
+"""
+Lekka instrumentacja ścieżek krytycznych: liczniki i histogramy czasów wykonania.
+
+Instrumentacja jest domyślnie wyłączona. Funkcje oznaczone dekoratorem timed sprawdzają wtedy tylko
+jedną flagę i wywołują oryginalną funkcję; pomiar (perf_counter i zapis do histogramu) odbywa się
+wyłącznie po włączeniu przez enable().
+
+Histogramy mają stałe progi (LATENCY_BUCKETS, sekundy) i etykiety, np. quiz="Potęgi", dzięki czemu
+czasy są rozbite na poszczególne quizy. Migawkę metryk można zapisać w formacie tekstowym Prometheus
+(to_prometheus) albo jako JSON (snapshot, save).
+"""
+import bisect
+import functools
+import json
+import os
+import threading
+import time
+
+PREFIX = "math_trainer_"
+LATENCY_BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+# Wartość etykiety quizu, gdy operacja dotyczy wszystkich quizów
+ALL_QUIZZES = "*"
+
+enabled = False
+
+
+class Histogram:
+    """Histogram czasów o stałych progach (liczniki przedziałów, suma i liczba obserwacji)."""
+
+    __slots__ = ('counts', 'sum', 'count')
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """Zwraca listę par (próg, liczba obserwacji <= próg); ostatni próg to '+Inf'."""
+        total = 0
+        buckets = []
+        for bound, count in zip(LATENCY_BUCKETS + ("+Inf",), self.counts):
+            total += count
+            buckets.append((bound, total))
+        return buckets
+
+
+class MetricsRegistry:
+    """Liczniki i histogramy identyfikowane nazwą i etykietami (bezpieczne dla wątków)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+
+    def inc(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, seconds, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(seconds)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self):
+        """
+        Zwraca metryki jako słownik gotowy do zapisu w JSON:
+        {'counters': [{'name', 'labels', 'value'}], 'histograms': [{'name', 'labels', 'buckets', 'sum', 'count'}]}
+        """
+        with self._lock:
+            counters = [{'name': name, 'labels': dict(labels), 'value': value}
+                        for (name, labels), value in sorted(self._counters.items())]
+            histograms = [{'name': name, 'labels': dict(labels), 'buckets': histogram.cumulative(),
+                           'sum': histogram.sum, 'count': histogram.count}
+                          for (name, labels), histogram in sorted(self._histograms.items())]
+        return {'counters': counters, 'histograms': histograms}
+
+    def to_prometheus(self):
+        """Zwraca migawkę metryk w formacie tekstowym Prometheus."""
+        snapshot = self.snapshot()
+        lines = []
+        declared = set()
+        for counter in snapshot['counters']:
+            name = PREFIX + counter['name']
+            if name not in declared:
+                declared.add(name)
+                lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name}{_format_labels(counter['labels'])} {counter['value']}")
+        for histogram in snapshot['histograms']:
+            name = PREFIX + histogram['name']
+            if name not in declared:
+                declared.add(name)
+                lines.append(f"# TYPE {name} histogram")
+            labels = histogram['labels']
+            for bound, count in histogram['buckets']:
+                lines.append(f"{name}_bucket{_format_labels(dict(labels, le=str(bound)))} {count}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {histogram['sum']!r}")
+            lines.append(f"{name}_count{_format_labels(labels)} {histogram['count']}")
+        return "\n".join(lines) + "\n"
+
+    def save(self, path):
+        """
+        Zapisuje migawkę metryk atomowo: jako JSON dla plików .json, w pozostałych przypadkach
+        w formacie tekstowym Prometheus.
+        """
+        if path.endswith(".json"):
+            content = json.dumps(self.snapshot(), ensure_ascii=False, indent=2)
+        else:
+            content = self.to_prometheus()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(temp_path, path)
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+               for value in labels.values())
+    return "{" + ",".join(f'{name}="{value}"' for name, value in zip(labels, escaped)) + "}"
+
+
+REGISTRY = MetricsRegistry()
+
+
+def enable():
+    """Włącza zbieranie metryk."""
+    global enabled
+    enabled = True
+
+
+def disable():
+    """Wyłącza zbieranie metryk (zebrane wartości pozostają w REGISTRY)."""
+    global enabled
+    enabled = False
+
+
+def observe(name, seconds, **labels):
+    REGISTRY.observe(name, seconds, **labels)
+
+
+def inc(name, value=1, **labels):
+    REGISTRY.inc(name, value, **labels)
+
+
+def timed(name, quiz_arg=None):
+    """
+    Dekorator mierzący czas wywołań funkcji w histogramie name (przy włączonych metrykach).
+    quiz_arg: nazwa parametru funkcji z nazwą quizu, używanej jako etykieta quiz
+              (brak wartości - ALL_QUIZZES)
+    Wyjątki są liczone w liczniku <name bez _seconds>_errors_total.
+    """
+    errors_name = name[:-len("_seconds")] if name.endswith("_seconds") else name
+    errors_name += "_errors_total"
+
+    def decorator(function):
+        # Pozycja parametru z nazwą quizu wśród argumentów pozycyjnych (bez użycia inspect przy starcie)
+        quiz_index = function.__code__.co_varnames.index(quiz_arg) if quiz_arg else None
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return function(*args, **kwargs)
+            labels = {}
+            if quiz_index is not None:
+                quiz_name = args[quiz_index] if len(args) > quiz_index else kwargs.get(quiz_arg)
+                labels['quiz'] = ALL_QUIZZES if quiz_name is None else quiz_name
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            except Exception:
+                REGISTRY.inc(errors_name, **labels)
+                raise
+            finally:
+                REGISTRY.observe(name, time.perf_counter() - start, **labels)
+        return wrapper
+    return decorator
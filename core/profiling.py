@@ -0,0 +1,163 @@
+"""
+Profilowanie całej sesji aplikacji (cProfile i tracemalloc).
+
+SessionProfiler obejmuje wybrany fragment programu - w main.py cały tryb pracy: sesję konsolową,
+sesję ze skryptu odpowiedzi, serwer lub renderowanie wykresów - i po jego zakończeniu zapisuje
+do katalogu wynikowego:
+  session.pstats      - statystyki cProfile (python -m pstats, snakeviz itp.),
+  session.collapsed   - stosy wywołań w formacie "a;b;c wartość" (flamegraph.pl, speedscope),
+                        wartości to czas własny funkcji w mikrosekundach,
+  allocations.txt     - szczytowe zużycie pamięci i miejsca największych alokacji (tracemalloc).
+
+cProfile zapisuje tylko krawędzie wywołujący -> wywoływany, więc stosy w pliku .collapsed są
+odtwarzane z grafu wywołań: czas funkcji jest dzielony między wywołujących proporcjonalnie do czasu
+spędzonego w wywołaniach z każdego z nich. Profilowany jest tylko bieżący proces i wątek
+(bez procesów renderujących wykresy i wątków zapisujących wyniki w tle).
+"""
+import cProfile
+import linecache
+import os
+import pstats
+import tracemalloc
+
+PSTATS_FILE = "session.pstats"
+COLLAPSED_FILE = "session.collapsed"
+ALLOCATIONS_FILE = "allocations.txt"
+# Liczba ramek stosu zapamiętywanych przy każdej alokacji oraz liczba miejsc w raporcie alokacji
+TRACEMALLOC_FRAMES = 1
+TOP_ALLOCATIONS = 30
+# Gałęzie stosów krótsze niż ten czas (mikrosekundy) oraz głębsze niż limit nie są rozwijane
+MIN_STACK_MICROSECONDS = 1
+MAX_STACK_DEPTH = 200
+# Alokacje mechanizmu importu i samego tracemalloc nie są interesujące w raporcie
+IGNORED_ALLOCATIONS = ("<frozen importlib._bootstrap>", "<frozen importlib._bootstrap_external>", "<unknown>",
+                       tracemalloc.__file__)
+
+
+class SessionProfiler:
+    """
+    Menedżer kontekstu profilujący czas (cProfile) i pamięć (tracemalloc) objętego kodu.
+    Pliki wynikowe są zapisywane również wtedy, gdy profilowany kod zakończy się wyjątkiem.
+    """
+
+    def __init__(self, output_dir, top=TOP_ALLOCATIONS):
+        self.output_dir = output_dir
+        self.top = top
+        self.profile = None
+        self._owns_tracemalloc = False
+
+    def start(self):
+        # tracemalloc mógł już zostać włączony, np. przez python -X tracemalloc - wtedy go nie wyłączamy
+        self._owns_tracemalloc = not tracemalloc.is_tracing()
+        if self._owns_tracemalloc:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        tracemalloc.reset_peak()
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+
+    def stop(self):
+        """Kończy profilowanie i zapisuje pliki wynikowe; zwraca słownik {rodzaj: ścieżka}."""
+        self.profile.disable()
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        paths = {
+            'pstats': os.path.join(self.output_dir, PSTATS_FILE),
+            'collapsed': os.path.join(self.output_dir, COLLAPSED_FILE),
+            'allocations': os.path.join(self.output_dir, ALLOCATIONS_FILE),
+        }
+        stats = pstats.Stats(self.profile)
+        stats.dump_stats(paths['pstats'])
+        with open(paths['collapsed'], 'w', encoding='utf-8') as f:
+            for stack, microseconds in collapsed_stacks(stats.stats):
+                f.write(f"{stack} {microseconds}\n")
+        with open(paths['allocations'], 'w', encoding='utf-8') as f:
+            f.write(format_allocations(snapshot, current, peak, self.top))
+        return paths
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        paths = self.stop()
+        print(f"Profil sesji zapisany w katalogu {os.path.abspath(self.output_dir)}: "
+              f"{', '.join(os.path.basename(path) for path in paths.values())}")
+        return False
+
+
+def _frame_name(function):
+    filename, line, name = function
+    if filename == '~':
+        # Funkcje wbudowane, np. "<built-in method builtins.print>"
+        label = name
+    else:
+        label = f"{name} ({os.path.basename(filename)}:{line})"
+    # Średnik rozdziela ramki, a ostatnia spacja oddziela wartość w formacie collapsed
+    return label.replace(';', ',')
+
+
+def collapsed_stacks(stats):
+    """
+    Odtwarza stosy wywołań ze statystyk cProfile (słownik pstats.Stats.stats).
+    Zwraca listę par (stos "a;b;c", czas własny w mikrosekundach) posortowaną według stosu.
+    """
+    callees = {}
+    roots = []
+    for function, (_, _, _, _, callers) in stats.items():
+        if not callers:
+            roots.append(function)
+        for caller, edge in callers.items():
+            # edge = (wywołania pierwotne, wszystkie wywołania, czas własny, czas łączny) z tego wywołującego
+            callees.setdefault(caller, []).append((function, edge[3]))
+
+    folded = {}
+    # Stos roboczy: (funkcja, czas łączny na tej ścieżce, ścieżka nazw, funkcje na ścieżce)
+    pending = [(root, stats[root][3], (_frame_name(root),), frozenset((root,))) for root in roots]
+    while pending:
+        function, share, path, on_path = pending.pop()
+        _, _, own_time, total_time, _ = stats[function]
+        if total_time <= 0:
+            continue
+        scale = share / total_time
+        microseconds = round(own_time * scale * 1_000_000)
+        if microseconds > 0:
+            stack = ";".join(path)
+            folded[stack] = folded.get(stack, 0) + microseconds
+        if len(path) >= MAX_STACK_DEPTH:
+            continue
+        for callee, edge_time in callees.get(function, ()):
+            # Rekurencja jest już ujęta w czasie łącznym funkcji - nie rozwijamy jej ponownie
+            if callee in on_path:
+                continue
+            callee_share = edge_time * scale
+            if callee_share * 1_000_000 < MIN_STACK_MICROSECONDS:
+                continue
+            pending.append((callee, callee_share, path + (_frame_name(callee),), on_path | {callee}))
+    return sorted(folded.items())
+
+
+def format_allocations(snapshot, current, peak, top=TOP_ALLOCATIONS):
+    """Zwraca tekstowy raport zużycia pamięci i top największych miejsc alokacji z migawki tracemalloc."""
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, pattern) for pattern in IGNORED_ALLOCATIONS])
+    statistics = snapshot.statistics('lineno')
+    lines = [
+        f"Szczytowe zużycie pamięci: {peak / 1024:.1f} KiB",
+        f"Pamięć zaalokowana na końcu sesji: {current / 1024:.1f} KiB",
+        "",
+        f"Największe alokacje (na końcu sesji, top {top}):",
+    ]
+    for position, statistic in enumerate(statistics[:top], start=1):
+        frame = statistic.traceback[0]
+        lines.append(f"{position:3d}. {frame.filename}:{frame.lineno}: "
+                     f"{statistic.size / 1024:.1f} KiB w {statistic.count} blokach")
+        source = linecache.getline(frame.filename, frame.lineno).strip()
+        if source:
+            lines.append(f"       {source}")
+    if len(statistics) > top:
+        other = statistics[top:]
+        lines.append(f"Pozostałe miejsca ({len(other)}): {sum(s.size for s in other) / 1024:.1f} KiB")
+    return "\n".join(lines) + "\n"
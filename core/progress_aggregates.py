@@ -0,0 +1,138 @@
+import json
+import os
+import threading
+
+
+def file_signature(path):
+    """Zwraca sygnaturę pliku (rozmiar, mtime_ns) albo None, gdy plik nie istnieje."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def empty_summary():
+    """Zwraca podsumowanie quizu bez żadnych wyników."""
+    return {'count': 0, 'total_score': 0, 'total_questions': 0,
+            'min_score': None, 'max_score': None, 'last_timestamp': None}
+
+
+def _merge(summary, other):
+    """Dołącza podsumowanie other do summary (w miejscu)."""
+    summary['count'] += other['count']
+    summary['total_score'] += other['total_score']
+    summary['total_questions'] += other['total_questions']
+    for key, pick in (('min_score', min), ('max_score', max), ('last_timestamp', max)):
+        if other[key] is not None:
+            summary[key] = other[key] if summary[key] is None else pick(summary[key], other[key])
+
+
+class ProgressAggregates:
+    """
+    Zagregowane wyniki per quiz: liczba podejść, suma punktów i pytań, najlepszy i najgorszy wynik
+    oraz znacznik czasu ostatniego podejścia.
+
+    Agregaty są aktualizowane w O(1) przy każdym zapisanym wyniku i zapisywane do pliku JSON
+    obok pliku wyników razem z jego sygnaturą (rozmiar, mtime). Niezgodność sygnatury
+    oznacza, że plik wyników zmienił się poza tym obiektem i agregaty trzeba odbudować.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path):
+        self.path = path
+        self.quizzes = {}
+        # Sygnatura pliku wyników, której odpowiadają agregaty (None - nieznana/nieaktualna)
+        self.signature = None
+        self._lock = threading.RLock()
+
+    def add(self, quiz_name, score, total_questions, timestamp=None):
+        """Uwzględnia jeden wynik quizu."""
+        with self._lock:
+            summary = self.quizzes.get(quiz_name)
+            if summary is None:
+                summary = self.quizzes[quiz_name] = empty_summary()
+            _merge(summary, {'count': 1, 'total_score': score, 'total_questions': total_questions,
+                             'min_score': score, 'max_score': score, 'last_timestamp': timestamp})
+
+    def rebuild(self, results, signature):
+        """
+        Odbudowuje agregaty z wyników (słowniki jak z UserProgress.load_results albo rekordy
+        z UserProgress.iter_results) i zapisuje je.
+        """
+        with self._lock:
+            self.quizzes = {}
+            for result in results:
+                self.add(result['Quiz'], result['Score'], result['TotalQuestions'], result['Timestamp'])
+            self.signature = signature
+            self.save()
+
+    def load(self):
+        """Wczytuje agregaty z pliku JSON. Zwraca False, gdy pliku brak lub jest uszkodzony."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != self.VERSION:
+                return False
+            quizzes = data['quizzes']
+            signature = tuple(data['signature']) if data['signature'] is not None else None
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return False
+        with self._lock:
+            self.quizzes = quizzes
+            self.signature = signature
+        return True
+
+    def save(self):
+        """Zapisuje agregaty atomowo (plik tymczasowy + zamiana); bez ścieżki agregaty są tylko w pamięci."""
+        if self.path is None:
+            return
+        with self._lock:
+            data = {'version': self.VERSION, 'signature': self.signature, 'quizzes': self.quizzes}
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            try:
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False)
+                os.replace(temp_path, self.path)
+            except OSError as e:
+                print(f"Błąd zapisu agregatów postępów: {e}")
+
+    def is_current(self, signature):
+        return self.signature is not None and self.signature == signature
+
+    def record_append(self, rows, before, after):
+        """
+        Uwzględnia wiersze [znacznik_czasu, quiz, wynik, liczba_pytań] dopisane do pliku wyników.
+        before, after: sygnatury pliku przed i po dopisaniu (z result_writer.append_rows).
+        Jeśli przed dopisaniem plik nie odpowiadał agregatom, agregaty są oznaczane jako nieaktualne.
+        """
+        with self._lock:
+            if self.signature is None:
+                self.load()
+            if self.signature != before:
+                self.signature = None
+                return
+            for timestamp, quiz_name, score, total_questions in rows:
+                self.add(quiz_name, score, total_questions, timestamp)
+            self.signature = after
+            self.save()
+
+    def summary(self, quiz_name=None):
+        """
+        Zwraca podsumowanie wyników quizu albo wszystkich quizów łącznie (quiz_name=None).
+        Słownik z kluczami count, total_score, total_questions, min_score, max_score, last_timestamp.
+        """
+        with self._lock:
+            if quiz_name is not None:
+                summary = self.quizzes.get(quiz_name)
+                return dict(summary) if summary is not None else empty_summary()
+            total = empty_summary()
+            for summary in self.quizzes.values():
+                _merge(total, summary)
+            return total
+
+    def per_quiz(self):
+        """Zwraca słownik {nazwa_quizu: podsumowanie} w kolejności pierwszego wystąpienia quizu."""
+        with self._lock:
+            return {quiz_name: dict(summary) for quiz_name, summary in self.quizzes.items()}
@@ -0,0 +1,100 @@
+"""
+Przygotowanie serii wyników do wykresów na tablicach NumPy (bez zależności od matplotlib).
+NumPy jest importowany dopiero wewnątrz funkcji, więc import modułu nie wczytuje NumPy.
+"""
+
+# Domyślny limit punktów rysowanych na wykresie (dłuższe serie są próbkowane metodą LTTB)
+DEFAULT_MAX_POINTS = 2000
+# Powyżej tej liczby punktów linia jest rysowana bez znaczników
+MARKER_LIMIT = 500
+# Dostępne przedziały agregacji wyników w czasie
+BUCKETS = ("hour", "day", "week")
+
+
+def progress_series(timestamps, scores, totals):
+    """
+    Sortuje wyniki chronologicznie i oblicza procent poprawnych odpowiedzi (0 dla quizów bez pytań).
+    Zwraca krotkę (znaczniki_czasu: int64 sekund, procenty: float64).
+    """
+    import numpy as np
+
+    order = np.argsort(timestamps, kind='stable')
+    scores = scores[order]
+    totals = totals[order]
+    percentages = np.divide(scores * 100.0, totals, out=np.zeros(len(order)), where=totals > 0)
+    return timestamps[order], percentages
+
+
+def bucket_series(timestamps, percentages, bucket):
+    """
+    Agreguje posortowaną serię w przedziałach czasu.
+    Zwraca krotkę (początki_przedziałów, średnie, minima, maksima).
+    """
+    import numpy as np
+
+    if bucket == "hour":
+        keys = timestamps // 3600 * 3600
+    elif bucket == "day":
+        keys = timestamps // 86400 * 86400
+    elif bucket == "week":
+        # Tygodnie od poniedziałku (1970-01-01 był czwartkiem)
+        keys = (timestamps // 86400 + 3) // 7 * 7 * 86400 - 3 * 86400
+    else:
+        raise ValueError(f"Nieznany przedział agregacji: {bucket}. Dostępne: {', '.join(BUCKETS)}")
+
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    counts = np.diff(np.r_[starts, len(keys)])
+    means = np.add.reduceat(percentages, starts) / counts
+    return (keys[starts], means, np.minimum.reduceat(percentages, starts),
+            np.maximum.reduceat(percentages, starts))
+
+
+def lttb_indices(x, y, max_points):
+    """
+    Wybiera indeksy punktów metodą Largest-Triangle-Three-Buckets, zachowując kształt serii.
+    Pierwszy i ostatni punkt są zawsze zachowane.
+    """
+    import numpy as np
+
+    n = len(x)
+    if max_points is None or n <= max_points or max_points < 3:
+        return np.arange(n)
+
+    x = x.astype(np.float64)
+    y = y.astype(np.float64)
+    # Granice max_points - 2 przedziałów między pierwszym a ostatnim punktem
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    previous = 0
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        # Punkt odniesienia: średnia z następnego przedziału (albo ostatni punkt)
+        next_x = x[end:next_end].mean() if next_end > end else x[-1]
+        next_y = y[end:next_end].mean() if next_end > end else y[-1]
+        areas = np.abs((x[previous] - next_x) * (y[start:end] - y[previous])
+                       - (x[previous] - x[start:end]) * (next_y - y[previous]))
+        previous = start + int(np.argmax(areas))
+        selected[i + 1] = previous
+    return selected
+
+
+def prepare_series(timestamps, scores, totals, bucket=None, max_points=DEFAULT_MAX_POINTS):
+    """
+    Przygotowuje serię do narysowania: sortowanie, procenty, opcjonalna agregacja i próbkowanie LTTB.
+    Zwraca krotkę (daty: datetime64[s], procenty, pasmo) - pasmo to (minima, maksima) albo None.
+    """
+    timestamps, percentages = progress_series(timestamps, scores, totals)
+    band = None
+    if bucket is not None:
+        timestamps, percentages, low, high = bucket_series(timestamps, percentages, bucket)
+        band = (low, high)
+
+    selected = lttb_indices(timestamps, percentages, max_points)
+    if len(selected) < len(timestamps):
+        timestamps, percentages = timestamps[selected], percentages[selected]
+        if band is not None:
+            band = (band[0][selected], band[1][selected])
+    return timestamps.astype('datetime64[s]'), percentages, band
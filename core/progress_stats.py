@@ -0,0 +1,228 @@
+"""
+Statystyki kroczące wyników quizów liczone w jednym przejściu, w czasie O(1) na wynik.
+
+Okno obejmuje ostatnie `window` podejść i/lub podejścia z ostatnich `days` dni. Dla okna liczone są:
+  - średnia i wariancja procentu poprawnych odpowiedzi - algorytm Welforda z usuwaniem wartości
+    opuszczających okno,
+  - minimum i maksimum - kolejki monotoniczne (każdy wynik trafia do kolejki i opuszcza ją najwyżej raz),
+  - trend - nachylenie prostej regresji procentu względem numeru podejścia (punkty procentowe
+    na podejście), z kowariancji aktualizowanej tak samo jak wariancja.
+Serie (streaks) to kolejne podejścia z wynikiem co najmniej STREAK_THRESHOLD procent, liczone od początku historii.
+Podejścia do quizów bez pytań są liczone w 'count', ale nie wpływają na pozostałe statystyki.
+
+Stan statystyk (razem z pozycją w źródle wyników) jest zapisywany do pliku JSON, więc kolejne
+uruchomienia aplikacji czytają tylko wyniki dopisane od ostatniego zapisu.
+"""
+import json
+import os
+from collections import deque
+
+from core.columnar_results import timestamp_to_epoch
+
+DAY = 24 * 60 * 60
+DEFAULT_WINDOW = 20
+STREAK_THRESHOLD = 80.0
+
+
+class RollingStats:
+    """Statystyki kroczące jednej serii wyników (patrz opis modułu)."""
+
+    # Pola przechowywane jako kolejki (w JSON - listy list)
+    DEQUES = ('_items', '_max', '_min')
+
+    def __init__(self, window=DEFAULT_WINDOW, days=None, streak_threshold=STREAK_THRESHOLD):
+        if window is None and days is None:
+            raise ValueError("Okno statystyk wymaga liczby podejść (window) lub liczby dni (days).")
+        self.window = window
+        self.days = days
+        self.streak_threshold = streak_threshold
+        self.count = 0
+        self.current_streak = 0
+        self.best_streak = 0
+        self.last_timestamp = None
+        # Podejścia w oknie: (numer_podejścia, sekundy, procent)
+        self._items = deque()
+        self._attempts = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._mean_x = 0.0
+        self._m2_x = 0.0
+        self._cov = 0.0
+        # Kolejki monotoniczne (numer_podejścia, procent): malejąca dla maksimum, rosnąca dla minimum
+        self._max = deque()
+        self._min = deque()
+
+    def add(self, timestamp, score, total_questions):
+        """Uwzględnia jeden wynik (znacznik czasu jako napis 'RRRR-MM-DD GG:MM:SS')."""
+        self.count += 1
+        self.last_timestamp = timestamp
+        if total_questions <= 0:
+            return
+        percentage = score * 100.0 / total_questions
+        if percentage >= self.streak_threshold:
+            self.current_streak += 1
+            self.best_streak = max(self.best_streak, self.current_streak)
+        else:
+            self.current_streak = 0
+
+        index = self._attempts
+        self._attempts += 1
+        seconds = timestamp_to_epoch(timestamp) if self.days is not None else None
+        self._items.append((index, seconds, percentage))
+        n = len(self._items)
+        delta = percentage - self._mean
+        self._mean += delta / n
+        self._m2 += delta * (percentage - self._mean)
+        delta_x = index - self._mean_x
+        self._mean_x += delta_x / n
+        self._m2_x += delta_x * (index - self._mean_x)
+        self._cov += delta_x * (percentage - self._mean)
+
+        while self._max and self._max[-1][1] <= percentage:
+            self._max.pop()
+        self._max.append((index, percentage))
+        while self._min and self._min[-1][1] >= percentage:
+            self._min.pop()
+        self._min.append((index, percentage))
+
+        while self._items and self._expired(self._items[0], index, seconds):
+            self._remove()
+
+    def _expired(self, item, index, seconds):
+        if self.window is not None and index - item[0] >= self.window:
+            return True
+        return self.days is not None and item[1] <= seconds - self.days * DAY
+
+    def _remove(self):
+        index, _, percentage = self._items.popleft()
+        n = len(self._items)
+        if n == 0:
+            self._mean = self._m2 = self._mean_x = self._m2_x = self._cov = 0.0
+        else:
+            delta_y = percentage - self._mean
+            self._mean -= delta_y / n
+            self._m2 -= delta_y * (percentage - self._mean)
+            delta_x = index - self._mean_x
+            self._mean_x -= delta_x / n
+            self._m2_x -= delta_x * (index - self._mean_x)
+            self._cov -= (index - self._mean_x) * delta_y
+        if self._max[0][0] == index:
+            self._max.popleft()
+        if self._min[0][0] == index:
+            self._min.popleft()
+
+    def to_dict(self):
+        """Zwraca pełny stan statystyk jako słownik zapisywalny w JSON."""
+        return {name: [list(item) for item in value] if name in self.DEQUES else value
+                for name, value in vars(self).items()}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Odtwarza statystyki ze słownika zwróconego przez to_dict."""
+        stats = cls.__new__(cls)
+        for name, value in data.items():
+            setattr(stats, name, deque(map(tuple, value)) if name in cls.DEQUES else value)
+        return stats
+
+    def snapshot(self):
+        """
+        Zwraca słownik statystyk: count (wszystkie podejścia), window_count (podejścia w oknie),
+        mean, variance, stddev, min, max (procent poprawnych odpowiedzi w oknie), trend (punkty procentowe
+        na podejście), current_streak, best_streak, last_timestamp. Brakujące wartości to None.
+        """
+        n = len(self._items)
+        # Usuwanie wartości z sum Welforda może dać minimalnie ujemną wariancję przez zaokrąglenia
+        variance = max(self._m2 / n, 0.0) if n else None
+        return {
+            'count': self.count,
+            'window_count': n,
+            'mean': self._mean if n else None,
+            'variance': variance,
+            'stddev': variance ** 0.5 if n else None,
+            'min': self._min[0][1] if n else None,
+            'max': self._max[0][1] if n else None,
+            'trend': self._cov / self._m2_x if n > 1 and self._m2_x > 0 else None,
+            'current_streak': self.current_streak,
+            'best_streak': self.best_streak,
+            'last_timestamp': self.last_timestamp,
+        }
+
+
+class ProgressStats:
+    """
+    Statystyki kroczące wszystkich wyników łącznie i każdego quizu osobno.
+    position: miejsce w źródle wyników, do którego wyniki zostały uwzględnione (ustawiane przez UserProgress)
+    path: plik JSON, do którego save() zapisuje stan statystyk razem z pozycją (None - tylko w pamięci)
+    """
+
+    VERSION = 1
+
+    def __init__(self, window=DEFAULT_WINDOW, days=None, streak_threshold=STREAK_THRESHOLD, path=None):
+        self.options = {'window': window, 'days': days, 'streak_threshold': streak_threshold}
+        self.path = path
+        self.overall = RollingStats(**self.options)
+        self.quizzes = {}
+        self.position = None
+
+    def load(self):
+        """
+        Wczytuje stan statystyk z pliku JSON. Zwraca False, gdy pliku brak, jest uszkodzony
+        albo opisuje statystyki o innych parametrach okna.
+        """
+        if self.path is None:
+            return False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != self.VERSION or data['options'] != self.options:
+                return False
+            overall = RollingStats.from_dict(data['overall'])
+            quizzes = {quiz_name: RollingStats.from_dict(state) for quiz_name, state in data['quizzes'].items()}
+            position = data['position']
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return False
+        self.overall, self.quizzes = overall, quizzes
+        # Pozycja w pliku CSV to para (i-węzeł, przesunięcie), w JSON zapisana jako lista
+        self.position = tuple(position) if isinstance(position, list) else position
+        return True
+
+    def save(self):
+        """Zapisuje stan statystyk atomowo (plik tymczasowy + zamiana); bez ścieżki nic nie robi."""
+        if self.path is None:
+            return
+        data = {'version': self.VERSION, 'options': self.options, 'position': self.position,
+                'overall': self.overall.to_dict(),
+                'quizzes': {quiz_name: stats.to_dict() for quiz_name, stats in self.quizzes.items()}}
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"Błąd zapisu statystyk postępów: {e}")
+
+    def add(self, timestamp, quiz_name, score, total_questions):
+        self.overall.add(timestamp, score, total_questions)
+        stats = self.quizzes.get(quiz_name)
+        if stats is None:
+            stats = self.quizzes[quiz_name] = RollingStats(**self.options)
+        stats.add(timestamp, score, total_questions)
+
+    def add_records(self, records):
+        """Uwzględnia rekordy (timestamp, quiz, score, total_questions); zwraca ich liczbę."""
+        count = 0
+        for timestamp, quiz_name, score, total_questions in records:
+            self.add(timestamp, quiz_name, score, total_questions)
+            count += 1
+        return count
+
+    def snapshot(self, quiz_name=None):
+        """Zwraca statystyki jednego quizu albo wszystkich wyników łącznie (quiz_name=None)."""
+        if quiz_name is None:
+            return self.overall.snapshot()
+        stats = self.quizzes.get(quiz_name)
+        return (stats or RollingStats(**self.options)).snapshot()
+
+    def per_quiz(self):
+        """Zwraca słownik {nazwa_quizu: statystyki} w kolejności pierwszego wystąpienia quizu."""
+        return {quiz_name: stats.snapshot() for quiz_name, stats in self.quizzes.items()}
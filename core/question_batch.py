@@ -0,0 +1,45 @@
+from collections.abc import Sequence
+
+
+class QuestionBatch(Sequence):
+    """
+    Partia wygenerowanych pytań przechowywana kolumnowo (np. tablice NumPy operandów i wyników).
+
+    Treść pytania i odpowiedź są formatowane dopiero przy odczycie pojedynczego pytania,
+    więc wygenerowanie dużej partii kosztuje tylko operacje na tablicach liczb.
+    """
+
+    def __init__(self, columns, format_question, format_answer):
+        """
+        columns: słownik {nazwa_kolumny: tablica} o jednakowej długości
+        format_question: funkcja przyjmująca wiersz (słownik) i zwracająca treść pytania
+        format_answer: funkcja przyjmująca wiersz (słownik) i zwracająca odpowiedź w formacie quiz_data.json
+        """
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("Wszystkie kolumny partii pytań muszą mieć tę samą długość.")
+        self.columns = columns
+        self._length = lengths.pop() if lengths else 0
+        self._format_question = format_question
+        self._format_answer = format_answer
+
+    def __len__(self):
+        return self._length
+
+    def row(self, index):
+        """Zwraca wartości kolumn dla jednego pytania jako słownik liczb Pythona."""
+        return {name: column[index].item() for name, column in self.columns.items()}
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Indeks pytania poza zakresem partii.")
+        row = self.row(index)
+        return {"question": self._format_question(row), "answer": self._format_answer(row)}
+
+    def to_list(self):
+        """Zamienia całą partię na listę słowników pytań."""
+        return [self[i] for i in range(self._length)]
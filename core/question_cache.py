@@ -0,0 +1,134 @@
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+
+from core.question_list import QuestionList
+
+
+def estimate_questions_size(questions):
+    """Szacuje w bajtach pamięć zajmowaną przez listę pytań (lista, rekordy i ich wartości)."""
+    size = sys.getsizeof(questions)
+    if isinstance(questions, QuestionList):
+        # Pytania nie mają własnych słowników - liczą się tylko kolumny i wartości
+        return size + sum(map(sys.getsizeof, questions.texts)) + sum(map(sys.getsizeof, questions.answers))
+    for q in questions:
+        size += sys.getsizeof(q)
+        if isinstance(q, dict):
+            for value in q.values():
+                size += sys.getsizeof(value)
+    return size
+
+
+class LazyQuestionCache(Mapping):
+    """
+    Leniwy słownik {nazwa_quizu: [pytania]} nad magazynem pytań.
+
+    Nazwy quizów pochodzą z magazynu (np. z manifestu) i są zapamiętywane do zmiany sygnatury magazynu,
+    a pytania są wczytywane dopiero przy pierwszym odwołaniu do danego quizu. Wczytane zestawy trzymane są
+    w pamięci podręcznej LRU ograniczonej szacowanym rozmiarem w bajtach.
+
+    Operacje na pamięci podręcznej są chronione blokadą, więc wątek przeładowania (QuizReloader)
+    może unieważniać quizy równolegle z odczytami w wątkach obsługi; wczytywanie z magazynu odbywa się poza blokadą.
+    """
+
+    def __init__(self, question_store, max_bytes=64 * 1024 * 1024):
+        self.question_store = question_store
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # nazwa_quizu -> (pytania, rozmiar)
+        self.memory_usage = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._quiz_names = None  # (sygnatura magazynu, nazwy quizów, zbiór nazw)
+        self._lock = threading.Lock()
+
+    def __getitem__(self, quiz_name):
+        with self._lock:
+            entry = self._entries.get(quiz_name)
+            if entry is not None:
+                self.hits += 1
+                self._entries.move_to_end(quiz_name)
+                return entry[0]
+            self.misses += 1
+
+        questions = self.question_store.load_quiz(quiz_name)
+        if not questions and quiz_name not in self._names()[2]:
+            raise KeyError(quiz_name)
+        with self._lock:
+            self._store(quiz_name, questions)
+        return questions
+
+    def peek(self, quiz_name):
+        """
+        Zwraca pytania quizu z pamięci podręcznej albo None, gdy ich tam nie ma - bez wczytywania z magazynu,
+        liczenia trafień i zmiany kolejności LRU.
+        """
+        with self._lock:
+            entry = self._entries.get(quiz_name)
+        return entry[0] if entry is not None else None
+
+    def _names(self):
+        """
+        Zwraca zapamiętaną parę (nazwy quizów, zbiór nazw); magazyn jest pytany o listę quizów
+        tylko wtedy, gdy zmieniła się jego sygnatura (np. JsonQuestionStore wczytuje wtedy cały plik).
+        """
+        signature = self.question_store.signature()
+        if self._quiz_names is None or self._quiz_names[0] != signature:
+            names = self.question_store.list_quizzes()
+            self._quiz_names = (signature, names, frozenset(names))
+        return self._quiz_names
+
+    def __iter__(self):
+        return iter(self._names()[1])
+
+    def __len__(self):
+        return len(self._names()[1])
+
+    def __contains__(self, quiz_name):
+        return quiz_name in self._entries or quiz_name in self._names()[2]
+
+    def _store(self, quiz_name, questions):
+        # Quiz mógł zostać w międzyczasie wczytany przez inny wątek - jego rozmiar jest zastępowany
+        previous = self._entries.pop(quiz_name, None)
+        if previous is not None:
+            self.memory_usage -= previous[1]
+        size = estimate_questions_size(questions)
+        self._entries[quiz_name] = (questions, size)
+        self.memory_usage += size
+        self._evict()
+
+    def _evict(self):
+        # Ostatnio użyty zestaw zostaje nawet wtedy, gdy sam przekracza limit
+        while self.memory_usage > self.max_bytes and len(self._entries) > 1:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.memory_usage -= size
+            self.evictions += 1
+
+    def add_question(self, quiz_name, question):
+        """Uwzględnia pytanie już zapisane w magazynie, jeśli jego quiz jest w pamięci podręcznej."""
+        with self._lock:
+            entry = self._entries.get(quiz_name)
+            if entry is None:
+                return
+            questions, size = entry
+            questions.append(question)
+            added = estimate_questions_size(type(questions)([question])) - sys.getsizeof(type(questions)())
+            self._entries[quiz_name] = (questions, size + added)
+            self.memory_usage += added
+            self._evict()
+
+    def invalidate(self, quiz_name=None):
+        """Usuwa z pamięci podręcznej jeden quiz albo wszystkie quizy."""
+        with self._lock:
+            if quiz_name is None:
+                self._entries.clear()
+                self.memory_usage = 0
+            elif quiz_name in self._entries:
+                _, size = self._entries.pop(quiz_name)
+                self.memory_usage -= size
+
+    def cached_quizzes(self):
+        """Zwraca nazwy quizów aktualnie trzymanych w pamięci (od najdawniej użytego)."""
+        with self._lock:
+            return list(self._entries.keys())
@@ -0,0 +1,57 @@
+from collections.abc import Sequence
+
+
+class QuestionList(Sequence):
+    """
+    Lista pytań quizu przechowywana kolumnowo: treści pytań i odpowiedzi w dwóch równoległych listach.
+
+    Zamiast słownika {'question': ..., 'answer': ...} z powtarzanymi kluczami na każde pytanie
+    trzymane są tylko dwa wskaźniki. Odczyt pojedynczego pytania (indeks, wycinek, iteracja)
+    zwraca nowy słownik w dotychczasowym formacie, więc kod operujący na słownikach pytań działa bez zmian;
+    zmiana zwróconego słownika nie zmienia jednak listy. Porównanie ze zwykłą listą słowników
+    porównuje kolejne pytania.
+    """
+
+    __slots__ = ('texts', 'answers')
+
+    def __init__(self, questions=()):
+        """questions: iterowalna kolekcja słowników pytań (już sprawdzonych przez validate_questions)"""
+        self.texts = []
+        self.answers = []
+        self.extend(questions)
+
+    def __len__(self):
+        return len(self.texts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [{"question": text, "answer": answer}
+                    for text, answer in zip(self.texts[index], self.answers[index])]
+        return {"question": self.texts[index], "answer": self.answers[index]}
+
+    def __iter__(self):
+        for text, answer in zip(self.texts, self.answers):
+            yield {"question": text, "answer": answer}
+
+    def __eq__(self, other):
+        if isinstance(other, QuestionList):
+            return self.texts == other.texts and self.answers == other.answers
+        if isinstance(other, list):
+            return len(other) == len(self) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"QuestionList({list(self)!r})"
+
+    def __sizeof__(self):
+        return object.__sizeof__(self) + self.texts.__sizeof__() + self.answers.__sizeof__()
+
+    def append(self, question):
+        self.texts.append(question['question'])
+        self.answers.append(question['answer'])
+
+    def extend(self, questions):
+        for question in questions:
+            self.append(question)
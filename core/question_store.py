@@ -0,0 +1,274 @@
+import json
+import os
+import hashlib
+import struct
+import sys
+from array import array
+
+from core.progress_aggregates import file_signature
+from core.question_list import QuestionList
+from core.sampling import make_rng, sample_indices
+
+
+def is_valid_question(question):
+    """Sprawdza, czy rekord pytania ma wymagany format {'question': ..., 'answer': ...}."""
+    return isinstance(question, dict) and 'question' in question and 'answer' in question
+
+
+def validate_questions(quiz_name, questions):
+    """
+    Sprawdza format pytań raz, przy wczytywaniu ich do magazynu lub pamięci.
+    Zwraca listę poprawnych pytań; nieprawidłowe wpisy są pomijane z ostrzeżeniem.
+    """
+    if not isinstance(questions, list):
+        raise TypeError(f"Oczekiwano listy pytań dla quizu '{quiz_name}', otrzymano {type(questions)}")
+    if all(is_valid_question(q) for q in questions):
+        return questions
+    valid = []
+    for q in questions:
+        if is_valid_question(q):
+            valid.append(q)
+        else:
+            print(f"Ostrzeżenie: Nieprawidłowy format pytania w quiz_data.json dla quizu '{quiz_name}': {q}")
+    return valid
+
+
+class JsonQuestionStore:
+    """
+    Magazyn pytań w jednym pliku JSON (dotychczasowy format quiz_data.json).
+    Każdy zapis przepisuje cały plik, więc nadaje się tylko do małych zbiorów pytań.
+    """
+
+    def __init__(self, data_file):
+        self.data_file = data_file
+
+    @property
+    def location(self):
+        return self.data_file
+
+    def signature(self):
+        """Zwraca sygnaturę pliku pytań; jej zmiana oznacza, że plik został zmodyfikowany."""
+        return file_signature(self.data_file)
+
+    def _read(self):
+        with open(self.data_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def load_all(self):
+        """Wczytuje pytania wszystkich quizów jako słownik {nazwa_quizu: [pytania]}."""
+        data = {}
+        for quiz_name, questions in self._read().items():
+            try:
+                data[sys.intern(quiz_name)] = QuestionList(validate_questions(quiz_name, questions))
+            except TypeError as e:
+                print(f"Ostrzeżenie: {e}. Quiz zostaje pominięty.")
+        return data
+
+    def load_quiz(self, quiz_name):
+        """Wczytuje pytania jednego quizu (format JSON wymaga sparsowania całego pliku)."""
+        return QuestionList(validate_questions(quiz_name, self._read().get(quiz_name, [])))
+
+    def sample(self, quiz_name, k, seed=None):
+        """Losuje k pytań quizu (dla pliku JSON wymaga wczytania całego quizu)."""
+        questions = self.load_quiz(quiz_name)
+        return [questions[i] for i in sample_indices(len(questions), k, seed)]
+
+    def list_quizzes(self):
+        """Zwraca nazwy quizów zapisanych w pliku."""
+        return list(self._read().keys())
+
+    def append(self, quiz_name, question_text, correct_answer):
+        """Dopisuje pytanie do quizu, przepisując cały plik JSON. Zwraca zapisany rekord."""
+        data = {}
+
+        if os.path.exists(self.data_file):
+            with open(self.data_file, 'r', encoding='utf-8') as file:
+                try:
+                    data = json.load(file)
+                except json.JSONDecodeError:
+                    print("⚠️ Plik JSON był pusty lub uszkodzony. Tworzę nowy.")
+
+        if quiz_name not in data:
+            data[quiz_name] = []
+
+        new_question = {
+            "question": question_text,
+            "answer": correct_answer
+        }
+        data[quiz_name].append(new_question)
+
+        with open(self.data_file, 'w', encoding='utf-8') as file:
+            json.dump(data, file, ensure_ascii=False, indent=4)
+
+        return new_question
+
+
+class LogQuestionStore:
+    """
+    Magazyn pytań oparty na dzienniku tylko do dopisywania.
+
+    Struktura katalogu:
+      questions.log  - rekordy pytań, jeden obiekt JSON na linię,
+      quizzes.lst    - manifest z nazwami quizów w kolejności ich utworzenia,
+      index/*.idx    - dla każdego quizu nagłówek i lista 8-bajtowych przesunięć rekordów w dzienniku.
+
+    Dopisanie pytania to stała liczba operacji niezależnie od rozmiaru magazynu,
+    a wczytanie jednego quizu czyta tylko jego rekordy.
+    """
+
+    LOG_FILE = "questions.log"
+    MANIFEST_FILE = "quizzes.lst"
+    INDEX_DIR = "index"
+    INDEX_MAGIC = b"MTQI\x01"
+    OFFSET_FORMAT = "<Q"
+    OFFSET_SIZE = struct.calcsize(OFFSET_FORMAT)
+
+    def __init__(self, directory):
+        self.directory = os.path.abspath(directory)
+        self.log_file = os.path.join(self.directory, self.LOG_FILE)
+        self.manifest_file = os.path.join(self.directory, self.MANIFEST_FILE)
+        self.index_dir = os.path.join(self.directory, self.INDEX_DIR)
+        os.makedirs(self.index_dir, exist_ok=True)
+
+    @property
+    def location(self):
+        return self.directory
+
+    def signature(self):
+        """Zwraca sygnaturę dziennika i manifestu; każde dopisanie pytania ją zmienia."""
+        return file_signature(self.log_file), file_signature(self.manifest_file)
+
+    def _index_path(self, quiz_name):
+        digest = hashlib.sha1(quiz_name.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.index_dir, f"{digest}.idx")
+
+    def _read_offsets(self, quiz_name):
+        """Wczytuje tablicę przesunięć rekordów quizu z jego indeksu."""
+        offsets = array('Q')
+        try:
+            with open(self._index_path(quiz_name), 'rb') as f:
+                if f.read(len(self.INDEX_MAGIC)) != self.INDEX_MAGIC:
+                    raise ValueError(f"Nieprawidłowy nagłówek indeksu quizu '{quiz_name}'.")
+                data = f.read()
+        except FileNotFoundError:
+            return offsets
+        # Pomijamy ewentualny niepełny wpis pozostały po przerwanym zapisie
+        usable = len(data) - len(data) % self.OFFSET_SIZE
+        offsets.frombytes(data[:usable])
+        if array('Q', [1]).tobytes() != struct.pack(self.OFFSET_FORMAT, 1):
+            offsets.byteswap()
+        return offsets
+
+    def _read_records(self, offsets):
+        records = QuestionList()
+        if not offsets:
+            return records
+        with open(self.log_file, 'rb') as log:
+            for offset in offsets:
+                log.seek(offset)
+                records.append(json.loads(log.readline()))
+        return records
+
+    def list_quizzes(self):
+        """Zwraca nazwy quizów z manifestu, bez czytania dziennika pytań."""
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                return [sys.intern(line.rstrip('\n')) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+
+    def count(self, quiz_name):
+        """Zwraca liczbę pytań quizu na podstawie rozmiaru jego indeksu."""
+        try:
+            size = os.path.getsize(self._index_path(quiz_name))
+        except FileNotFoundError:
+            return 0
+        return max(0, size - len(self.INDEX_MAGIC)) // self.OFFSET_SIZE
+
+    def load_quiz(self, quiz_name):
+        """Wczytuje pytania jednego quizu, dekodując tylko jego rekordy."""
+        return self._read_records(self._read_offsets(quiz_name))
+
+    def load_all(self):
+        """Wczytuje pytania wszystkich quizów jako słownik {nazwa_quizu: [pytania]}."""
+        return {quiz_name: self.load_quiz(quiz_name) for quiz_name in self.list_quizzes()}
+
+    def sample(self, quiz_name, k, seed=None):
+        """
+        Losuje k pytań quizu bezpośrednio z indeksu na dysku.
+        Czytane są tylko wylosowane wpisy indeksu i odpowiadające im rekordy dziennika.
+        """
+        count = self.count(quiz_name)
+        if count == 0:
+            return []
+        indices = sample_indices(count, k, make_rng(seed))
+        # Czytamy wpisy w kolejności rosnącej, aby ograniczyć skoki po plikach
+        ordered = sorted(indices)
+        offsets = []
+        with open(self._index_path(quiz_name), 'rb') as index:
+            for i in ordered:
+                index.seek(len(self.INDEX_MAGIC) + i * self.OFFSET_SIZE)
+                offsets.append(struct.unpack(self.OFFSET_FORMAT, index.read(self.OFFSET_SIZE))[0])
+        records = dict(zip(ordered, self._read_records(offsets)))
+        return [records[i] for i in indices]
+
+    def append(self, quiz_name, question_text, correct_answer):
+        """Dopisuje pytanie do quizu w czasie O(1). Zwraca zapisany rekord."""
+        return self.append_many([(quiz_name, question_text, correct_answer)])[0]
+
+    def append_many(self, entries):
+        """
+        Dopisuje wiele pytań naraz, otwierając dziennik tylko raz.
+        entries: iterowalna kolekcja krotek (nazwa_quizu, treść_pytania, odpowiedź)
+        """
+        known_quizzes = set(self.list_quizzes())
+        index_handles = {}
+        added = []
+        try:
+            with open(self.log_file, 'ab') as log, open(self.manifest_file, 'a', encoding='utf-8') as manifest:
+                for quiz_name, question_text, correct_answer in entries:
+                    if not isinstance(quiz_name, str) or not quiz_name or '\n' in quiz_name:
+                        raise ValueError(f"Nieprawidłowa nazwa quizu: {quiz_name!r}")
+                    record = {"question": question_text, "answer": correct_answer}
+                    line = json.dumps({"quiz": quiz_name, **record}, ensure_ascii=False) + "\n"
+
+                    offset = log.tell()
+                    log.write(line.encode('utf-8'))
+                    # Wpis w indeksie może wskazywać tylko na rekord, który jest już w dzienniku
+                    log.flush()
+
+                    index = index_handles.get(quiz_name)
+                    if index is None:
+                        index = open(self._index_path(quiz_name), 'ab')
+                        index_handles[quiz_name] = index
+                        if index.tell() == 0:
+                            index.write(self.INDEX_MAGIC)
+                    index.write(struct.pack(self.OFFSET_FORMAT, offset))
+
+                    if quiz_name not in known_quizzes:
+                        manifest.write(quiz_name + "\n")
+                        manifest.flush()
+                        known_quizzes.add(quiz_name)
+                    added.append(record)
+        finally:
+            for index in index_handles.values():
+                index.close()
+        return added
+
+    def import_json(self, json_file):
+        """
+        Importuje pytania z pliku w dotychczasowym formacie quiz_data.json.
+        Zwraca liczbę zaimportowanych pytań; nieprawidłowe wpisy są pomijane z ostrzeżeniem.
+        """
+        data = JsonQuestionStore(json_file).load_all()
+        entries = []
+        for quiz_name, questions in data.items():
+            if not isinstance(questions, (list, QuestionList)):
+                print(f"Ostrzeżenie: Quiz '{quiz_name}' nie zawiera listy pytań. Zostaje pominięty.")
+                continue
+            for q in questions:
+                if not is_valid_question(q):
+                    print(f"Ostrzeżenie: Nieprawidłowy format pytania w quizie '{quiz_name}': {q}")
+                    continue
+                entries.append((quiz_name, q['question'], q['answer']))
+        return len(self.append_many(entries))
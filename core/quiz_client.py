@@ -0,0 +1,151 @@
+import asyncio
+import inspect
+import json
+
+from core.quiz_server import DEFAULT_HOST, DEFAULT_PORT
+from core.quiz_session import QuizEvent, print_quiz_event
+
+
+class QuizClient:
+    """Klient protokołu serwera quizów (QuizServer)."""
+
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+        self.server_name = None
+
+    @classmethod
+    async def connect(cls, host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None):
+        """Łączy się z serwerem (TCP albo gniazdo Unix) i odbiera powitanie."""
+        if unix_path:
+            reader, writer = await asyncio.open_unix_connection(unix_path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        client = cls(reader, writer)
+        hello = await client._receive()
+        client.server_name = hello.get('name')
+        return client
+
+    async def _send(self, line):
+        self._writer.write((line + "\n").encode('utf-8'))
+        await self._writer.drain()
+
+    async def _receive(self):
+        line = await self._reader.readline()
+        if not line:
+            raise ConnectionError("Serwer zamknął połączenie.")
+        return json.loads(line)
+
+    async def list_quizzes(self):
+        """Zwraca listę nazw quizów dostępnych na serwerze."""
+        await self._send("LIST")
+        return (await self._receive())['quizzes']
+
+    async def set_user(self, user_id):
+        """Przypisuje kolejne wyniki tego połączenia do użytkownika user_id."""
+        await self._send(f"USER {user_id}")
+        message = await self._receive()
+        if message['type'] == 'error':
+            raise ValueError(message['message'])
+
+    async def play(self, quiz_name, num_questions, answer_callback, event_callback=None):
+        """
+        Rozgrywa quiz na serwerze i zwraca krotkę (wynik, liczba_pytań).
+        answer_callback: funkcja (także async) (numer_pytania, treść_pytania) -> odpowiedź
+        event_callback: funkcja przyjmująca każdą wiadomość serwera (słownik), opcjonalna
+        """
+        await self._send(f"START {num_questions} {quiz_name}")
+        while True:
+            message = await self._receive()
+            if event_callback is not None:
+                event_callback(message)
+            kind = message['type']
+            if kind == 'question':
+                answer = answer_callback(message['number'], message['question'])
+                if inspect.isawaitable(answer):
+                    answer = await answer
+                # Odpowiedź musi zmieścić się w jednej linii protokołu
+                await self._send(str(answer).replace("\n", " ").replace("\r", " "))
+            elif kind == 'finish':
+                return message['score'], message['total_questions']
+            elif kind == 'error' and 'number' not in message:
+                raise ValueError(message['message'])
+
+    async def close(self):
+        """Kończy sesję poleceniem QUIT i zamyka połączenie."""
+        try:
+            await self._send("QUIT")
+            await self._receive()
+        except ConnectionError:
+            pass
+        finally:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+async def simulate_clients(count, quiz_name, num_questions, answer_callback,
+                           host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None):
+    """
+    Uruchamia równolegle podaną liczbę klientów rozgrywających ten sam quiz (test obciążeniowy).
+    Zwraca listę krotek (wynik, liczba_pytań) w kolejności klientów.
+    """
+    async def one_client():
+        client = await QuizClient.connect(host, port, unix_path)
+        try:
+            return await client.play(quiz_name, num_questions, answer_callback)
+        finally:
+            await client.close()
+
+    return await asyncio.gather(*(one_client() for _ in range(count)))
+
+
+def _print_server_message(message):
+    """Wypisuje wiadomość serwera tak samo jak zdarzenie lokalnej sesji quizu (print_quiz_event)."""
+    data = dict(message)
+    print_quiz_event(QuizEvent(data.pop('type'), data))
+
+
+async def run_console_client(host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None, user_id=None):
+    """
+    Konsolowy klient serwera quizów: wybór quizu i odpowiedzi wpisywane przez użytkownika.
+    user_id: użytkownik, któremu serwer przypisuje wyniki (None - użytkownik domyślny)
+    """
+    client = await QuizClient.connect(host, port, unix_path)
+    print(f"Połączono z serwerem: {client.server_name}")
+    try:
+        if user_id is not None:
+            await client.set_user(user_id)
+        while True:
+            available_quizzes = await client.list_quizzes()
+            if not available_quizzes:
+                print("Brak dostępnych quizów na serwerze.")
+                return
+            print("\nDostępne quizy:")
+            for i, quiz_name in enumerate(available_quizzes):
+                print(f"{i + 1}. {quiz_name}")
+            print(f"{len(available_quizzes) + 1}. Wyjdź")
+
+            choice = await asyncio.to_thread(input, "Wybierz numer quizu: ")
+            try:
+                quiz_index = int(choice) - 1
+            except ValueError:
+                print("Nieprawidłowy format. Wprowadź liczbę.")
+                continue
+            if quiz_index == len(available_quizzes):
+                return
+            if not 0 <= quiz_index < len(available_quizzes):
+                print("Nieprawidłowy numer quizu. Spróbuj ponownie.")
+                continue
+
+            count = await asyncio.to_thread(input, "Ile pytań w quizie? ")
+            try:
+                await client.play(available_quizzes[quiz_index], count.strip(),
+                                  lambda number, question: asyncio.to_thread(input, "Twoja odpowiedź: "),
+                                  _print_server_message)
+            except ValueError as e:
+                print(f"Błąd: {e}")
+    finally:
+        await client.close()
@@ -1,31 +1,53 @@
-import importlib
 import os
 import json
-import random
-import sys
+import threading
+
+from core.metrics import timed
+from core.question_cache import LazyQuestionCache
+from core.question_list import QuestionList
+from core.question_store import JsonQuestionStore
+from core.quiz_registry import LazyQuizClasses, QuizRegistry
+from core.quiz_session import QuizSession, print_quiz_event
+from core.sampling import make_rng, reservoir_sample
 
 
 class QuizManager(object):
     """Zarządza ładowaniem, uruchamianiem quizów i ich danymi z pliku JSON."""
 
     # Zmiana ścieżek dostosowana do nowej struktury pakietów
-    def __init__(self, quiz_dir="quizzes", quiz_data_file="../quizzes/quiz_data.json"):
+    def __init__(self, quiz_dir="quizzes", quiz_data_file="../quizzes/quiz_data.json", question_store=None,
+                 lazy=False, cache_max_bytes=64 * 1024 * 1024, disk_sampling=False, scheduler=None):
         self.quiz_dir = quiz_dir
         # Ścieżka do quiz_data.json względem katalogu 'core'
         self.quiz_data_file = os.path.abspath(os.path.join(os.path.dirname(__file__), quiz_data_file))
+        # Magazyn pytań jest wymienny; domyślnie używamy pliku quiz_data.json
+        self.question_store = question_store if question_store is not None \
+            else JsonQuestionStore(self.quiz_data_file)
+        self.lazy = lazy
+        # Przy losowaniu z dysku pytania są czytane bezpośrednio z indeksu magazynu
+        self.disk_sampling = disk_sampling
+        # Opcjonalny harmonogram powtórek (np. SpacedRepetitionScheduler) zamiast losowego wyboru pytań
+        self.scheduler = scheduler
+        # Chroni podmianę pytań i klas quizów przez QuizReloader przed równoczesnym dodawaniem pytań
+        self.reload_lock = threading.RLock()
+        self.reloader = None
         self.available_quizzes = self._load_quiz_definitions()
-        self.quiz_questions = self._load_quiz_questions()
+        # W trybie leniwym pytania quizu są wczytywane dopiero przy jego pierwszym użyciu
+        if lazy:
+            self.quiz_questions = LazyQuestionCache(self.question_store, cache_max_bytes)
+        else:
+            self.quiz_questions = self._load_quiz_questions()
 
+    @timed("quiz_questions_load_seconds")
     def _load_quiz_questions(self):
-        """Prywatna metoda do ładowania pytań quizowych z pliku JSON."""
+        """Prywatna metoda do ładowania pytań quizowych z magazynu pytań."""
         questions_data = {}
         try:
-            with open(self.quiz_data_file, 'r', encoding='utf-8') as f:
-                questions_data = json.load(f)
+            questions_data = self.question_store.load_all()
         except FileNotFoundError:
-            print(f"Błąd: Plik z danymi quizów '{self.quiz_data_file}' nie znaleziono.")
+            print(f"Błąd: Plik z danymi quizów '{self.question_store.location}' nie znaleziono.")
         except json.JSONDecodeError as e:
-            print(f"Błąd parsowania pliku JSON '{self.quiz_data_file}': {e}")
+            print(f"Błąd parsowania pliku JSON '{self.question_store.location}': {e}")
         except Exception as e:
             print(f"Wystąpił błąd podczas wczytywania danych quizów: {e}")
         return questions_data
@@ -34,74 +56,52 @@ class QuizManager(object):
         """
         Dodaje nowe pytanie do podanego quizu. Tworzy quiz, jeśli nie istnieje.
         """
-        data = {}
-
-        if os.path.exists(self.quiz_data_file):
-            with open(self.quiz_data_file, 'r', encoding='utf-8') as file:
-                try:
-                    data = json.load(file)
-                except json.JSONDecodeError:
-                    print("⚠️ Plik JSON był pusty lub uszkodzony. Tworzę nowy.")
-
-        if quiz_name not in data:
-            data[quiz_name] = []
-
-        new_question = {
-            "question": question_text,
-            "answer": correct_answer
-        }
-        data[quiz_name].append(new_question)
+        with self.reload_lock:
+            new_question = self.question_store.append(quiz_name, question_text, correct_answer)
 
-        with open(self.quiz_data_file, 'w', encoding='utf-8') as file:
-            json.dump(data, file, ensure_ascii=False, indent=4)
+            # Aktualizujemy pytania w pamięci bez ponownego wczytywania całego magazynu
+            if self.lazy:
+                self.quiz_questions.add_question(quiz_name, new_question)
+            else:
+                self.quiz_questions.setdefault(quiz_name, QuestionList()).append(new_question)
 
         print(f"✅ Dodano pytanie do quizu '{quiz_name}'")
+
+    @timed("quiz_definitions_load_seconds")
     def _load_quiz_definitions(self):
         """
-        Prywatna metoda do ładowania klas quizów z katalogu quizzes.
+        Prywatna metoda do wykrywania klas quizów w katalogu quizzes.
+        Klasy są rozpoznawane bez importowania modułów (wynik jest zapamiętywany na dysku według czasów
+        modyfikacji plików), a importowane dopiero przy pierwszym użyciu danego quizu.
         """
-        quizzes = {}
         # Ścieżka do katalogu quizzes względem katalogu core
         quiz_module_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', self.quiz_dir))
+        self.quiz_registry = QuizRegistry(quiz_module_path)
+        return LazyQuizClasses(self.quiz_registry, self.quiz_registry.discover())
+
+    def enable_hot_reload(self, interval=1.0):
+        """
+        Włącza przeładowywanie zmienionych pytań i modułów quizów w tle co interval sekund.
+        Zwraca obiekt QuizReloader (z metrykami przeładowań).
+        """
+        from core.quiz_reloader import QuizReloader
 
-        # Dodaj katalog quizzes do ścieżki sys.path TYLKO na czas ładowania definicji
-        # To jest kluczowe, aby importlib.import_module mógł znaleźć pliki .py bezpośrednio
-        # bez konieczności odwoływania się do 'math_trainer.quizzes' jako pełnego pakietu.
-        # Jest to obejście dla dynamicznego importowania, gdy struktura pakietów jest złożona.
-        if quiz_module_path not in sys.path:
-            sys.path.insert(0, quiz_module_path)
-
-        for filename in os.listdir(quiz_module_path):
-            if filename.endswith(".py") and filename != "__init__.py":
-                module_name = filename[:-3]
-                try:
-                    module = importlib.import_module(module_name)
-                    for attr_name in dir(module):
-                        attribute = getattr(module, attr_name)
-                        if isinstance(attribute, type) and 'Quiz' in attr_name:
-                            if hasattr(attribute, 'get_name') and callable(getattr(attribute, 'get_name')):
-                                quiz_instance = attribute()
-                                quizzes[quiz_instance.get_name()] = attribute
-                            else:
-                                print(
-                                    f"Ostrzeżenie: Klasa {attr_name} w module {module_name} nie ma metody 'get_name'. Zostaje pominięta.")
-                except Exception as e:
-                    print(f"Błąd ładowania definicji quizu z pliku {filename}: {e}")
-
-        if quiz_module_path in sys.path:
-            sys.path.remove(quiz_module_path)
-            importlib.invalidate_caches()
-
-        return quizzes
+        if self.reloader is None:
+            self.reloader = QuizReloader(self, interval)
+            self.reloader.start()
+        return self.reloader
 
     def list_quizzes(self):
-        """Zwraca listę dostępnych nazw quizów na podstawie danych JSON."""
+        """Zwraca listę dostępnych nazw quizów na podstawie magazynu pytań."""
         return list(self.quiz_questions.keys())
 
-    def get_quiz_instance_and_questions(self, quiz_name, num_questions=5):
+    @timed("quiz_questions_select_seconds", quiz_arg="quiz_name")
+    def get_quiz_instance_and_questions(self, quiz_name, num_questions=5, seed=None, user_id=None):
         """
         Zwraca instancję wybranej klasy quizu i zestaw pytań dla niego.
-        Pytania są pobierane z pliku JSON.
+        Pytania są pobierane z magazynu pytań; podanie ziarna (seed) czyni losowanie powtarzalnym.
+        Przy ustawionym harmonogramie powtórek pytania wybiera harmonogram dla użytkownika user_id.
+        Format pytań jest sprawdzany raz, przy ich wczytywaniu, a nie przy każdym losowaniu.
         """
         quiz_class = self.available_quizzes.get(quiz_name)
         if not quiz_class:
@@ -109,57 +109,99 @@ class QuizManager(object):
 
         quiz_instance = quiz_class()
 
+        cached = self.lazy and quiz_name in self.quiz_questions.cached_quizzes()
+        if self.scheduler is None and self.disk_sampling and not cached:
+            # Losujemy bezpośrednio z indeksu magazynu, bez wczytywania całego quizu do pamięci
+            selected_questions = self.question_store.sample(quiz_name, num_questions, seed)
+            if not selected_questions:
+                raise ValueError(f"Brak pytań dla quizu '{quiz_name}' w pliku quiz_data.json.")
+            return quiz_instance, selected_questions
+
         questions_for_quiz = self.quiz_questions.get(quiz_name)
         if not questions_for_quiz:
             raise ValueError(f"Brak pytań dla quizu '{quiz_name}' w pliku quiz_data.json.")
 
-        if not isinstance(questions_for_quiz, list):
+        if not isinstance(questions_for_quiz, (list, QuestionList)):
             raise TypeError(f"Oczekiwano listy pytań dla quizu '{quiz_name}', otrzymano {type(questions_for_quiz)}")
 
+        if self.scheduler is not None:
+            selected_questions = self.scheduler.select(quiz_name, questions_for_quiz, num_questions,
+                                                       **self._user_kwargs(user_id))
         # Wybierz losowe pytania, jeśli jest ich więcej niż num_questions
-        if len(questions_for_quiz) > num_questions:
-            selected_questions = random.sample(questions_for_quiz, num_questions)
+        elif len(questions_for_quiz) > num_questions:
+            selected_questions = make_rng(seed).sample(questions_for_quiz, num_questions)
         else:
-            selected_questions = questions_for_quiz
-
-        for q in selected_questions:
-            if not isinstance(q, dict) or 'question' not in q or 'answer' not in q:
-                raise ValueError(f"Nieprawidłowy format pytania w quiz_data.json dla quizu '{quiz_name}': {q}")
+            selected_questions = questions_for_quiz[:]
 
         return quiz_instance, selected_questions
 
-    def run_quiz(self, quiz_instance, questions):
-        """Przeprowadza quiz i zwraca liczbę poprawnych odpowiedzi."""
-        if not hasattr(quiz_instance, 'check_answer') or not callable(getattr(quiz_instance, 'check_answer')):
-            raise TypeError("Obiekt quizu musi mieć metodę 'check_answer(user_answer_str, correct_answer)'.")
-
-        score = 0
-        total_questions = len(questions)
-
-        print(f"\n--- Rozpoczynam quiz: {quiz_instance.get_name()} ---")
-
-        for i, q_data in enumerate(questions):
-            question_str = q_data['question']
-            correct_answer = q_data['answer']
-
-            print(f"\nPytanie {i + 1}/{total_questions}: {question_str}")
-            try:
-                user_answer_str = input("Twoja odpowiedź: ").strip()
-
-                is_correct = quiz_instance.check_answer(user_answer_str, correct_answer)
-
-                if is_correct:
-                    print("Poprawna odpowiedź!")
-                    score += 1
-                else:
-                    print(f"Błędna odpowiedź. Prawidłowa odpowiedź to: {correct_answer}")
-            except ValueError as e:
-                print(f"Błąd wejścia: {e}. Spróbuj ponownie.")
-            except ZeroDivisionError:
-                print("Wystąpił błąd dzielenia przez zero. To pytanie zostało pominięte.")
-            except Exception as e:
-                print(f"Wystąpił nieoczekiwany błąd podczas quizu: {e}")
-
-        print(f"\n--- Koniec quizu: {quiz_instance.get_name()} ---")
-        print(f"Twój wynik: {score}/{total_questions}")
-        return score, total_questions
+    def get_quiz_instance_and_generated_questions(self, quiz_name, num_questions=5, seed=None, pool=None,
+                                                  **difficulty):
+        """
+        Zwraca instancję wybranej klasy quizu i świeżo wygenerowane pytania.
+        Pytania nie są zapisywane w magazynie; difficulty to parametry generatora danego quizu.
+        pool: jeśli podane, num_questions pytań jest losowanych z pool wygenerowanych pytań
+        w jednym przejściu po generatorze (reservoir_sample), bez tworzenia listy całej puli.
+        """
+        quiz_class = self.available_quizzes.get(quiz_name)
+        if not quiz_class:
+            raise ValueError(f"Definicja quizu '{quiz_name}' nie znaleziono w modułach Python.")
+
+        quiz_instance = quiz_class()
+        if not callable(getattr(quiz_instance, 'generate_questions', None)):
+            raise ValueError(f"Quiz '{quiz_name}' nie obsługuje generowania pytań.")
+
+        if pool is not None and pool > num_questions:
+            rng = make_rng(seed)
+            source = quiz_instance.generate_questions(pool, seed=rng.getrandbits(64), **difficulty)
+            return quiz_instance, reservoir_sample(source, num_questions, rng)
+        return quiz_instance, list(quiz_instance.generate_questions(num_questions, seed=seed, **difficulty))
+
+    @timed("grade_batch_seconds", quiz_arg="quiz_name")
+    def grade_batch(self, quiz_name, questions, answers):
+        """
+        Ocenia naraz wiele odpowiedzi na pytania wybranego quizu.
+        questions: lista pytań (słowniki z kluczem 'answer') albo QuestionList
+        answers: lista odpowiedzi użytkownika jako stringi, w tej samej kolejności
+        Zwraca listę wartości bool. Jeśli klasa quizu nie ma metody check_answers,
+        odpowiedzi są oceniane pojedynczo metodą check_answer.
+        """
+        quiz_class = self.available_quizzes.get(quiz_name)
+        if not quiz_class:
+            raise ValueError(f"Definicja quizu '{quiz_name}' nie znaleziono w modułach Python.")
+        if len(questions) != len(answers):
+            raise ValueError("Liczba odpowiedzi musi być równa liczbie pytań.")
+
+        quiz_instance = quiz_class()
+        if isinstance(questions, QuestionList):
+            correct_answers = questions.answers
+        else:
+            correct_answers = [q['answer'] for q in questions]
+        if callable(getattr(quiz_instance, 'check_answers', None)):
+            return quiz_instance.check_answers(answers, correct_answers)
+        return [quiz_instance.check_answer(user_answer, correct_answer)
+                for user_answer, correct_answer in zip(answers, correct_answers)]
+
+    @staticmethod
+    def _user_kwargs(user_id):
+        return {} if user_id is None else {'user_id': user_id}
+
+    def record_outcomes(self, quiz_name, questions, outcomes, user_id=None):
+        """
+        Przekazuje wyniki poszczególnych pytań (QuizSession.outcomes) do harmonogramu powtórek.
+        Bez harmonogramu nic nie robi.
+        """
+        if self.scheduler is None:
+            return
+        self.scheduler.record_many(quiz_name, list(zip(questions, outcomes)), **self._user_kwargs(user_id))
+
+    def run_quiz(self, quiz_instance, questions, user_id=None):
+        """
+        Przeprowadza quiz w konsoli i zwraca liczbę poprawnych odpowiedzi.
+        Jest to cienka nakładka na QuizSession: odpowiedzi czytane są przez input(),
+        zdarzenia wypisywane przez print().
+        """
+        session = QuizSession(quiz_instance, questions)
+        result = session.run(lambda number, question: input("Twoja odpowiedź: ").strip(), print_quiz_event)
+        self.record_outcomes(quiz_instance.get_name(), questions, session.outcomes, user_id)
+        return result
@@ -0,0 +1,268 @@
+"""
+Rejestr wtyczek quizów.
+
+Klasy quizów są rozpoznawane statycznie (analiza AST plików .py), bez importowania modułów:
+  - klasy oznaczone dekoratorem @register_quiz ze statycznym atrybutem quiz_name
+    (albo nazwą podaną w dekoratorze: @register_quiz("Nazwa")),
+  - starsze klasy z 'Quiz' w nazwie, których metoda get_name() zwraca stały napis.
+Tylko dla klas, których nazwy nie da się ustalić statycznie, moduł jest importowany podczas wykrywania.
+
+Wynik wykrywania jest zapisywany w <katalog quizów>/__pycache__/quiz_registry.json
+z rozmiarem i czasem modyfikacji każdego pliku - niezmienione pliki nie są ponownie analizowane.
+Same klasy są importowane dopiero przy pierwszym użyciu quizu (LazyQuizClasses).
+"""
+import ast
+import importlib.util
+import json
+import os
+import sys
+from collections.abc import Mapping
+
+CACHE_DIR = "__pycache__"
+CACHE_FILE = "quiz_registry.json"
+CACHE_VERSION = 1
+
+
+def register_quiz(cls_or_name=None):
+    """
+    Dekorator oznaczający klasę quizu. Sam dekorator niczego nie rejestruje w czasie wykonania - klasy
+    oznaczone nim rozpoznaje QuizRegistry podczas statycznej analizy plików; dekorator ustawia i sprawdza
+    atrybut quiz_name.
+    Użycie: @register_quiz (nazwa z atrybutu klasy quiz_name) albo @register_quiz("Nazwa quizu").
+    """
+    def decorate(cls, name=None):
+        if name is not None:
+            cls.quiz_name = name
+        if not isinstance(getattr(cls, 'quiz_name', None), str):
+            raise TypeError(f"Klasa quizu {cls.__name__} musi mieć atrybut 'quiz_name' z nazwą quizu.")
+        return cls
+
+    if isinstance(cls_or_name, type):
+        return decorate(cls_or_name)
+    return lambda cls: decorate(cls, cls_or_name)
+
+
+def _is_register_decorator(node):
+    target = node.func if isinstance(node, ast.Call) else node
+    return (isinstance(target, ast.Name) and target.id == 'register_quiz') or \
+        (isinstance(target, ast.Attribute) and target.attr == 'register_quiz')
+
+
+def _string_constant(node):
+    return node.value if isinstance(node, ast.Constant) and isinstance(node.value, str) else None
+
+
+def _static_quiz_name(class_node):
+    """
+    Ustala nazwę quizu klasy bez jej importowania.
+    Zwraca krotkę (czy_klasa_quizu, nazwa albo None, gdy nazwy nie da się ustalić statycznie).
+    """
+    decorators = [node for node in class_node.decorator_list if _is_register_decorator(node)]
+    for decorator in decorators:
+        if isinstance(decorator, ast.Call) and decorator.args:
+            return True, _string_constant(decorator.args[0])
+
+    attribute_name = None
+    get_name = None
+    for statement in class_node.body:
+        if isinstance(statement, ast.Assign) and len(statement.targets) == 1 \
+                and isinstance(statement.targets[0], ast.Name) and statement.targets[0].id == 'quiz_name':
+            attribute_name = _string_constant(statement.value)
+        elif isinstance(statement, ast.FunctionDef) and statement.name == 'get_name':
+            get_name = statement
+
+    if decorators:
+        return True, attribute_name
+    if 'Quiz' not in class_node.name or get_name is None:
+        return False, None
+    if attribute_name is not None:
+        return True, attribute_name
+    body = [statement for statement in get_name.body
+            if not (isinstance(statement, ast.Expr) and _string_constant(statement.value) is not None)]
+    if len(body) == 1 and isinstance(body[0], ast.Return):
+        return True, _string_constant(body[0].value)
+    return True, None
+
+
+class QuizRegistry:
+    """Wykrywa klasy quizów w katalogu i przechowuje wynik w pamięci podręcznej na dysku."""
+
+    def __init__(self, quiz_dir):
+        self.quiz_dir = os.path.abspath(quiz_dir)
+        self.cache_file = os.path.join(self.quiz_dir, CACHE_DIR, CACHE_FILE)
+        # Liczniki ostatniego wykrywania: pliki z pamięci podręcznej, przeanalizowane i zaimportowane
+        self.cached_files = 0
+        self.scanned_files = 0
+        self.imported_files = 0
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == CACHE_VERSION and isinstance(data.get('files'), dict):
+                return data['files']
+        except (OSError, ValueError):
+            pass
+        return {}
+
+    def _save_cache(self, files):
+        temp_path = f"{self.cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': CACHE_VERSION, 'files': files}, f, ensure_ascii=False)
+            os.replace(temp_path, self.cache_file)
+        except OSError:
+            # Brak pamięci podręcznej spowalnia tylko kolejne uruchomienie
+            pass
+
+    def module_files(self):
+        """Zwraca słownik {nazwa_pliku: (rozmiar, mtime_ns)} modułów quizów w katalogu."""
+        files = {}
+        with os.scandir(self.quiz_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".py") and entry.name != "__init__.py" and entry.is_file():
+                    stat = entry.stat()
+                    files[entry.name] = (stat.st_size, stat.st_mtime_ns)
+        return files
+
+    def scan_file(self, filename):
+        """
+        Analizuje plik modułu i zwraca listę par [nazwa_quizu, nazwa_klasy].
+        Moduł jest importowany tylko wtedy, gdy nazwy quizu nie da się ustalić statycznie.
+        Zwraca None, gdy pliku nie udało się przeanalizować.
+        """
+        path = os.path.join(self.quiz_dir, filename)
+        try:
+            with open(path, 'rb') as f:
+                tree = ast.parse(f.read(), filename=path)
+        except (OSError, SyntaxError, ValueError) as e:
+            print(f"Błąd ładowania definicji quizu z pliku {filename}: {e}")
+            return None
+
+        quizzes = []
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            is_quiz, quiz_name = _static_quiz_name(node)
+            if not is_quiz:
+                if 'Quiz' in node.name and not any(isinstance(statement, ast.FunctionDef)
+                                                   and statement.name == 'get_name' for statement in node.body):
+                    print(f"Ostrzeżenie: Klasa {node.name} w module {filename[:-3]} nie ma metody 'get_name'. "
+                          f"Zostaje pominięta.")
+                continue
+            if quiz_name is None:
+                # Nazwa wyliczana dynamicznie - jedyny przypadek wymagający importu przy wykrywaniu
+                try:
+                    quiz_class = getattr(self.import_module(filename[:-3]), node.name)
+                    quiz_name = quiz_class().get_name()
+                    self.imported_files += 1
+                except Exception as e:
+                    print(f"Błąd ładowania definicji quizu z pliku {filename}: {e}")
+                    return None
+            quizzes.append([quiz_name, node.name])
+        return quizzes
+
+    def discover(self):
+        """
+        Zwraca słownik {nazwa_quizu: (nazwa_modułu, nazwa_klasy)} dla wszystkich quizów w katalogu.
+        Pliki o niezmienionym rozmiarze i czasie modyfikacji są brane z pamięci podręcznej.
+        """
+        self.cached_files = self.scanned_files = self.imported_files = 0
+        cache = self._load_cache()
+        files = {}
+        for filename, signature in sorted(self.module_files().items()):
+            entry = cache.get(filename)
+            if entry is not None and tuple(entry.get('signature', ())) == signature:
+                self.cached_files += 1
+                files[filename] = entry
+                continue
+            self.scanned_files += 1
+            quizzes = self.scan_file(filename)
+            if quizzes is not None:
+                files[filename] = {'signature': list(signature), 'quizzes': quizzes}
+
+        if files != cache:
+            self._save_cache(files)
+
+        discovered = {}
+        for filename, entry in files.items():
+            for quiz_name, class_name in entry['quizzes']:
+                discovered[quiz_name] = (filename[:-3], class_name)
+        return discovered
+
+    def import_module(self, module_name):
+        """Importuje moduł quizu z katalogu quizów (bez modyfikowania sys.path)."""
+        path = os.path.join(self.quiz_dir, module_name + ".py")
+        module = sys.modules.get(module_name)
+        if module is not None and getattr(module, '__file__', None) \
+                and os.path.abspath(module.__file__) == path:
+            return module
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[module_name]
+            raise
+        return module
+
+    def forget_module(self, module_name):
+        """Usuwa moduł quizu z sys.modules, aby kolejny import wczytał jego aktualną wersję."""
+        module = sys.modules.get(module_name)
+        path = os.path.join(self.quiz_dir, module_name + ".py")
+        if module is not None and getattr(module, '__file__', None) and os.path.abspath(module.__file__) == path:
+            del sys.modules[module_name]
+
+    def load_class(self, module_name, class_name):
+        """Importuje moduł i zwraca klasę quizu."""
+        return getattr(self.import_module(module_name), class_name)
+
+
+class LazyQuizClasses(Mapping):
+    """
+    Słownik {nazwa_quizu: klasa_quizu}, w którym moduł quizu jest importowany dopiero przy pierwszym
+    odczycie jego klasy. Sprawdzanie nazw (in, len, iteracja po kluczach) nie importuje niczego.
+    """
+
+    def __init__(self, registry, discovered, classes=None):
+        self._registry = registry
+        self._locations = dict(discovered)
+        # Klasy już zaimportowane (np. przeniesione z poprzedniej wersji rejestru)
+        self._classes = {name: quiz_class for name, quiz_class in (classes or {}).items()
+                         if name in self._locations}
+
+    def __getitem__(self, quiz_name):
+        quiz_class = self._classes.get(quiz_name)
+        if quiz_class is not None:
+            return quiz_class
+        module_name, class_name = self._locations[quiz_name]
+        try:
+            quiz_class = self._registry.load_class(module_name, class_name)
+        except Exception as e:
+            print(f"Błąd ładowania definicji quizu z pliku {module_name}.py: {e}")
+            raise KeyError(quiz_name) from e
+        self._classes[quiz_name] = quiz_class
+        return quiz_class
+
+    def __contains__(self, quiz_name):
+        return quiz_name in self._locations
+
+    def __iter__(self):
+        return iter(self._locations)
+
+    def __len__(self):
+        return len(self._locations)
+
+    def location(self, quiz_name):
+        """Zwraca (nazwa_modułu, nazwa_klasy) quizu."""
+        return self._locations[quiz_name]
+
+    def loaded_classes(self):
+        """Zwraca słownik {nazwa_quizu: klasa} quizów już zaimportowanych."""
+        return dict(self._classes)
+
+    def loaded(self):
+        """Zwraca nazwy quizów, których klasy zostały już zaimportowane."""
+        return list(self._classes)
@@ -0,0 +1,184 @@
+"""
+Przeładowywanie pytań i modułów quizów w działającym procesie (np. w serwerze quizów).
+
+QuizReloader okresowo sprawdza sygnatury (rozmiar, mtime) magazynu pytań i plików quizzes/*.py.
+Po wykryciu zmiany buduje nową wersję danych obok starej i podmienia ją jednym przypisaniem atrybutu
+QuizManager, więc trwające sesje (które trzymają własne listy pytań i instancje quizów) nie są blokowane.
+Ponownie przetwarzane są tylko quizy, które się zmieniły; niezmienione zachowują dotychczasowe obiekty.
+"""
+import threading
+import time
+
+from core.quiz_registry import LazyQuizClasses
+
+
+class QuizReloader:
+    """Wykrywa zmiany pytań i modułów quizów i podmienia je w QuizManager."""
+
+    def __init__(self, quiz_manager, interval=1.0):
+        self.quiz_manager = quiz_manager
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+        self._questions_signature = self._store_signature()
+        self._module_signatures = quiz_manager.quiz_registry.module_files()
+
+        # Metryki przeładowań (czasy w sekundach)
+        self.checks = 0
+        self.reloads = 0
+        self.errors = 0
+        self.reloaded_quizzes = 0
+        self.reloaded_modules = 0
+        self.last_check_time = 0.0
+        self.last_reload_time = 0.0
+        self.max_reload_time = 0.0
+        self.total_reload_time = 0.0
+        # Opóźnienie: od modyfikacji pliku do udostępnienia nowej wersji
+        self.last_latency = 0.0
+        self.last_error = None
+
+    def _store_signature(self):
+        signature = getattr(self.quiz_manager.question_store, 'signature', None)
+        return signature() if callable(signature) else None
+
+    def check(self):
+        """
+        Sprawdza jednorazowo, czy pliki się zmieniły, i w razie potrzeby przeładowuje dane.
+        Zwraca listę nazw przeładowanych quizów (pytań lub klas).
+        """
+        with self.quiz_manager.reload_lock:
+            start = time.perf_counter()
+            self.checks += 1
+            reloaded = []
+            changed_at = []
+            try:
+                questions_signature = self._store_signature()
+                if questions_signature != self._questions_signature:
+                    reloaded += self._reload_questions()
+                    self._questions_signature = questions_signature
+                    changed_at.append(self._newest_mtime(questions_signature))
+
+                module_signatures = self.quiz_manager.quiz_registry.module_files()
+                changed_files = [filename for filename in set(module_signatures) | set(self._module_signatures)
+                                 if module_signatures.get(filename) != self._module_signatures.get(filename)]
+                if changed_files:
+                    reloaded += self._reload_modules(changed_files)
+                    self._module_signatures = module_signatures
+                    changed_at += [module_signatures[filename][1] for filename in changed_files
+                                   if filename in module_signatures]
+            except Exception as e:
+                # Stara wersja danych zostaje; kolejna próba przy następnym sprawdzeniu
+                self.errors += 1
+                self.last_error = str(e)
+                print(f"Błąd przeładowania quizów: {e}")
+            duration = time.perf_counter() - start
+            self.last_check_time = duration
+
+            if changed_at:
+                self.reloads += 1
+                self.last_reload_time = duration
+                self.total_reload_time += duration
+                self.max_reload_time = max(self.max_reload_time, duration)
+                changed_at = [mtime_ns for mtime_ns in changed_at if mtime_ns]
+                if changed_at:
+                    self.last_latency = max(0.0, time.time() - max(changed_at) / 1e9)
+            return reloaded
+
+    @classmethod
+    def _newest_mtime(cls, signature):
+        """Zwraca najnowszy mtime_ns z sygnatury (rozmiar, mtime_ns) albo z krotki takich sygnatur."""
+        if not signature:
+            return None
+        if isinstance(signature[0], int):
+            return signature[1]
+        return max((mtime for mtime in map(cls._newest_mtime, signature) if mtime), default=None)
+
+    def _reload_questions(self):
+        manager = self.quiz_manager
+        if manager.lazy:
+            return self._reload_lazy_questions()
+
+        current = manager.quiz_questions
+        loaded = manager.question_store.load_all()
+        changed = [name for name, questions in loaded.items() if current.get(name) != questions]
+        removed = [name for name in current if name not in loaded]
+        if not changed and not removed:
+            return []
+        # Niezmienione quizy zachowują dotychczasowe listy pytań
+        questions = {name: (loaded[name] if name in changed else current[name]) for name in loaded}
+        manager.quiz_questions = questions
+        self.reloaded_quizzes += len(changed) + len(removed)
+        return changed + removed
+
+    def _reload_lazy_questions(self):
+        cache = self.quiz_manager.quiz_questions
+        store = self.quiz_manager.question_store
+        count = getattr(store, 'count', None)
+        changed = []
+        for name in cache.cached_quizzes():
+            # peek nie zmienia statystyk ani kolejności LRU; None oznacza quiz usunięty w międzyczasie z pamięci
+            cached = cache.peek(name)
+            # Magazyn z indeksem pozwala wskazać zmienione quizy bez wczytywania pytań
+            if cached is None or callable(count) and count(name) == len(cached):
+                continue
+            cache.invalidate(name)
+            changed.append(name)
+        self.reloaded_quizzes += len(changed)
+        return changed
+
+    def _reload_modules(self, changed_files):
+        manager = self.quiz_manager
+        registry = manager.quiz_registry
+        changed_modules = {filename[:-3] for filename in changed_files}
+
+        discovered = registry.discover()
+        current = manager.available_quizzes
+        loaded_classes = getattr(current, 'loaded_classes', None)
+        loaded = loaded_classes() if callable(loaded_classes) else {}
+        kept = {name: quiz_class for name, quiz_class in loaded.items()
+                if name in discovered and discovered[name][0] not in changed_modules}
+        for module_name in changed_modules:
+            registry.forget_module(module_name)
+        manager.available_quizzes = LazyQuizClasses(registry, discovered, kept)
+
+        self.reloaded_modules += len(changed_modules)
+        old_names = set(current)
+        return sorted(name for name in set(discovered) | old_names
+                      if name not in discovered or name not in old_names
+                      or discovered[name][0] in changed_modules)
+
+    def start(self):
+        """Uruchamia sprawdzanie zmian w wątku w tle co interval sekund."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="quiz-reloader", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def stop(self):
+        """Zatrzymuje wątek sprawdzający zmiany."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def metrics(self):
+        """Zwraca słownik z licznikami i czasami przeładowań."""
+        return {
+            'checks': self.checks,
+            'reloads': self.reloads,
+            'errors': self.errors,
+            'reloaded_quizzes': self.reloaded_quizzes,
+            'reloaded_modules': self.reloaded_modules,
+            'last_check_time': self.last_check_time,
+            'last_reload_time': self.last_reload_time,
+            'max_reload_time': self.max_reload_time,
+            'avg_reload_time': self.total_reload_time / self.reloads if self.reloads else 0.0,
+            'last_latency': self.last_latency,
+            'last_error': self.last_error,
+        }
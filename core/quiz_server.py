@@ -0,0 +1,186 @@
+import asyncio
+import functools
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from core import metrics
+from core.quiz_session import QuizSession
+from core.result_partitions import validate_user_id
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+class QuizServer:
+    """
+    Serwer quizów asyncio obsługujący wielu użytkowników naraz w jednym wątku.
+
+    Protokół jest liniowy (UTF-8). Klient wysyła polecenia:
+      LIST                      - lista dostępnych quizów,
+      USER <identyfikator>      - wybór użytkownika, któremu są przypisywane kolejne wyniki,
+      START <liczba> <nazwa>    - rozpoczęcie quizu; kolejne linie to odpowiedzi na pytania,
+      METRICS                   - migawka metryk czasów i liczników (core.metrics),
+      QUIT                      - zakończenie połączenia.
+    Serwer odpowiada obiektami JSON, po jednym w linii, z polem 'type'
+    (hello, quizzes, user, metrics, start, question, correct, incorrect, input_error, zero_division, error,
+    finish, bye).
+
+    Każde połączenie to jedna korutyna z sesją QuizSession; wyniki są zapisywane
+    w osobnym wątku, aby zapis do pliku nie blokował pętli zdarzeń. Lista quizów i pytania
+    (w trybie leniwym wczytywane z magazynu) są pobierane w domyślnej puli wątków pętli.
+    """
+
+    def __init__(self, quiz_manager, user_progress=None, max_questions=100):
+        self.quiz_manager = quiz_manager
+        self.user_progress = user_progress
+        self.max_questions = max_questions
+        # Jeden wątek zapisu szereguje dopisywanie wyników do pliku
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="quiz-results")
+        self.active_connections = 0
+        self.completed_sessions = 0
+
+    async def _send(self, writer, message):
+        writer.write((json.dumps(message, ensure_ascii=False, default=str) + "\n").encode('utf-8'))
+        await writer.drain()
+
+    async def _read_line(self, reader):
+        """
+        Czyta linię od klienta; zwraca None po zamknięciu połączenia przez klienta.
+        Linia zbyt długa albo niepoprawna w UTF-8 zgłasza ConnectionError - połączenie jest wtedy zamykane.
+        """
+        try:
+            line = await reader.readline()
+            return line.decode('utf-8').strip() if line else None
+        except (UnicodeDecodeError, asyncio.LimitOverrunError, ValueError) as e:
+            raise ConnectionError(f"Nieprawidłowa linia od klienta: {e}") from e
+
+    async def _in_thread(self, function, *args, **kwargs):
+        """Wykonuje blokującą funkcję menedżera quizów w domyślnej puli wątków pętli zdarzeń."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(function, *args, **kwargs))
+
+    def _write_results(self, quiz_name, score, total_questions, user_id):
+        user_progress = self.user_progress if user_id is None else self.user_progress.for_user(user_id)
+        user_progress.save_results(quiz_name, score, total_questions)
+
+    async def _save_results(self, quiz_name, score, total_questions, user_id=None):
+        if self.user_progress is None:
+            return
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._write_results,
+                                   quiz_name, score, total_questions, user_id)
+
+    async def _record_outcomes(self, quiz_name, questions, outcomes, user_id=None):
+        """Przekazuje wyniki pytań do harmonogramu powtórek menedżera quizów (jeśli go ma)."""
+        if getattr(self.quiz_manager, 'scheduler', None) is None:
+            return
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self.quiz_manager.record_outcomes,
+                                   quiz_name, questions, list(outcomes), user_id)
+
+    async def _play(self, reader, writer, argument, user_id=None):
+        """Przeprowadza jeden quiz w ramach połączenia."""
+        count_str, _, quiz_name = argument.partition(' ')
+        try:
+            num_questions = int(count_str)
+            if not 0 < num_questions <= self.max_questions:
+                raise ValueError
+        except ValueError:
+            await self._send(writer, {'type': 'error', 'message': "Użycie: START <liczba pytań> <nazwa quizu>"})
+            return
+
+        try:
+            user_kwargs = {} if user_id is None else {'user_id': user_id}
+            quiz_instance, questions = await self._in_thread(self.quiz_manager.get_quiz_instance_and_questions,
+                                                             quiz_name, num_questions, **user_kwargs)
+            session = QuizSession(quiz_instance, questions)
+        except (ValueError, TypeError) as e:
+            await self._send(writer, {'type': 'error', 'message': str(e)})
+            return
+
+        async def answers():
+            while True:
+                line = await self._read_line(reader)
+                if line is None:
+                    return
+                yield line
+
+        # ConnectionError z _read_line przerywa sesję bez zapisu wyniku i zamyka połączenie w handle_client
+        score, total_questions = await session.run_async(
+            answers(), lambda event: self._send(writer, {'type': event.kind, **event.data}))
+
+        await self._record_outcomes(quiz_name, questions, session.outcomes, user_id)
+
+        # Wynik zapisujemy tylko dla quizu, w którym padły odpowiedzi na wszystkie pytania
+        if len(session.outcomes) == total_questions:
+            self.completed_sessions += 1
+            await self._save_results(quiz_name, score, total_questions, user_id)
+
+    async def handle_client(self, reader, writer):
+        """Obsługuje jedno połączenie klienta."""
+        self.active_connections += 1
+        user_id = None
+        try:
+            await self._send(writer, {'type': 'hello', 'name': "Trener Matematyczny"})
+            while True:
+                line = await self._read_line(reader)
+                if line is None:
+                    break
+                command, _, argument = line.partition(' ')
+                command = command.upper()
+                try:
+                    if command == 'LIST':
+                        quizzes = await self._in_thread(self.quiz_manager.list_quizzes)
+                        await self._send(writer, {'type': 'quizzes', 'quizzes': quizzes})
+                    elif command == 'USER':
+                        try:
+                            user_id = validate_user_id(argument.strip())
+                        except ValueError as e:
+                            await self._send(writer, {'type': 'error', 'message': str(e)})
+                            continue
+                        await self._send(writer, {'type': 'user', 'user': user_id})
+                    elif command == 'START':
+                        await self._play(reader, writer, argument.strip(), user_id)
+                    elif command == 'METRICS':
+                        await self._send(writer, {'type': 'metrics', 'enabled': metrics.enabled,
+                                                  'metrics': metrics.REGISTRY.snapshot()})
+                    elif command == 'QUIT':
+                        await self._send(writer, {'type': 'bye'})
+                        break
+                    else:
+                        await self._send(writer, {'type': 'error', 'message': f"Nieznane polecenie: {command}"})
+                except ConnectionError:
+                    raise
+                except Exception as e:
+                    # Błąd obsługi polecenia nie zamyka połączenia - klient dostaje komunikat błędu
+                    await self._send(writer, {'type': 'error', 'message': f"Błąd serwera: {e}"})
+        except ConnectionError:
+            pass
+        finally:
+            self.active_connections -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None):
+        """Uruchamia nasłuchiwanie na porcie TCP albo gnieździe Unix i zwraca obiekt asyncio.Server."""
+        if unix_path:
+            return await asyncio.start_unix_server(self.handle_client, path=unix_path)
+        return await asyncio.start_server(self.handle_client, host, port)
+
+    async def serve_forever(self, host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None):
+        """Uruchamia serwer i obsługuje klientów do czasu przerwania."""
+        server = await self.start(host, port, unix_path)
+        addresses = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+        print(f"Serwer quizów nasłuchuje na: {addresses}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.close()
+
+    def close(self):
+        """Czeka na zakończenie zaległych zapisów wyników."""
+        self._executor.shutdown(wait=True)
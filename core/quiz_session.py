@@ -0,0 +1,192 @@
+import inspect
+import time
+from collections import namedtuple
+
+from core import metrics
+
+# Zdarzenie przebiegu quizu: kind to rodzaj zdarzenia, data to słownik z jego szczegółami
+QuizEvent = namedtuple('QuizEvent', ['kind', 'data'])
+
+# Rodzaje zdarzeń emitowanych przez sesję quizu
+EVENT_START = 'start'                  # quiz_name, total_questions
+EVENT_QUESTION = 'question'            # number, total_questions, question
+EVENT_CORRECT = 'correct'              # number
+EVENT_INCORRECT = 'incorrect'          # number, correct_answer
+EVENT_INPUT_ERROR = 'input_error'      # number, message
+EVENT_ZERO_DIVISION = 'zero_division'  # number
+EVENT_ERROR = 'error'                  # number, message
+EVENT_FINISH = 'finish'                # quiz_name, score, total_questions
+
+# Znacznik wyczerpania źródła odpowiedzi
+_NO_MORE_ANSWERS = object()
+
+
+class QuizSession:
+    """
+    Przeprowadza quiz niezależnie od konsoli.
+
+    Odpowiedzi pochodzą ze źródła odpowiedzi (iterator, funkcja zwrotna albo strumień asynchroniczny),
+    a przebieg quizu jest raportowany jako zdarzenia QuizEvent przekazywane do odbiorcy zdarzeń.
+    Dzięki temu ten sam silnik obsługuje konsolę, testy obciążeniowe i inne interfejsy.
+    """
+
+    __slots__ = ('quiz_instance', 'questions', 'score', 'outcomes')
+
+    def __init__(self, quiz_instance, questions):
+        if not hasattr(quiz_instance, 'check_answer') or not callable(getattr(quiz_instance, 'check_answer')):
+            raise TypeError("Obiekt quizu musi mieć metodę 'check_answer(user_answer_str, correct_answer)'.")
+        self.quiz_instance = quiz_instance
+        self.questions = questions
+        self.score = 0
+        # Wynik każdego pytania: True/False albo None, gdy odpowiedzi nie udało się ocenić
+        self.outcomes = []
+
+    @property
+    def total_questions(self):
+        return len(self.questions)
+
+    def _start_event(self):
+        return QuizEvent(EVENT_START, {'quiz_name': self.quiz_instance.get_name(),
+                                       'total_questions': self.total_questions})
+
+    def _question_event(self, index):
+        return QuizEvent(EVENT_QUESTION, {'number': index + 1, 'total_questions': self.total_questions,
+                                          'question': self.questions[index]['question']})
+
+    def _finish_event(self):
+        return QuizEvent(EVENT_FINISH, {'quiz_name': self.quiz_instance.get_name(), 'score': self.score,
+                                        'total_questions': self.total_questions})
+
+    def _error_event(self, index, error):
+        """Zamienia wyjątek zgłoszony przy pobieraniu lub ocenie odpowiedzi na zdarzenie."""
+        self.outcomes.append(None)
+        if isinstance(error, ValueError):
+            return QuizEvent(EVENT_INPUT_ERROR, {'number': index + 1, 'message': str(error)})
+        if isinstance(error, ZeroDivisionError):
+            return QuizEvent(EVENT_ZERO_DIVISION, {'number': index + 1})
+        return QuizEvent(EVENT_ERROR, {'number': index + 1, 'message': str(error)})
+
+    def grade(self, index, user_answer_str):
+        """Ocenia odpowiedź na pytanie o podanym indeksie i zwraca zdarzenie z wynikiem."""
+        correct_answer = self.questions[index]['answer']
+        start = time.perf_counter() if metrics.enabled else None
+        try:
+            is_correct = self.quiz_instance.check_answer(user_answer_str, correct_answer)
+        except Exception as e:
+            if start is not None:
+                metrics.inc("answers_total", quiz=self.quiz_instance.get_name(), result="error")
+            return self._error_event(index, e)
+
+        if start is not None:
+            quiz_name = self.quiz_instance.get_name()
+            metrics.observe("check_answer_seconds", time.perf_counter() - start, quiz=quiz_name)
+            metrics.inc("answers_total", quiz=quiz_name, result="correct" if is_correct else "incorrect")
+        self.outcomes.append(bool(is_correct))
+        if is_correct:
+            self.score += 1
+            return QuizEvent(EVENT_CORRECT, {'number': index + 1})
+        return QuizEvent(EVENT_INCORRECT, {'number': index + 1, 'correct_answer': correct_answer})
+
+    def run(self, answer_source, event_sink=None):
+        """
+        Przeprowadza quiz synchronicznie i zwraca krotkę (wynik, liczba_pytań).
+        answer_source: iterowalna kolekcja odpowiedzi albo funkcja (numer_pytania, treść_pytania) -> odpowiedź
+        event_sink: funkcja przyjmująca QuizEvent (opcjonalna)
+        Wyczerpanie iteratora kończy quiz; pozostałe pytania są liczone jako bez odpowiedzi.
+        Błąd wejścia-wyjścia źródła odpowiedzi (OSError, np. ConnectionError) przerywa quiz i jest zgłaszany dalej.
+        """
+        emit = event_sink or (lambda event: None)
+        if callable(answer_source) and not hasattr(answer_source, '__next__'):
+            next_answer = answer_source
+        else:
+            iterator = iter(answer_source)
+            next_answer = lambda number, question: next(iterator, _NO_MORE_ANSWERS)
+
+        emit(self._start_event())
+        for index in range(self.total_questions):
+            event = self._question_event(index)
+            emit(event)
+            try:
+                user_answer_str = next_answer(event.data['number'], event.data['question'])
+            except OSError:
+                raise
+            except Exception as e:
+                emit(self._error_event(index, e))
+                continue
+            if user_answer_str is _NO_MORE_ANSWERS:
+                break
+            emit(self.grade(index, user_answer_str))
+        emit(self._finish_event())
+        return self.score, self.total_questions
+
+    async def run_async(self, answer_source, event_sink=None):
+        """
+        Przeprowadza quiz w pętli asyncio i zwraca krotkę (wynik, liczba_pytań).
+        answer_source: iterator asynchroniczny, funkcja (także async) (numer_pytania, treść_pytania) -> odpowiedź
+                       albo zwykła iterowalna kolekcja odpowiedzi
+        event_sink: funkcja lub korutyna przyjmująca QuizEvent (opcjonalna)
+        Błąd wejścia-wyjścia źródła odpowiedzi (OSError, np. ConnectionError) przerywa quiz i jest zgłaszany dalej.
+        """
+        async def emit(event):
+            if event_sink is not None:
+                result = event_sink(event)
+                if inspect.isawaitable(result):
+                    await result
+
+        if hasattr(answer_source, '__aiter__'):
+            iterator = answer_source.__aiter__()
+
+            async def next_answer(number, question):
+                try:
+                    return await iterator.__anext__()
+                except StopAsyncIteration:
+                    return _NO_MORE_ANSWERS
+        elif callable(answer_source) and not hasattr(answer_source, '__next__'):
+            async def next_answer(number, question):
+                result = answer_source(number, question)
+                return await result if inspect.isawaitable(result) else result
+        else:
+            iterator = iter(answer_source)
+
+            async def next_answer(number, question):
+                return next(iterator, _NO_MORE_ANSWERS)
+
+        await emit(self._start_event())
+        for index in range(self.total_questions):
+            event = self._question_event(index)
+            await emit(event)
+            try:
+                user_answer_str = await next_answer(event.data['number'], event.data['question'])
+            except OSError:
+                # Błąd transportu (np. ConnectionError) przerywa sesję zamiast liczyć się jako błędna odpowiedź
+                raise
+            except Exception as e:
+                await emit(self._error_event(index, e))
+                continue
+            if user_answer_str is _NO_MORE_ANSWERS:
+                break
+            await emit(self.grade(index, user_answer_str))
+        await emit(self._finish_event())
+        return self.score, self.total_questions
+
+
+def print_quiz_event(event):
+    """Odbiorca zdarzeń wypisujący przebieg quizu w konsoli."""
+    data = event.data
+    if event.kind == EVENT_START:
+        print(f"\n--- Rozpoczynam quiz: {data['quiz_name']} ---")
+    elif event.kind == EVENT_QUESTION:
+        print(f"\nPytanie {data['number']}/{data['total_questions']}: {data['question']}")
+    elif event.kind == EVENT_CORRECT:
+        print("Poprawna odpowiedź!")
+    elif event.kind == EVENT_INCORRECT:
+        print(f"Błędna odpowiedź. Prawidłowa odpowiedź to: {data['correct_answer']}")
+    elif event.kind == EVENT_INPUT_ERROR:
+        print(f"Błąd wejścia: {data['message']}. Spróbuj ponownie.")
+    elif event.kind == EVENT_ZERO_DIVISION:
+        print("Wystąpił błąd dzielenia przez zero. To pytanie zostało pominięte.")
+    elif event.kind == EVENT_ERROR:
+        print(f"Wystąpił nieoczekiwany błąd podczas quizu: {data['message']}")
+    elif event.kind == EVENT_FINISH:
+        print(f"\n--- Koniec quizu: {data['quiz_name']} ---")
+        print(f"Twój wynik: {data['score']}/{data['total_questions']}")
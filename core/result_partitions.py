@@ -0,0 +1,122 @@
+"""
+Podział wyników na partycje według użytkownika.
+
+Wyniki użytkownika domyślnego (DEFAULT_USER) pozostają w dotychczasowym pliku wyników (np. data/results.csv),
+więc istniejące pliki bez kolumny użytkownika należą do niego bez żadnej konwersji.
+Wyniki pozostałych użytkowników trafiają do katalogu <plik wyników bez rozszerzenia>_users:
+  <nazwa>_<skrót>.csv - partycja jednego użytkownika (ten sam format co plik wyników),
+  users.lst           - manifest: identyfikatory użytkowników, po jednym w linii.
+Odczyt wyników użytkownika czyta tylko jego partycję.
+
+Przeniesienie dotychczasowej historii na konkretnego użytkownika:
+python -m core.result_partitions <plik wyników> <użytkownik>
+"""
+import argparse
+import csv
+import hashlib
+import os
+import re
+
+from core.result_writer import append_rows, lock_file, unlock_file
+
+DEFAULT_USER = "default"
+PARTITIONS_SUFFIX = "_users"
+MANIFEST_FILE = "users.lst"
+RESULTS_HEADER = ['Timestamp', 'Quiz', 'Score', 'TotalQuestions']
+
+
+def validate_user_id(user_id):
+    """Sprawdza identyfikator użytkownika (niepusty napis bez znaków nowej linii)."""
+    if not isinstance(user_id, str) or not user_id.strip() or '\n' in user_id or '\r' in user_id:
+        raise ValueError(f"Nieprawidłowy identyfikator użytkownika: {user_id!r}")
+    return user_id
+
+
+def partitions_dir(data_file):
+    """Zwraca katalog partycji użytkowników dla pliku wyników."""
+    return os.path.splitext(data_file)[0] + PARTITIONS_SUFFIX
+
+
+def partition_file(data_file, user_id):
+    """
+    Zwraca ścieżkę pliku wyników użytkownika.
+    Dla użytkownika domyślnego jest to sam plik wyników; dla pozostałych - bezpieczna
+    i jednoznaczna nazwa pliku w katalogu partycji.
+    """
+    validate_user_id(user_id)
+    if user_id == DEFAULT_USER:
+        return data_file
+    slug = re.sub(r'[^\w-]+', '_', user_id).strip('_')[:40] or "user"
+    digest = hashlib.sha1(user_id.encode('utf-8')).hexdigest()[:8]
+    return os.path.join(partitions_dir(data_file), f"{slug}_{digest}.csv")
+
+
+def register_user(data_file, user_id):
+    """Dopisuje użytkownika do manifestu partycji (jeśli go tam jeszcze nie ma)."""
+    if validate_user_id(user_id) == DEFAULT_USER:
+        return
+    directory = partitions_dir(data_file)
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, MANIFEST_FILE), 'a+', encoding='utf-8') as f:
+        lock_file(f)
+        try:
+            f.seek(0)
+            if user_id not in f.read().splitlines():
+                f.seek(0, os.SEEK_END)
+                f.write(user_id + "\n")
+        finally:
+            unlock_file(f)
+
+
+def list_users(data_file):
+    """Zwraca identyfikatory użytkowników mających partycję wyników (użytkownik domyślny jako pierwszy)."""
+    users = [DEFAULT_USER] if os.path.exists(data_file) else []
+    try:
+        with open(os.path.join(partitions_dir(data_file), MANIFEST_FILE), 'r', encoding='utf-8') as f:
+            users += [line for line in f.read().splitlines() if line and line != DEFAULT_USER]
+    except FileNotFoundError:
+        pass
+    return users
+
+
+def migrate_legacy_results(data_file, user_id):
+    """
+    Przenosi wyniki z pliku użytkownika domyślnego do partycji użytkownika user_id.
+    Oryginalny plik zostaje zachowany jako <plik>.migrated, a w jego miejscu powstaje pusty plik z nagłówkiem.
+    Zwraca liczbę przeniesionych wierszy.
+    """
+    if validate_user_id(user_id) == DEFAULT_USER:
+        return 0
+    with open(data_file, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        rows = [row for row in reader if len(row) == len(RESULTS_HEADER)]
+    moved = len(rows)
+
+    target = partition_file(data_file, user_id)
+    register_user(data_file, user_id)
+    if not os.path.exists(target) or os.path.getsize(target) == 0:
+        rows.insert(0, RESULTS_HEADER)
+    append_rows(target, rows, sync=True)
+
+    os.replace(data_file, data_file + ".migrated")
+    append_rows(data_file, [RESULTS_HEADER])
+    # Agregaty opisywały przeniesione wyniki - zostaną odbudowane przy pierwszym odczycie
+    aggregates_file = os.path.splitext(data_file)[0] + "_aggregates.json"
+    if os.path.exists(aggregates_file):
+        os.remove(aggregates_file)
+    return moved
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Przypisuje dotychczasowe wyniki do wybranego użytkownika.")
+    parser.add_argument("data_file", help="plik wyników (np. data/results.csv)")
+    parser.add_argument("user_id", help="identyfikator użytkownika")
+    args = parser.parse_args(argv)
+
+    count = migrate_legacy_results(os.path.abspath(args.data_file), args.user_id)
+    print(f"Przeniesiono wyników: {count}")
+
+
+if __name__ == "__main__":
+    main()
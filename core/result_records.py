@@ -0,0 +1,159 @@
+"""
+Strumieniowy odczyt wyników quizów jako zwartych rekordów.
+
+ResultRecord to krotka (timestamp, quiz, score, total_questions) - bez słownika na każdy wiersz
+z powtarzanymi kluczami. Nazwy quizów są internowane, więc wszystkie wyniki jednego quizu współdzielą
+jeden napis. Dla zgodności z kodem operującym na słownikach wyników (dawny format UserProgress.load_results)
+rekord obsługuje też indeksowanie nazwami kolumn CSV (record['Score']), get(), keys(), items() i dict(record).
+
+Znaczniki czasu mają stały format 'RRRR-MM-DD GG:MM:SS', więc przedziały czasu są porównywane
+jako napisy, bez parsowania dat.
+"""
+import csv
+import os
+import sys
+from collections import namedtuple
+from datetime import date, datetime
+
+from core.result_writer import TIMESTAMP_FORMAT
+
+_COLUMN_INDEX = {'Timestamp': 0, 'Quiz': 1, 'Score': 2, 'TotalQuestions': 3}
+TAIL_BLOCK_SIZE = 65536
+
+
+class ResultRecord(namedtuple('ResultRecord', ['timestamp', 'quiz', 'score', 'total_questions'])):
+    """Jeden wynik quizu (patrz opis modułu)."""
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if key.__class__ is str:
+            key = _COLUMN_INDEX[key]
+        return tuple.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        index = _COLUMN_INDEX.get(key)
+        return default if index is None else tuple.__getitem__(self, index)
+
+    @staticmethod
+    def keys():
+        return _COLUMN_INDEX.keys()
+
+    def items(self):
+        return zip(_COLUMN_INDEX, self)
+
+    def as_dict(self):
+        """Zwraca wynik jako słownik w formacie UserProgress.load_results."""
+        return {'Timestamp': self.timestamp, 'Quiz': self.quiz, 'Score': self.score,
+                'TotalQuestions': self.total_questions}
+
+
+def timestamp_bound(value):
+    """
+    Zamienia granicę przedziału czasu (napis 'RRRR-MM-DD[ GG:MM:SS]', date lub datetime) na pełny
+    znacznik czasu w formacie TIMESTAMP_FORMAT. None oznacza brak granicy.
+    """
+    if value is None:
+        return None
+    if isinstance(value, date):
+        return value.strftime(TIMESTAMP_FORMAT)
+    value = value.strip()
+    if len(value) == 10:
+        value += " 00:00:00"
+    datetime.strptime(value, TIMESTAMP_FORMAT)  # ValueError dla nieprawidłowego formatu
+    return value
+
+
+def parse_row(row):
+    """Zamienia wiersz CSV na ResultRecord; zwraca None dla wiersza z nieprawidłowymi danymi."""
+    if len(row) != 4:
+        return None
+    try:
+        return ResultRecord(row[0], sys.intern(row[1]), int(row[2]), int(row[3]))
+    except ValueError as ve:
+        print(f"Ostrzeżenie: Nieprawidłowy format danych w wierszu CSV: {row}. Błąd: {ve}")
+        return None
+
+
+def intern_records(rows):
+    """Zamienia wiersze (timestamp, quiz, score, total_questions) na rekordy z internowanymi nazwami quizów."""
+    intern = sys.intern
+    for timestamp, quiz, score, total_questions in rows:
+        yield ResultRecord(timestamp, intern(quiz), score, total_questions)
+
+
+def _reversed_lines(f, block_size):
+    """
+    Zwraca linie pliku binarnego od ostatniej do drugiej (pierwsza linia to nagłówek),
+    czytając plik blokami od końca.
+    """
+    f.seek(0, os.SEEK_END)
+    position = f.tell()
+    remainder = b''
+    while position > 0:
+        size = min(block_size, position)
+        position -= size
+        f.seek(position)
+        lines = (f.read(size) + remainder).split(b'\n')
+        # Pierwsza linia bloku może być niepełna - zostaje doklejona do poprzedniego bloku
+        remainder = lines[0]
+        yield [line.decode('utf-8') for line in reversed(lines[1:]) if line.strip()]
+
+
+def read_csv_records(data_file, newest_first=False):
+    """
+    Generator rekordów z pliku wyników CSV (z pominięciem nagłówka i nieprawidłowych wierszy).
+    newest_first: czyta plik od końca, więc pobranie N ostatnich wyników czyta tylko koniec pliku.
+    Odczyt od końca zakłada, że wiersz nie zawiera znaków nowej linii (nazwy quizów ich nie zawierają).
+    """
+    try:
+        if newest_first:
+            with open(data_file, 'rb') as f:
+                for lines in _reversed_lines(f, TAIL_BLOCK_SIZE):
+                    for row in csv.reader(lines):
+                        record = parse_row(row)
+                        if record is not None:
+                            yield record
+            return
+        with open(data_file, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            next(reader, None)  # Pominięcie nagłówka
+            for row in reader:
+                record = parse_row(row)
+                if record is not None:
+                    yield record
+    except FileNotFoundError:
+        print("Brak pliku wyników. Rozpocznij quizy, aby go utworzyć.")
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        print(f"Błąd podczas wczytywania wyników: {e}")
+
+
+def read_appended_rows(f):
+    """
+    Czyta plik binarny od bieżącej pozycji blokami i zwraca pary (wiersze CSV, liczba bajtów) dla pełnych linii.
+    Niedokończona ostatnia linia (np. właśnie dopisywana przez inny proces) jest pomijana,
+    więc suma bajtów wskazuje pozycję, od której warto czytać następnym razem.
+    """
+    pending = b''
+    while True:
+        block = f.read(TAIL_BLOCK_SIZE)
+        if not block:
+            return
+        data = pending + block
+        end = data.rfind(b'\n') + 1
+        pending = data[end:]
+        if end:
+            yield csv.reader(data[:end].decode('utf-8').splitlines()), end
+
+
+def filter_records(records, quiz_name=None, since=None, until=None):
+    """
+    Zwraca rekordy jednego quizu (quiz_name) z przedziału czasu [since, until).
+    since, until: pełne znaczniki czasu (patrz timestamp_bound) albo None
+    """
+    if quiz_name is not None:
+        records = (record for record in records if record.quiz == quiz_name)
+    if since is not None:
+        records = (record for record in records if record.timestamp >= since)
+    if until is not None:
+        records = (record for record in records if record.timestamp < until)
+    return records
@@ -0,0 +1,276 @@
+import atexit
+import csv
+import io
+import os
+import threading
+import time
+import weakref
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Otwarte obiekty zapisu z opóźnieniem - zamyka je przy wyjściu z programu jedna funkcja atexit
+_open_writers = weakref.WeakSet()
+
+# Ostatnio sformatowana sekunda i jej zapis tekstowy (znacznik czasu zmienia się raz na sekundę)
+_timestamp_cache = (None, "")
+
+
+def format_timestamp(now=None):
+    """Zwraca bieżący czas w formacie TIMESTAMP_FORMAT; strftime jest wywoływane najwyżej raz na sekundę."""
+    global _timestamp_cache
+    second = int(time.time() if now is None else now)
+    cached_second, text = _timestamp_cache
+    if cached_second != second:
+        text = time.strftime(TIMESTAMP_FORMAT, time.localtime(second))
+        _timestamp_cache = (second, text)
+    return text
+
+
+def _close_open_writers():
+    for writer in list(_open_writers):
+        writer.close()
+
+
+atexit.register(_close_open_writers)
+
+
+def lock_file(f):
+    """Zakłada wyłączną blokadę na otwarty plik (czeka, jeśli blokadę trzyma inny proces)."""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def unlock_file(f):
+    """Zwalnia blokadę założoną przez lock_file."""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def append_rows(data_file, rows, sync=False):
+    """
+    Dopisuje wiersze CSV do pliku jednym zapisem pod wyłączną blokadą pliku,
+    dzięki czemu kilka procesów może dopisywać do tego samego pliku bez przeplatania wierszy.
+    sync: wymusza zapis na dysk (fsync) przed zwolnieniem blokady
+    Zwraca krotkę (sygnatura_przed, sygnatura_po) - (rozmiar, mtime_ns) pliku zmierzone pod blokadą,
+    co pozwala stwierdzić, czy między zapisami plik zmienił ktoś inny.
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    with open(data_file, 'a', newline='', encoding='utf-8') as f:
+        lock_file(f)
+        try:
+            before = os.fstat(f.fileno())
+            f.write(buffer.getvalue())
+            f.flush()
+            if sync:
+                os.fsync(f.fileno())
+            after = os.fstat(f.fileno())
+        finally:
+            unlock_file(f)
+    return (before.st_size, before.st_mtime_ns), (after.st_size, after.st_mtime_ns)
+
+
+def write_csv_batch(data_file, rows, sync=False, on_written=None):
+    """
+    Dopisuje partię wierszy do pliku CSV (append_rows).
+    on_written: opcjonalna funkcja (wiersze, sygnatura_przed, sygnatura_po) wywoływana po zapisie niepustej partii
+    """
+    before, after = append_rows(data_file, rows, sync)
+    if on_written is not None and rows:
+        # Błąd obsługi nie może powodować ponownego zapisu już zapisanych wierszy
+        try:
+            on_written(rows, before, after)
+        except Exception as e:
+            print(f"Błąd podczas obsługi zapisanych wyników: {e}")
+
+
+class BufferedResultWriter:
+    """
+    Zapis wyników z opóźnieniem (write-behind).
+
+    Wiersze trafiają do kolejki w pamięci, a wątek w tle zapisuje je partiami jednym wywołaniem
+    append_rows - co flush_interval sekund albo gdy w kolejce zbierze się flush_size wierszy.
+    flush() i close() czekają na zapis wszystkich wierszy i wykonują fsync.
+    on_written: opcjonalna funkcja (wiersze, sygnatura_przed, sygnatura_po) wywoływana w wątku zapisu
+                po każdej zapisanej partii
+
+    Ten sam wątek może zapisywać również inne pliki (partycje) - partition() zwraca obiekt zapisu
+    do partycji, a każda partycja dostaje w jednym cyklu zapisu jedną partię swoich wierszy.
+    """
+
+    def __init__(self, data_file, flush_interval=1.0, flush_size=256, on_written=None):
+        if flush_interval <= 0 or flush_size <= 0:
+            raise ValueError("Interwał i rozmiar partii zapisu muszą być dodatnie.")
+        self.data_file = data_file
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self.on_written = on_written
+        self._pending = []  # pary (partycja, wiersz); None to plik data_file
+        self._partitions = {}  # {partycja: funkcja zapisu partii (wiersze, sync)}
+        self._unsynced = set()  # partycje zapisane bez fsync od ostatniego flush
+        self._condition = threading.Condition()
+        self._queued = 0    # liczba wierszy przyjętych do kolejki
+        self._written = 0   # liczba wierszy zapisanych do pliku
+        self._synced = 0    # liczba wierszy utrwalonych na dysku (fsync)
+        self._sync_requested = False
+        self._closed = False
+        self.last_error = None
+        self._thread = threading.Thread(target=self._run, name="result-writer", daemon=True)
+        self._thread.start()
+        _open_writers.add(self)
+
+    def write(self, row, partition=None):
+        """Dodaje wiersz do kolejki zapisu (nie blokuje na operacjach plikowych)."""
+        with self._condition:
+            if self._closed:
+                raise ValueError("Zapis wyników został zamknięty.")
+            self._pending.append((partition, row))
+            self._queued += 1
+            if len(self._pending) >= self.flush_size:
+                self._condition.notify_all()
+
+    def partition(self, key, write_batch):
+        """
+        Rejestruje partycję zapisywaną przez wątek tego obiektu i zwraca obiekt PartitionWriter.
+        key: identyfikator partycji (np. ścieżka pliku)
+        write_batch: funkcja (wiersze, sync) zapisująca partię wierszy partycji
+        """
+        with self._condition:
+            self._partitions[key] = write_batch
+        return PartitionWriter(self, key)
+
+    def remove_partition(self, key):
+        """Wyrejestrowuje partycję; jej niezapisane wiersze są odrzucane z ostrzeżeniem."""
+        with self._condition:
+            self._partitions.pop(key, None)
+            self._unsynced.discard(key)
+            lost = sum(1 for partition, _ in self._pending if partition == key)
+            if lost:
+                self._pending = [item for item in self._pending if item[0] != key]
+                self._queued -= lost
+        if lost:
+            print(f"Ostrzeżenie: Utracono {lost} niezapisanych wyników ({key}).")
+
+    def _write_batch(self, rows, sync):
+        """Zapisuje partię wierszy; podklasy mogą zapisywać do innego magazynu."""
+        write_csv_batch(self.data_file, rows, sync, self.on_written)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: len(self._pending) >= self.flush_size or self._sync_requested or self._closed,
+                    timeout=self.flush_interval)
+                items, self._pending = self._pending, []
+                sync, self._sync_requested = self._sync_requested, False
+                closed = self._closed
+                # Jedna partia na partycję; przy fsync także partycje zapisane wcześniej bez niego
+                batches = {}
+                for partition, row in items:
+                    batches.setdefault(partition, []).append(row)
+                if sync or closed:
+                    batches.setdefault(None, [])
+                    for partition in self._unsynced:
+                        batches.setdefault(partition, [])
+                writers = {partition: self._partitions.get(partition) for partition in batches
+                           if partition is not None}
+
+            if batches:
+                failed = []
+                error = None
+                for partition, rows in batches.items():
+                    write_batch = self._write_batch if partition is None else writers[partition]
+                    if write_batch is None:
+                        continue
+                    try:
+                        write_batch(rows, sync or closed)
+                    except Exception as e:
+                        error = e
+                        failed.extend((partition, row) for row in rows)
+                        print(f"Błąd zapisu do pliku: {e}")
+
+                with self._condition:
+                    self._written += len(items) - len(failed)
+                    if error is None and (sync or closed):
+                        self._synced = self._written
+                        self._unsynced.clear()
+                    else:
+                        self._unsynced.update(partition for partition, rows in batches.items() if rows)
+                    if error is not None:
+                        # Niezapisane wiersze wracają na początek kolejki i zostaną zapisane ponownie
+                        self._pending[:0] = failed
+                    self.last_error = error
+                    self._condition.notify_all()
+                if error is not None and closed:
+                    return
+            if closed and not self._pending:
+                return
+
+    def flush(self):
+        """
+        Czeka, aż wszystkie dotąd przyjęte wiersze zostaną zapisane i utrwalone na dysku.
+        Zgłasza OSError, jeśli zapis się nie powiódł (wiersze pozostają w kolejce).
+        """
+        with self._condition:
+            target = self._queued
+            self._sync_requested = True
+            self._condition.notify_all()
+            self.last_error = None
+            self._condition.wait_for(
+                lambda: self._synced >= target or self.last_error is not None or not self._thread.is_alive())
+            if self._synced < target:
+                raise OSError(f"Nie udało się zapisać wyników: {self.last_error}")
+
+    def close(self):
+        """
+        Zapisuje zaległe wiersze i zatrzymuje wątek zapisu.
+        Jeśli zapis się nie powiódł, wypisuje ostrzeżenie z liczbą utraconych wierszy.
+        """
+        _open_writers.discard(self)
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        with self._condition:
+            lost = len(self._pending)
+        if lost:
+            print(f"Ostrzeżenie: Nie zapisano {lost} wyników do {self.data_file}: {self.last_error}")
+
+
+class PartitionWriter:
+    """
+    Zapis wyników jednej partycji przez wspólny BufferedResultWriter (bez własnego wątku).
+    Ma te same metody co BufferedResultWriter: write, flush i close.
+    """
+
+    def __init__(self, shared, key):
+        self.shared = shared
+        self.key = key
+
+    def write(self, row):
+        self.shared.write(row, self.key)
+
+    def flush(self):
+        self.shared.flush()
+
+    def close(self):
+        """Zapisuje zaległe wiersze (wszystkich partycji) i wyrejestrowuje partycję; wątek zapisu działa dalej."""
+        try:
+            self.shared.flush()
+        except OSError as e:
+            print(f"Błąd zapisu do pliku: {e}")
+        self.shared.remove_partition(self.key)
@@ -0,0 +1,57 @@
+import math
+import random
+
+
+def make_rng(seed=None):
+    """
+    Zwraca generator liczb losowych.
+    Przy podanym ziarnie losowanie jest powtarzalne; przekazany obiekt random.Random jest zwracany bez zmian.
+    """
+    if isinstance(seed, random.Random):
+        return seed
+    return random.Random(seed)
+
+
+def sample_indices(population_size, k, seed=None):
+    """
+    Losuje k różnych indeksów z zakresu [0, population_size) bez tworzenia listy całej populacji.
+    Jeśli k >= population_size, zwraca wszystkie indeksy w kolejności.
+    """
+    if k >= population_size:
+        return list(range(population_size))
+    return make_rng(seed).sample(range(population_size), k)
+
+
+def reservoir_sample(iterable, k, seed=None):
+    """
+    Losuje k elementów z dowolnie długiego strumienia w jednym przejściu (algorytm L).
+    Pamięć jest proporcjonalna do k, a nie do długości strumienia.
+    Jeśli strumień ma nie więcej niż k elementów, zwraca je wszystkie w kolejności.
+    """
+    if k <= 0:
+        return []
+    rng = make_rng(seed)
+    iterator = iter(iterable)
+    reservoir = []
+    for item in iterator:
+        reservoir.append(item)
+        if len(reservoir) == k:
+            break
+    if len(reservoir) < k:
+        return reservoir
+
+    w = math.exp(math.log(rng.random()) / k)
+    while True:
+        # Liczba elementów do pominięcia przed kolejną podmianą w rezerwuarze
+        skip = math.floor(math.log(rng.random()) / math.log(1 - w))
+        try:
+            for _ in range(skip):
+                next(iterator)
+            item = next(iterator)
+        except StopIteration:
+            break
+        reservoir[rng.randrange(k)] = item
+        w *= math.exp(math.log(rng.random()) / k)
+
+    rng.shuffle(reservoir)
+    return reservoir
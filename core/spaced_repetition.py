@@ -0,0 +1,239 @@
+"""
+Powtórki w odstępach (algorytm SM-2) nad historią odpowiedzi na pojedyncze pytania.
+
+Każda odpowiedź jest dopisywana do dziennika CSV (Timestamp, User, Quiz, Question, Correct), gdzie Question
+to skrót treści pytania. Dla każdej pary (użytkownik, pytanie) przechowywany jest stan powtórek:
+liczba powtórek z rzędu, odstęp, współczynnik łatwości (EF), liczba pomyłek i termin kolejnej powtórki.
+
+Pytania każdego użytkownika w danym quizie są indeksowane kopcem według (termin, -słabość),
+więc wybór k pytań kosztuje O(k log n) niezależnie od liczby wszystkich par (użytkownik, pytanie).
+"""
+import csv
+import hashlib
+import heapq
+import os
+import threading
+import time
+
+from core.question_list import QuestionList
+from core.result_partitions import DEFAULT_USER
+from core.result_writer import append_rows
+
+LOG_HEADER = ['Timestamp', 'User', 'Quiz', 'Question', 'Correct']
+DAY = 24 * 60 * 60
+
+# Parametry SM-2: ocena odpowiedzi poprawnej i błędnej (skala 0-5), początkowy i minimalny EF
+QUALITY_CORRECT = 5
+QUALITY_INCORRECT = 2
+INITIAL_EASINESS = 2.5
+MIN_EASINESS = 1.3
+# Pytanie z błędną odpowiedzią wraca po 10 minutach
+RELEARN_DELAY = 10 * 60
+
+
+def question_key(quiz_name, question):
+    """Zwraca stały identyfikator pytania wyliczony z nazwy quizu i treści pytania."""
+    text = question['question'] if isinstance(question, dict) else str(question)
+    return hashlib.sha1(f"{quiz_name}\0{text}".encode('utf-8')).hexdigest()[:16]
+
+
+class ReviewState:
+    """Stan powtórek jednego pytania dla jednego użytkownika."""
+
+    __slots__ = ('repetitions', 'interval', 'easiness', 'due', 'attempts', 'lapses', 'version')
+
+    def __init__(self):
+        self.repetitions = 0
+        self.interval = 0.0  # w dniach
+        self.easiness = INITIAL_EASINESS
+        self.due = 0.0
+        self.attempts = 0
+        self.lapses = 0
+        # Numer wersji pozwala pomijać nieaktualne wpisy w kopcu
+        self.version = 0
+
+    @property
+    def weakness(self):
+        """Udział błędnych odpowiedzi (0 - zawsze poprawnie, 1 - zawsze błędnie)."""
+        return self.lapses / self.attempts if self.attempts else 0.0
+
+    def update(self, correct, now):
+        """Aktualizuje stan po odpowiedzi według SM-2."""
+        quality = QUALITY_CORRECT if correct else QUALITY_INCORRECT
+        self.attempts += 1
+        if correct:
+            self.repetitions += 1
+            if self.repetitions == 1:
+                self.interval = 1.0
+            elif self.repetitions == 2:
+                self.interval = 6.0
+            else:
+                self.interval = round(self.interval * self.easiness, 2)
+            self.due = now + self.interval * DAY
+        else:
+            self.repetitions = 0
+            self.interval = 0.0
+            self.lapses += 1
+            self.due = now + RELEARN_DELAY
+        self.easiness = max(MIN_EASINESS,
+                            self.easiness + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+        self.version += 1
+
+    def priority(self):
+        return self.due, -self.weakness
+
+
+class SpacedRepetitionScheduler:
+    """
+    Wybiera pytania do powtórki: najpierw zaległe (najwcześniejszy termin, przy równym - najsłabsze),
+    potem jeszcze nieznane, a na końcu te z najbliższym terminem.
+    log_file: dziennik odpowiedzi; None oznacza pracę tylko w pamięci.
+    """
+
+    def __init__(self, log_file=None):
+        self.log_file = log_file
+        self._lock = threading.Lock()
+        self._states = {}        # (użytkownik, quiz) -> {klucz_pytania: ReviewState}
+        self._heaps = {}         # (użytkownik, quiz) -> kopiec [(termin, -słabość, wersja, klucz_pytania)]
+        self._new_cursors = {}   # (użytkownik, quiz) -> pozycja, od której szukać niewidzianych pytań
+        self._question_maps = {}  # quiz -> (lista pytań, długość, klucze, {klucz: pozycja pytania})
+        if log_file is not None:
+            self._ensure_log_exists()
+            self.load()
+
+    def _ensure_log_exists(self):
+        """Tworzy dziennik odpowiedzi z nagłówkiem, jeśli jeszcze nie istnieje."""
+        if not os.path.exists(self.log_file):
+            os.makedirs(os.path.dirname(os.path.abspath(self.log_file)), exist_ok=True)
+            append_rows(self.log_file, [LOG_HEADER])
+
+    def load(self):
+        """Odtwarza stany powtórek z dziennika odpowiedzi."""
+        with self._lock:
+            self._states.clear()
+            self._heaps.clear()
+            self._new_cursors.clear()
+            try:
+                with open(self.log_file, 'r', newline='', encoding='utf-8') as f:
+                    reader = csv.reader(f)
+                    next(reader, None)
+                    for row in reader:
+                        try:
+                            timestamp, user_id, quiz_name, key, correct = row
+                            timestamp = float(timestamp)
+                        except ValueError:
+                            print(f"Ostrzeżenie: Pominięto nieprawidłowy wiersz dziennika odpowiedzi: {row}")
+                            continue
+                        states = self._states.setdefault((user_id, quiz_name), {})
+                        state = states.get(key)
+                        if state is None:
+                            state = states[key] = ReviewState()
+                        state.update(correct == '1', timestamp)
+            except FileNotFoundError:
+                pass
+            for group, states in self._states.items():
+                heap = [(*state.priority(), state.version, key) for key, state in states.items()]
+                heapq.heapify(heap)
+                self._heaps[group] = heap
+
+    def _questions_by_key(self, quiz_name, questions):
+        """Zwraca (klucze, {klucz: pozycja pytania}); wyliczane ponownie tylko po zmianie listy pytań."""
+        cached = self._question_maps.get(quiz_name)
+        if cached is not None and cached[0] is questions and cached[1] == len(questions):
+            return cached[2], cached[3]
+        # Dla QuestionList klucze liczymy z kolumny treści, bez tworzenia słownika każdego pytania
+        texts = questions.texts if isinstance(questions, QuestionList) else questions
+        keys = [question_key(quiz_name, q) for q in texts]
+        mapping = {key: position for position, key in enumerate(keys)}
+        self._question_maps[quiz_name] = (questions, len(questions), keys, mapping)
+        # Pozycje niewidzianych pytań odnosiły się do poprzedniej listy
+        for group in [group for group in self._new_cursors if group[1] == quiz_name]:
+            del self._new_cursors[group]
+        return keys, mapping
+
+    def select(self, quiz_name, questions, k, user_id=DEFAULT_USER, now=None):
+        """
+        Wybiera k pytań quizu dla użytkownika z listy questions (pytania spoza listy są pomijane).
+        Zwraca listę pytań w kolejności od najpilniejszego.
+        """
+        now = time.time() if now is None else now
+        group = (user_id, quiz_name)
+        with self._lock:
+            keys, by_key = self._questions_by_key(quiz_name, questions)
+            states = self._states.get(group, {})
+            heap = self._heaps.get(group, [])
+            selected = []
+            popped = []
+
+            def take_from_heap(due_only):
+                while heap and len(selected) < k:
+                    if due_only and heap[0][0] > now:
+                        return
+                    entry = heapq.heappop(heap)
+                    state = states.get(entry[3])
+                    if state is None or state.version != entry[2]:
+                        continue  # nieaktualny wpis - stan zmienił się po jego dodaniu
+                    popped.append(entry)
+                    if entry[3] in by_key:
+                        selected.append(questions[by_key[entry[3]]])
+
+            take_from_heap(due_only=True)
+
+            # Pytania jeszcze nieznane użytkownikowi, w kolejności z magazynu
+            cursor = self._new_cursors.get(group, 0)
+            position = cursor
+            while position < len(keys) and len(selected) < k:
+                if keys[position] not in states:
+                    selected.append(questions[by_key[keys[position]]])
+                elif position == cursor:
+                    cursor += 1
+                position += 1
+            self._new_cursors[group] = cursor
+
+            take_from_heap(due_only=False)
+
+            # Wybrane pytania zostają w indeksie do czasu udzielenia odpowiedzi
+            for entry in popped:
+                heapq.heappush(heap, entry)
+            return selected
+
+    def record(self, quiz_name, question, correct, user_id=DEFAULT_USER, now=None):
+        """Zapisuje odpowiedź na pytanie i przesuwa jego termin powtórki."""
+        self.record_many(quiz_name, [(question, correct)], user_id, now)
+
+    def record_many(self, quiz_name, outcomes, user_id=DEFAULT_USER, now=None):
+        """
+        Zapisuje wiele odpowiedzi naraz (jeden dopisek do dziennika).
+        outcomes: pary (pytanie, poprawna); odpowiedzi z wynikiem None (nieocenione) są pomijane.
+        """
+        now = time.time() if now is None else now
+        rows = []
+        with self._lock:
+            states = self._states.setdefault((user_id, quiz_name), {})
+            heap = self._heaps.setdefault((user_id, quiz_name), [])
+            for question, correct in outcomes:
+                if correct is None:
+                    continue
+                key = question_key(quiz_name, question)
+                state = states.get(key)
+                if state is None:
+                    state = states[key] = ReviewState()
+                state.update(correct, now)
+                heapq.heappush(heap, (*state.priority(), state.version, key))
+                rows.append([f"{now:.3f}", user_id, quiz_name, key, '1' if correct else '0'])
+            # Kopiec rośnie o nieaktualne wpisy; przebudowa, gdy stanowią większość
+            if len(heap) > 2 * len(states) + 64:
+                heap[:] = [(*state.priority(), state.version, key) for key, state in states.items()]
+                heapq.heapify(heap)
+
+        if rows and self.log_file is not None:
+            append_rows(self.log_file, rows)
+
+    def state(self, quiz_name, question, user_id=DEFAULT_USER):
+        """Zwraca stan powtórek pytania albo None, jeśli użytkownik jeszcze na nie nie odpowiadał."""
+        return self._states.get((user_id, quiz_name), {}).get(question_key(quiz_name, question))
+
+    def due_count(self, quiz_name, user_id=DEFAULT_USER, now=None):
+        """Zwraca liczbę pytań quizu, których termin powtórki już minął."""
+        now = time.time() if now is None else now
+        return sum(1 for state in self._states.get((user_id, quiz_name), {}).values() if state.due <= now)
@@ -0,0 +1,229 @@
+"""
+Wyniki quizów w bazie SQLite (moduł sqlite3 z biblioteki standardowej).
+
+Tabela results (timestamp, quiz, score, total_questions) ma indeks (quiz, timestamp, score, total_questions):
+zapytania o jeden quiz i przedziały czasu korzystają z jego początku (quiz, timestamp), a podsumowania
+per quiz (GROUP BY) są liczone przez SQLite z samego indeksu, bez czytania tabeli.
+Baza działa w trybie WAL, więc czytelnicy nie blokują zapisu, a kilka procesów może dopisywać wyniki
+(zapisy są szeregowane przez SQLite z oczekiwaniem do BUSY_TIMEOUT sekund).
+
+Konwersja z/do CSV: python -m core.sqlite_results do-sqlite|do-csv <źródło> <cel>
+"""
+import argparse
+import csv
+import os
+import sqlite3
+import threading
+
+from core.progress_aggregates import empty_summary
+from core.result_records import intern_records
+from core.result_writer import BufferedResultWriter
+
+CSV_HEADER = ['Timestamp', 'Quiz', 'Score', 'TotalQuestions']
+BUSY_TIMEOUT = 30.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    quiz TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    total_questions INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_quiz_timestamp ON results (quiz, timestamp, score, total_questions);
+"""
+
+
+class SqliteResults:
+    """Wyniki quizów w pliku bazy SQLite (patrz opis modułu)."""
+
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # Każdy wątek ma własne połączenie (np. wątek zapisu BufferedSqliteWriter)
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+        with self._connection() as connection:
+            connection.executescript(SCHEMA)
+
+    def _connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            # W trybie WAL synchronous=NORMAL nie grozi uszkodzeniem bazy, a oszczędza fsync przy każdym zapisie
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def close(self):
+        """Zamyka połączenia z bazą otwarte przez wszystkie wątki."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+    def __len__(self):
+        return self._connection().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def is_empty(self):
+        """Sprawdza, czy baza nie zawiera wyników (bez liczenia wszystkich wierszy)."""
+        return self._connection().execute("SELECT NOT EXISTS (SELECT 1 FROM results)").fetchone()[0] == 1
+
+    def quiz_names(self):
+        """Zwraca nazwy quizów obecnych w wynikach (alfabetycznie)."""
+        return [row[0] for row in self._connection().execute("SELECT DISTINCT quiz FROM results ORDER BY quiz")]
+
+    def append(self, rows, sync=False):
+        """
+        Dopisuje wiersze [znacznik_czasu, quiz, wynik, liczba_pytań] w jednej transakcji.
+        sync: wymusza utrwalenie transakcji na dysku przed powrotem
+        """
+        rows = [(str(row[0]), row[1], int(row[2]), int(row[3])) for row in rows]
+        if not rows:
+            return
+        connection = self._connection()
+        if sync:
+            connection.execute("PRAGMA synchronous=FULL")
+        try:
+            with connection:
+                connection.executemany(
+                    "INSERT INTO results (timestamp, quiz, score, total_questions) VALUES (?, ?, ?, ?)", rows)
+        finally:
+            if sync:
+                connection.execute("PRAGMA synchronous=NORMAL")
+
+    def summaries(self, quiz_name=None):
+        """
+        Zwraca podsumowania per quiz w formacie ProgressAggregates (count, total_score, total_questions,
+        min_score, max_score, last_timestamp) obliczone przez agregaty SQL.
+        quiz_name: ogranicza podsumowanie do jednego quizu (wyszukiwanie w indeksie)
+        """
+        query = ("SELECT quiz, COUNT(*), SUM(score), SUM(total_questions), MIN(score), MAX(score), MAX(timestamp) "
+                 "FROM results")
+        parameters = ()
+        if quiz_name is not None:
+            query += " WHERE quiz = ?"
+            parameters = (quiz_name,)
+        summaries = {}
+        for quiz, count, total_score, total_questions, min_score, max_score, last in \
+                self._connection().execute(query + " GROUP BY quiz", parameters):
+            summaries[quiz] = empty_summary()
+            summaries[quiz].update(count=count, total_score=total_score, total_questions=total_questions,
+                                   min_score=min_score, max_score=max_score, last_timestamp=last)
+        return summaries
+
+    def iter_rows(self, quiz_name=None):
+        """Zwraca iterator krotek (znacznik_czasu, quiz, wynik, liczba_pytań) w kolejności zapisu."""
+        if quiz_name is None:
+            return self._connection().execute(
+                "SELECT timestamp, quiz, score, total_questions FROM results ORDER BY id")
+        return self._connection().execute(
+            "SELECT timestamp, quiz, score, total_questions FROM results WHERE quiz = ? ORDER BY timestamp, id",
+            (quiz_name,))
+
+    def iter_records(self, quiz_name=None, since=None, until=None, limit=None, newest_first=False, offset=0):
+        """
+        Zwraca iterator rekordów ResultRecord; filtry, kolejność i limit są częścią zapytania SQL.
+        Wyniki jednego quizu są czytane z indeksu (quiz, timestamp) w kolejności czasu,
+        pozostałe - w kolejności zapisu. newest_first odwraca kolejność (np. ostatnie N wyników).
+        offset: pomija tyle pierwszych wybranych wyników (np. już przetworzonych)
+        """
+        conditions = []
+        parameters = []
+        for condition, value in (("quiz = ?", quiz_name), ("timestamp >= ?", since), ("timestamp < ?", until)):
+            if value is not None:
+                conditions.append(condition)
+                parameters.append(value)
+        order = ["timestamp", "id"] if quiz_name is not None else ["id"]
+        if newest_first:
+            order = [column + " DESC" for column in order]
+        query = "SELECT timestamp, quiz, score, total_questions FROM results"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY " + ", ".join(order)
+        if limit is not None or offset:
+            query += " LIMIT ? OFFSET ?"
+            parameters += [-1 if limit is None else limit, offset]
+        return intern_records(self._connection().execute(query, parameters))
+
+
+class BufferedSqliteWriter(BufferedResultWriter):
+    """Zapis wyników z opóźnieniem (jak BufferedResultWriter) do bazy SQLite - jedna transakcja na partię."""
+
+    def __init__(self, store, flush_interval=1.0, flush_size=256):
+        self.store = store
+        super().__init__(store.path, flush_interval, flush_size)
+
+    def _write_batch(self, rows, sync):
+        if rows:
+            self.store.append(rows, sync)
+
+
+def csv_to_sqlite(csv_path, db_path, chunk_size=65536):
+    """
+    Importuje plik wyników CSV do bazy SQLite (dopisując do istniejących wyników).
+    Wiersze z nieprawidłowymi danymi są pomijane, tak jak w UserProgress.load_results.
+    Zwraca liczbę zaimportowanych wierszy.
+    """
+    store = SqliteResults(db_path)
+    converted = 0
+    chunk = []
+    try:
+        with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            next(reader, None)  # Pominięcie nagłówka
+            for row in reader:
+                if len(row) != 4:
+                    continue
+                try:
+                    chunk.append([row[0], row[1], int(row[2]), int(row[3])])
+                except ValueError:
+                    print(f"Ostrzeżenie: Nieprawidłowy format danych w wierszu CSV: {row}.")
+                    continue
+                if len(chunk) >= chunk_size:
+                    store.append(chunk)
+                    converted += len(chunk)
+                    chunk = []
+        store.append(chunk)
+        converted += len(chunk)
+    finally:
+        store.close()
+    return converted
+
+
+def sqlite_to_csv(db_path, csv_path):
+    """Zapisuje wyniki z bazy SQLite do pliku CSV (z nagłówkiem). Zwraca liczbę wierszy."""
+    store = SqliteResults(db_path)
+    count = 0
+    try:
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_HEADER)
+            for row in store.iter_rows():
+                writer.writerow(row)
+                count += 1
+    finally:
+        store.close()
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Konwersja pliku wyników między CSV a bazą SQLite.")
+    parser.add_argument("kierunek", choices=["do-sqlite", "do-csv"])
+    parser.add_argument("zrodlo", help="plik CSV albo baza SQLite")
+    parser.add_argument("cel", help="baza SQLite albo plik CSV")
+    args = parser.parse_args(argv)
+    if args.kierunek == "do-sqlite":
+        count = csv_to_sqlite(args.zrodlo, args.cel)
+    else:
+        count = sqlite_to_csv(args.zrodlo, args.cel)
+    print(f"Przeniesiono wierszy: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Pomiar czasu uruchamiania aplikacji.
+
+Mierzone są:
+  - czas importu modułów (python -X importtime, łączny czas modułu wraz z zależnościami),
+  - czas od uruchomienia main.py do wyświetlenia pierwszego menu.
+Każdy pomiar odbywa się w nowym procesie, aby nie korzystać z modułów już załadowanych.
+
+Uruchomienie: python -m core.startup_benchmark [--runs N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PROJECT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# Moduły startowe aplikacji i limit łącznego czasu ich importu (sekundy)
+STARTUP_MODULES = ("core.quiz_manager", "core.user_progress", "main")
+IMPORT_TIME_BUDGET = 0.5
+# Ciężkie biblioteki, które nie mogą być importowane przy starcie
+LAZY_MODULES = ("matplotlib", "numpy")
+MENU_HEADER = "--- Trener Matematyczny ---"
+
+
+def _run_python(args, **kwargs):
+    return subprocess.run([sys.executable, *args], cwd=PROJECT_DIR, capture_output=True, text=True,
+                          encoding='utf-8', **kwargs)
+
+
+def measure_import_time(module):
+    """Zwraca łączny czas importu modułu (sekundy) zmierzony przez -X importtime w nowym procesie."""
+    completed = _run_python(["-X", "importtime", "-c", f"import {module}"])
+    if completed.returncode != 0:
+        raise RuntimeError(f"Nie udało się zaimportować modułu {module}: {completed.stderr.strip()}")
+    for line in completed.stderr.splitlines():
+        # Format: "import time: self [us] | cumulative | nazwa"
+        parts = line.split('|')
+        if len(parts) == 3 and parts[2].rstrip() == f" {module}":
+            return int(parts[1]) / 1_000_000
+    raise RuntimeError(f"Brak pomiaru importu modułu {module}.")
+
+
+def loaded_modules(modules):
+    """Zwraca zbiór nazw pakietów najwyższego poziomu załadowanych po imporcie podanych modułów."""
+    code = (f"import sys\nfor name in {list(modules)!r}: __import__(name)\n"
+            "print('\\n'.join(sorted({m.split('.')[0] for m in sys.modules})))")
+    completed = _run_python(["-c", code])
+    if completed.returncode != 0:
+        raise RuntimeError(f"Nie udało się zaimportować modułów: {completed.stderr.strip()}")
+    return set(completed.stdout.split())
+
+
+def measure_first_menu(timeout=30):
+    """Zwraca czas (sekundy) od uruchomienia main.py do wypisania pierwszego menu."""
+    env = dict(os.environ, PYTHONUNBUFFERED="1")
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "main.py"], cwd=PROJECT_DIR, stdin=subprocess.PIPE,
+                               stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, encoding='utf-8',
+                               env=env)
+    try:
+        deadline = start + timeout
+        for line in process.stdout:
+            if MENU_HEADER in line:
+                return time.perf_counter() - start
+            if time.perf_counter() > deadline:
+                break
+        raise RuntimeError("main.py nie wyświetlił menu.")
+    finally:
+        process.kill()
+        process.wait()
+
+
+def run_benchmark(runs=5):
+    """Wykonuje pomiary runs razy i zwraca słownik {nazwa_pomiaru: lista czasów w sekundach}."""
+    measurements = {f"import {module}": [] for module in STARTUP_MODULES}
+    measurements["main.py -> pierwsze menu"] = []
+    measurements["interpreter (python -c pass)"] = []
+    for _ in range(runs):
+        for module in STARTUP_MODULES:
+            measurements[f"import {module}"].append(measure_import_time(module))
+        measurements["main.py -> pierwsze menu"].append(measure_first_menu())
+        start = time.perf_counter()
+        _run_python(["-c", "pass"])
+        measurements["interpreter (python -c pass)"].append(time.perf_counter() - start)
+    return measurements
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pomiar czasu uruchamiania Trenera Matematycznego.")
+    parser.add_argument("--runs", type=int, default=5, help="liczba powtórzeń pomiaru")
+    args = parser.parse_args(argv)
+
+    for name, times in run_benchmark(args.runs).items():
+        print(f"{name:40s} mediana {statistics.median(times) * 1000:8.1f} ms   "
+              f"min {min(times) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
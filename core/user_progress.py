@@ -1,19 +1,84 @@
 import csv
-from datetime import datetime
+import itertools
 import os
-from core.visualization import plot_progress
+from collections import OrderedDict
+from core.columnar_results import BufferedColumnarWriter, ColumnarResults
+from core.metrics import timed
+from core.progress_aggregates import ProgressAggregates, file_signature
+from core.progress_stats import DEFAULT_WINDOW, STREAK_THRESHOLD, ProgressStats
+from core.result_partitions import DEFAULT_USER, partition_file, register_user
+from core.result_records import filter_records, parse_row, read_appended_rows, read_csv_records, timestamp_bound
+from core.result_writer import BufferedResultWriter, append_rows, format_timestamp, write_csv_batch
+
+BACKENDS = ("csv", "columnar", "sqlite")
+# Liczba obiektów innych użytkowników zapamiętywanych przez for_user (najdawniej używane są zamykane)
+USER_CACHE_SIZE = 64
 
 
 class UserProgress:
     """Zarządza zapisywaniem, odczytywaniem i analizowaniem postępów użytkownika."""
 
-    def __init__(self, data_file="../data/results.csv"):
+    def __init__(self, data_file="../data/results.csv", buffered=False, flush_interval=1.0, flush_size=256,
+                 backend="csv", user_id=None, shared_writer=None):
+        """
+        data_file: ścieżka do pliku wyników względem katalogu 'core'
+        buffered: zapis wyników z opóźnieniem przez wątek w tle (BufferedResultWriter)
+                  zamiast otwierania pliku przy każdym wyniku
+        flush_interval, flush_size: co ile sekund / po ilu wierszach zapisywać partię wyników
+        backend: "csv", "columnar" - wyniki w katalogu kolumnowym <data_file bez rozszerzenia>_columns
+                 (ColumnarResults), odczytywane bez parsowania przez mapowanie pamięci,
+                 albo "sqlite" - baza <data_file bez rozszerzenia>.sqlite3 (SqliteResults) ze statystykami
+                 liczonymi przez zapytania SQL
+        user_id: użytkownik, którego wyniki są zapisywane i analizowane; wyniki każdego użytkownika
+                 są w osobnej partycji (core.result_partitions), a None oznacza użytkownika domyślnego,
+                 czyli dotychczasowy plik wyników
+        shared_writer: BufferedResultWriter, którego wątek zapisuje wyniki w trybie buforowanym zamiast
+                       własnego wątku (for_user przekazuje zapis obiektu, z którego powstał)
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Nieznany format wyników: {backend}. Dostępne: {', '.join(BACKENDS)}")
+        self.backend = backend
+        self.user_id = DEFAULT_USER if user_id is None else user_id
         # Ścieżka do results.csv względem katalogu 'core'
-        self.__data_file = os.path.abspath(os.path.join(os.path.dirname(__file__), data_file))
+        self._results_file = os.path.abspath(os.path.join(os.path.dirname(__file__), data_file))
+        self.__data_file = partition_file(self._results_file, self.user_id)
+        if self.__data_file != self._results_file:
+            register_user(self._results_file, self.user_id)
+        self._options = {'buffered': buffered, 'flush_interval': flush_interval, 'flush_size': flush_size,
+                         'backend': backend}
+        self._users = OrderedDict()
+        # Statystyki kroczące według parametrów okna (window, days)
+        self._stats = {}
+        self._columnar = None
+        self._sqlite = None
+        if backend == "columnar":
+            self._columnar = ColumnarResults(os.path.splitext(self.__data_file)[0] + "_columns")
+        elif backend == "sqlite":
+            from core.sqlite_results import SqliteResults
+            self._sqlite = SqliteResults(os.path.splitext(self.__data_file)[0] + ".sqlite3")
         self._ensure_file_exists()
+        # Agregaty wyników per quiz, zapisywane obok pliku wyników
+        self._aggregates = ProgressAggregates(os.path.splitext(self.__data_file)[0] + "_aggregates.json")
+        self._writer = None
+        self._shared_writer = shared_writer
+        if buffered and shared_writer is not None:
+            self._writer = shared_writer.partition(self.__data_file, self._write_batch)
+        elif buffered and self._columnar is not None:
+            self._writer = BufferedColumnarWriter(self._columnar, flush_interval, flush_size)
+        elif buffered and self._sqlite is not None:
+            from core.sqlite_results import BufferedSqliteWriter
+            self._writer = BufferedSqliteWriter(self._sqlite, flush_interval, flush_size)
+        elif buffered:
+            self._writer = BufferedResultWriter(self.__data_file, flush_interval, flush_size,
+                                                on_written=self._aggregates.record_append)
+        if self._shared_writer is None and isinstance(self._writer, BufferedResultWriter):
+            self._shared_writer = self._writer
 
     def _ensure_file_exists(self):
         """Prywatna metoda upewniająca się, że plik CSV istnieje i ma nagłówki."""
+        if self._columnar is not None or self._sqlite is not None:
+            # Katalog wyników kolumnowych tworzy ColumnarResults, a bazę - SqliteResults
+            return
         os.makedirs(os.path.dirname(self.__data_file), exist_ok=True)
         try:
             with open(self.__data_file, 'x', newline='', encoding='utf-8') as f:
@@ -24,68 +89,253 @@ class UserProgress:
         except Exception as e:
             print(f"Błąd podczas tworzenia pliku wyników: {e}")
 
+    def _write_batch(self, rows, sync):
+        """Zapisuje partię wyników tego użytkownika (wywoływana w wątku wspólnego zapisu)."""
+        if self._columnar is not None:
+            if rows:
+                self._columnar.append(rows, sync)
+        elif self._sqlite is not None:
+            if rows:
+                self._sqlite.append(rows, sync)
+        else:
+            write_csv_batch(self.__data_file, rows, sync, self._aggregates.record_append)
+
+    @timed("results_save_seconds", quiz_arg="quiz_name")
     def save_results(self, quiz_name, score, total_questions):
-        """Zapisuje wyniki quizu do pliku CSV."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        """
+        Zapisuje wyniki quizu do pliku CSV.
+        W trybie buforowanym wiersz trafia do kolejki zapisu i jest zapisywany przez wątek w tle.
+        """
+        row = [format_timestamp(), quiz_name, score, total_questions]
+        if self._writer is not None:
+            self._writer.write(row)
+            return
         try:
-            with open(self.__data_file, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow([timestamp, quiz_name, score, total_questions])
+            if self._columnar is not None:
+                self._columnar.append([row])
+            elif self._sqlite is not None:
+                self._sqlite.append([row])
+            else:
+                before, after = append_rows(self.__data_file, [row])
+                self._aggregates.record_append([row], before, after)
             print("Wyniki zapisane pomyślnie.")
         except IOError as e:
             print(f"Błąd zapisu do pliku: {e}")
         except Exception as e:
             print(f"Wystąpił nieoczekiwany błąd podczas zapisu wyników: {e}")
 
+    def flush(self):
+        """Zapisuje na dysk wszystkie wyniki oczekujące w kolejce (tryb buforowany)."""
+        if self._writer is None:
+            return
+        try:
+            self._writer.flush()
+        except OSError as e:
+            print(f"Błąd zapisu do pliku: {e}")
+
+    def close(self):
+        """Zapisuje zaległe wyniki i zatrzymuje wątek zapisu (tryb buforowany)."""
+        for user_progress in self._users.values():
+            user_progress.close()
+        if self._writer is not None:
+            self._writer.close()
+        if self._sqlite is not None:
+            self._sqlite.close()
+
+    def for_user(self, user_id):
+        """
+        Zwraca obiekt UserProgress z tymi samymi ustawieniami dla partycji wyników innego użytkownika.
+        W trybie buforowanym wyniki wszystkich użytkowników zapisuje wątek zapisu tego obiektu.
+        Zapamiętywanych jest najwyżej USER_CACHE_SIZE obiektów - najdawniej używany jest zamykany
+        (jego wyniki zostają zapisane); pozostałe są zamykane razem z tym obiektem.
+        """
+        if user_id is None or user_id == self.user_id:
+            return self
+        user_progress = self._users.get(user_id)
+        if user_progress is not None:
+            self._users.move_to_end(user_id)
+            return user_progress
+        user_progress = UserProgress(self._results_file, user_id=user_id, shared_writer=self._shared_writer,
+                                     **self._options)
+        self._users[user_id] = user_progress
+        if len(self._users) > USER_CACHE_SIZE:
+            _, idle = self._users.popitem(last=False)
+            idle.close()
+        return user_progress
+
+    def iter_results(self, quiz_name=None, since=None, until=None, limit=None, newest_first=False):
+        """
+        Zwraca iterator wyników jako zwartych rekordów ResultRecord (core.result_records), bez wczytywania
+        całej historii do pamięci.
+        quiz_name: tylko wyniki wybranego quizu
+        since, until: przedział czasu [since, until) - napisy 'RRRR-MM-DD[ GG:MM:SS]', date lub datetime
+        limit: najwyżej tyle wyników; odczyt kończy się po ich znalezieniu
+        newest_first: wyniki od najnowszego - plik CSV jest wtedy czytany od końca
+        """
+        self.flush()
+        since, until = timestamp_bound(since), timestamp_bound(until)
+        if self._sqlite is not None:
+            return self._sqlite.iter_records(quiz_name, since, until, limit, newest_first)
+        if self._columnar is not None:
+            records = self._columnar.iter_records(quiz_name, since, until, newest_first)
+        else:
+            records = filter_records(read_csv_records(self.__data_file, newest_first), quiz_name, since, until)
+        return records if limit is None else itertools.islice(records, limit)
+
+    def last_results(self, count, quiz_name=None):
+        """Zwraca listę ostatnich count wyników (opcjonalnie jednego quizu) od najstarszego do najnowszego."""
+        records = list(self.iter_results(quiz_name, limit=count, newest_first=True))
+        records.reverse()
+        return records
+
+    @timed("results_load_seconds")
     def load_results(self):
-        """Wczytuje wszystkie wyniki z pliku CSV."""
-        results = []
+        """
+        Wczytuje wszystkie wyniki z pliku CSV (albo z wyników kolumnowych lub bazy SQLite) jako listę rekordów
+        ResultRecord; rekordy obsługują dostęp jak do słownika (record['Score']), a słownik zwraca as_dict().
+        """
+        return list(self.iter_results())
+
+    def get_aggregates(self, quiz_name=None):
+        """
+        Zwraca aktualne agregaty wyników per quiz (ProgressAggregates).
+        Agregaty są odbudowywane z pliku CSV tylko wtedy, gdy jego rozmiar lub czas modyfikacji
+        nie zgadzają się z zapisaną sygnaturą.
+        quiz_name: w bazie SQLite ogranicza agregaty do jednego quizu (pozostałe formaty zwracają wszystkie)
+        """
+        self.flush()
+        if self._columnar is not None:
+            # Wyniki kolumnowe są agregowane wektorowo przy każdym odczycie
+            aggregates = ProgressAggregates(None)
+            aggregates.quizzes = self._columnar.summaries()
+            return aggregates
+        if self._sqlite is not None:
+            # Podsumowania liczy SQLite (GROUP BY po indeksie), bez przenoszenia wierszy do Pythona
+            aggregates = ProgressAggregates(None)
+            aggregates.quizzes = self._sqlite.summaries(quiz_name)
+            return aggregates
+        aggregates = self._aggregates
+        signature = file_signature(self.__data_file)
+        if not aggregates.is_current(signature):
+            if not (aggregates.load() and aggregates.is_current(signature)):
+                aggregates.rebuild(self.iter_results(), signature)
+        return aggregates
+
+    def rolling_statistics(self, quiz_name=None, window=DEFAULT_WINDOW, days=None):
+        """
+        Zwraca statystyki kroczące (core.progress_stats) jednego quizu albo wszystkich wyników łącznie:
+        średnią, wariancję, minimum i maksimum procentu poprawnych odpowiedzi w oknie ostatnich window podejść
+        i/lub days dni, trend, serie dobrych wyników oraz liczbę podejść.
+        Statystyki są aktualizowane przyrostowo i zapisywane obok pliku wyników - kolejne wywołania
+        (również w następnych uruchomieniach) czytają tylko wyniki dopisane od poprzedniego.
+        """
+        return self._progress_stats(window, days).snapshot(quiz_name)
+
+    def rolling_statistics_per_quiz(self, window=DEFAULT_WINDOW, days=None):
+        """Zwraca słownik {nazwa_quizu: statystyki kroczące} (jak rolling_statistics)."""
+        return self._progress_stats(window, days).per_quiz()
+
+    def _stats_file(self, window, days):
+        """Plik JSON ze stanem statystyk kroczących o danych parametrach okna."""
+        return os.path.splitext(self.__data_file)[0] + f"_stats_{self.backend}_w{window or 0}_d{days or 0}.json"
+
+    def _progress_stats(self, window, days):
+        self.flush()
+        key = (window, days)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = ProgressStats(window, days, path=self._stats_file(window, days))
+            stats.load()
+        position = stats.position
+        if not self._update_stats(stats):
+            # Wyniki zostały zastąpione - statystyki są liczone od początku
+            stats = self._stats[key] = ProgressStats(window, days, path=stats.path)
+            position = None
+            self._update_stats(stats)
+        if stats.position != position:
+            stats.save()
+        return stats
+
+    def _update_stats(self, stats):
+        """
+        Uwzględnia w statystykach wyniki dopisane od ostatniej aktualizacji.
+        Zwraca False, gdy źródło wyników zostało w międzyczasie zastąpione lub skrócone.
+        """
+        store = self._columnar if self._columnar is not None else self._sqlite
+        if store is not None:
+            # Pozycja to liczba przetworzonych wierszy (wyniki są tylko dopisywane)
+            position = stats.position or 0
+            if len(store) < position:
+                return False
+            stats.position = position + stats.add_records(store.iter_records(offset=position))
+            return True
+
+        # Pozycja w pliku CSV to (numer i-węzła, przesunięcie w bajtach za ostatnią pełną linią)
         try:
-            with open(self.__data_file, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                next(reader)  # Pominięcie nagłówka
-                for row in reader:
-                    if len(row) == 4:
-                        try:
-                            results.append({
-                                'Timestamp': row[0],
-                                'Quiz': row[1],
-                                'Score': int(row[2]),
-                                'TotalQuestions': int(row[3])
-                            })
-                        except ValueError as ve:
-                            print(f"Ostrzeżenie: Nieprawidłowy format danych w wierszu CSV: {row}. Błąd: {ve}")
-                            continue
+            with open(self.__data_file, 'rb') as f:
+                info = os.fstat(f.fileno())
+                if stats.position is None:
+                    f.readline()  # Pominięcie nagłówka
+                    offset = f.tell()
+                else:
+                    inode, offset = stats.position
+                    if inode != info.st_ino or info.st_size < offset:
+                        return False
+                    f.seek(offset)
+                for rows, size in read_appended_rows(f):
+                    stats.add_records(filter(None, map(parse_row, rows)))
+                    offset += size
         except FileNotFoundError:
-            print("Brak pliku wyników. Rozpocznij quizy, aby go utworzyć.")
-        except Exception as e:
+            return stats.position is None
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
             print(f"Błąd podczas wczytywania wyników: {e}")
-        return results
+            return True
+        stats.position = (info.st_ino, offset)
+        return True
 
+    def render_charts(self, output_dir, workers=None, **options):
+        """
+        Renderuje bez ekranu wykres ogólny i wykresy wszystkich quizów do katalogu output_dir.
+        workers: liczba procesów roboczych; options: parametry ChartRenderer (figsize, dpi, bucket, max_points)
+        Zwraca słownik {nazwa_quizu albo None dla wykresu ogólnego: ścieżka pliku}.
+        """
+        from core.chart_renderer import render_progress_charts, results_to_columns
+
+        if self._columnar is not None:
+            self.flush()
+            columns = self._columnar.columns()
+            return render_progress_charts(output_dir, columns['timestamps'], columns['quiz_ids'], columns['scores'],
+                                          columns['totals'], self._columnar.quiz_names(), workers, **options)
+        return render_progress_charts(output_dir, *results_to_columns(self.load_results()), workers, **options)
+
+    @timed("progress_analyze_seconds", quiz_arg="quiz_name")
     def analyze_progress(self, quiz_name=None, visualize=False):
         """
         Analizuje postępy użytkownika, opcjonalnie filtrując po nazwie quizu.
-        Wykorzystuje programowanie funkcyjne (filter, lambda) oraz wizualizację.
+        Statystyki pochodzą z agregatów per quiz i zapisanych statystyk kroczących, więc nie wymagają
+        wczytywania całej historii (poza pierwszym wyliczeniem statystyk kroczących dla pliku wyników);
+        wyniki są czytane (strumieniowo) tylko do wizualizacji.
         """
-        all_results = self.load_results()
+        aggregates = self.get_aggregates(quiz_name)
+        overall = aggregates.summary()
 
-        if not all_results:
+        # Agregaty z SQLite mogą obejmować tylko wybrany quiz - wtedy pustość sprawdzamy osobno
+        if not overall['count'] and not (quiz_name and self._sqlite is not None and not self._sqlite.is_empty()):
             print("Brak danych do analizy.")
             return
 
         if quiz_name:
-            filtered_results = list(filter(lambda r: r['Quiz'] == quiz_name, all_results))
-            if not filtered_results:
+            summary = aggregates.summary(quiz_name)
+            if not summary['count']:
                 print(f"Brak wyników dla quizu '{quiz_name}'.")
                 return
-            results_to_analyze = filtered_results
             print(f"\n--- Analiza postępów dla quizu: {quiz_name} ---")
         else:
-            results_to_analyze = all_results
+            summary = overall
             print("\n--- Analiza ogólnych postępów ---")
 
-        total_score = sum(result['Score'] for result in results_to_analyze)
-        total_questions = sum(result['TotalQuestions'] for result in results_to_analyze)
+        total_score = summary['total_score']
+        total_questions = summary['total_questions']
 
         if total_questions == 0:
             print("Brak pytań do analizy.")
@@ -96,30 +346,39 @@ class UserProgress:
         print(f"Łączna liczba pytań: {total_questions}")
         print(f"Ogólny procent poprawności: {overall_percentage:.2f}%")
 
-        scores_only = list(map(lambda r: r['Score'], results_to_analyze))
-        if scores_only:
-            max_score = max(scores_only)
-            min_score = min(scores_only)
-            print(f"Najlepszy wynik w quizie: {max_score}")
-            print(f"Najgorszy wynik w quizie: {min_score}")
+        print(f"Najlepszy wynik w quizie: {summary['max_score']}")
+        print(f"Najgorszy wynik w quizie: {summary['min_score']}")
 
-        if not quiz_name:
-            quiz_summary = {}
-            for result in all_results:
-                q_name = result['Quiz']
-                if q_name not in quiz_summary:
-                    quiz_summary[q_name] = {'total_score': 0, 'total_questions': 0}
-                quiz_summary[q_name]['total_score'] += result['Score']
-                quiz_summary[q_name]['total_questions'] += result['TotalQuestions']
+        stats = self.rolling_statistics(quiz_name)
+        if stats['window_count']:
+            print(f"\nOstatnie podejścia ({stats['window_count']}): średnio {stats['mean']:.2f}%, "
+                  f"odchylenie standardowe {stats['stddev']:.2f}, zakres {stats['min']:.2f}-{stats['max']:.2f}%")
+            if stats['trend'] is not None:
+                print(f"Trend: {stats['trend']:+.2f} pkt proc. na podejście")
+            print(f"Seria wyników co najmniej {STREAK_THRESHOLD:.0f}%: obecna {stats['current_streak']}, "
+                  f"najdłuższa {stats['best_streak']}")
 
+        if not quiz_name:
             print("\nWyniki per quiz:")
-            for q_name, data in quiz_summary.items():
+            for q_name, data in aggregates.per_quiz().items():
                 if data['total_questions'] > 0:
                     percentage = (data['total_score'] / data['total_questions']) * 100
                     print(f"  {q_name}: {data['total_score']}/{data['total_questions']} ({percentage:.2f}%)")
                 else:
                     print(f"  {q_name}: Brak pytań do analizy.")
 
-        if visualize:
+        if visualize and self._columnar is not None:
+            # matplotlib jest importowany dopiero przy pierwszym wykresie (skraca start aplikacji)
+            from core.visualization import plot_progress_columns
+            columns = self._columnar.columns()
+            if quiz_name:
+                mask = columns['quiz_ids'] == self._columnar.quiz_names().index(quiz_name)
+                columns = {name: column[mask] for name, column in columns.items()}
+            print("Generowanie wykresu postępów...")
+            plot_progress_columns(columns['timestamps'], columns['scores'], columns['totals'], quiz_name)
+        elif visualize:
+            from core.visualization import plot_progress
+            # Wykres jest budowany strumieniowo z rekordów, bez listy słowników całej historii;
+            # w SQLite wyniki jednego quizu są wybierane przez indeks (quiz, timestamp)
             print("Generowanie wykresu postępów...")
-            plot_progress(results_to_analyze, quiz_name)
\ No newline at end of file
+            plot_progress(self.iter_results(quiz_name), quiz_name)
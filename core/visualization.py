@@ -1,37 +1,75 @@
 import matplotlib.pyplot as plt
-from datetime import datetime
 import os
+from array import array
 
+from core.metrics import timed
+from core.progress_series import DEFAULT_MAX_POINTS, MARKER_LIMIT, prepare_series
 
-def plot_progress(results, quiz_name=None):
+# Domyślna ścieżka zapisu wykresu (katalog data obok katalogu 'core')
+DEFAULT_PLOT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data', 'plot.png'))
+
+
+@timed("plot_progress_seconds", quiz_arg="quiz_name")
+def plot_progress(results, quiz_name=None, bucket=None, max_points=DEFAULT_MAX_POINTS,
+                  output_path=DEFAULT_PLOT_PATH, show=True):
     """
     Generuje wykres postępów użytkownika.
-    results: lista słowników wyników
+    results: słowniki wyników albo rekordy ResultRecord (lista lub iterator, np. UserProgress.iter_results)
     quiz_name: nazwa quizu, jeśli wizualizujemy konkretny quiz
+    bucket: opcjonalna agregacja wyników w przedziałach czasu ("hour", "day", "week") -
+            rysowana jest średnia z pasmem min/max
+    max_points: maksymalna liczba rysowanych punktów (None - bez ograniczenia)
+    output_path: plik, do którego zapisywany jest wykres (None - bez zapisu)
+    show: czy wyświetlić okno wykresu (False dla pracy bez ekranu)
+    Do renderowania wielu wykresów bez ekranu służy core.chart_renderer.ChartRenderer.
     """
-    if not results:
+    import numpy as np
+
+    # Jedno przejście po wynikach - results może być strumieniem rekordów (UserProgress.iter_results)
+    timestamps = []
+    scores = array('q')
+    totals = array('q')
+    for res in results:
+        timestamps.append(res['Timestamp'])
+        scores.append(res['Score'])
+        totals.append(res['TotalQuestions'])
+    if not timestamps:
         print("Brak danych do wygenerowania wykresu.")
         return
 
-    dates = []
-    percentages = []
+    # Parsowanie znaczników czasu i obliczenia procentów odbywają się na tablicach NumPy
+    timestamps = np.array(timestamps, dtype='datetime64[s]')
+    scores = np.frombuffer(scores, dtype=np.int64)
+    totals = np.frombuffer(totals, dtype=np.int64)
+    dates, percentages, band = prepare_series(timestamps.astype(np.int64), scores, totals, bucket, max_points)
+    _draw_progress(dates, percentages, quiz_name, band, output_path, show)
 
-    sorted_results = sorted(results, key=lambda x: datetime.strptime(x['Timestamp'], "%Y-%m-%d %H:%M:%S"))
 
-    for res in sorted_results:
-        date_obj = datetime.strptime(res['Timestamp'], "%Y-%m-%d %H:%M:%S")
-        dates.append(date_obj)
+@timed("plot_progress_seconds", quiz_arg="quiz_name")
+def plot_progress_columns(timestamps, scores, totals, quiz_name=None, bucket=None, max_points=DEFAULT_MAX_POINTS,
+                          output_path=DEFAULT_PLOT_PATH, show=True):
+    """
+    Generuje wykres postępów z kolumn liczbowych (np. z ColumnarResults.columns()).
+    timestamps: tablica sekund od 1970-01-01 00:00:00 czasu lokalnego
+    scores, totals: tablice wyników i liczby pytań
+    quiz_name, bucket, max_points, output_path, show: jak w plot_progress
+    """
+    import numpy as np
 
-        score = res['Score']
-        total = res['TotalQuestions']
+    if len(timestamps) == 0:
+        print("Brak danych do wygenerowania wykresu.")
+        return
+
+    dates, percentages, band = prepare_series(np.asarray(timestamps, dtype=np.int64), np.asarray(scores),
+                                          np.asarray(totals), bucket, max_points)
+    _draw_progress(dates, percentages, quiz_name, band, output_path, show)
 
-        if total > 0:
-            percentages.append((score / total) * 100)
-        else:
-            percentages.append(0)
 
+def _draw_progress(dates, percentages, quiz_name, band=None, output_path=DEFAULT_PLOT_PATH, show=True):
     plt.figure(figsize=(10, 6))
-    plt.plot(dates, percentages, marker='o', linestyle='-')
+    plt.plot(dates, percentages, marker='o' if len(dates) <= MARKER_LIMIT else None, linestyle='-')
+    if band is not None:
+        plt.fill_between(dates, band[0], band[1], alpha=0.2)
 
     if quiz_name:
         plt.title(f'Postępy w quizie: {quiz_name}')
@@ -44,16 +82,17 @@ def plot_progress(results, quiz_name=None):
     plt.xticks(rotation=45)
     plt.tight_layout()
 
+    if output_path:
+        output_dir = os.path.dirname(output_path)
+        try:
+            if output_dir and not os.path.exists(output_dir):
+                os.makedirs(output_dir)
+                print(f"Utworzono katalog: {output_dir}")
+            plt.savefig(output_path)
+        except Exception as e:
+            print(f"Błąd zapisu wykresu do pliku {output_path}: {e}")
 
-    path_to_plot = '../data/plot.png'
-    output_dir = os.path.dirname(path_to_plot)
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-        print(f"Utworzono katalog: {output_dir}")
-
-    try:
-        plt.savefig(path_to_plot)
-    except Exception as e:
-        pass
-
-    plt.show()
\ No newline at end of file
+    if show:
+        plt.show()
+    else:
+        plt.close()
@@ -1,13 +1,31 @@
+import argparse
+import os
+import sys
+
 from core.quiz_manager import QuizManager
 from core.user_progress import UserProgress
 from core.utils import get_positive_integer_input
 
+# Dziennik odpowiedzi na pojedyncze pytania używany przez harmonogram powtórek
+QUESTION_LOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "question_log.csv")
+
+
+def create_quiz_manager(spaced_repetition=False):
+    """Tworzy menedżera quizów; spaced_repetition włącza wybór pytań według harmonogramu powtórek."""
+    if not spaced_repetition:
+        return QuizManager()
+    from core.spaced_repetition import SpacedRepetitionScheduler
 
+    return QuizManager(scheduler=SpacedRepetitionScheduler(QUESTION_LOG_FILE))
 
-def main():
-    """Główna funkcja aplikacji Trener Matematyczny."""
-    quiz_manager = QuizManager()
-    user_progress = UserProgress()
+
+def main(spaced_repetition=False, user_id=None):
+    """
+    Główna funkcja aplikacji Trener Matematyczny.
+    user_id: użytkownik, którego wyniki są zapisywane i analizowane (None - użytkownik domyślny)
+    """
+    quiz_manager = create_quiz_manager(spaced_repetition)
+    user_progress = UserProgress(user_id=user_id)
 
     while True:
         print("\n--- Trener Matematyczny ---")
@@ -44,8 +62,9 @@ def main():
 
             try:
                 quiz_instance, questions_data = quiz_manager.get_quiz_instance_and_questions(selected_quiz_name,
-                                                                                             num_questions)
-                score, total_questions = quiz_manager.run_quiz(quiz_instance, questions_data)
+                                                                                             num_questions,
+                                                                                             user_id=user_id)
+                score, total_questions = quiz_manager.run_quiz(quiz_instance, questions_data, user_id)
                 user_progress.save_results(selected_quiz_name, score, total_questions)
             except ValueError as e:
                 print(f"Błąd: {e}")
@@ -137,9 +156,6 @@ def main():
                             print("Nieprawidłowy numer. Spróbuj ponownie.")
                     except ValueError:
                         print("Wprowadź liczbę.")
-            elif choice == '4':
-                print("Dziękujemy za skorzystanie z Trenera Matematycznego!")
-                break
             else:
                 selected_quiz_name = input("Brak quizów. Podaj nazwę nowego quizu: ").strip()
 
@@ -153,9 +169,133 @@ def main():
                 print(f"✅ Dodano pytanie do quizu: {selected_quiz_name}")
             except Exception as e:
                 print(f"❌ Błąd podczas dodawania pytania: {e}")
+        elif choice == '4':
+            print("Dziękujemy za skorzystanie z Trenera Matematycznego!")
+            break
         else:
             print("Nieprawidłowa opcja. Wybierz ponownie.")
 
 
+def run_script(script_file, spaced_repetition=False, user_id=None):
+    """
+    Uruchamia sesję konsolową bez udziału użytkownika: kolejne wybory i odpowiedzi są czytane
+    z pliku (jedna na wiersz) zamiast z klawiatury. Pozwala wielokrotnie odtwarzać ten sam przebieg
+    sesji, np. przy profilowaniu (--profile). Sesja kończy się opcją 4 albo na końcu pliku.
+    """
+    stdin = sys.stdin
+    with open(script_file, 'r', encoding='utf-8') as f:
+        sys.stdin = f
+        try:
+            main(spaced_repetition, user_id)
+        except EOFError:
+            print("\nKoniec skryptu sesji.")
+        finally:
+            sys.stdin = stdin
+
+
+def run_server(host, port, unix_path=None, reload_interval=None, spaced_repetition=False):
+    """
+    Uruchamia serwer quizów obsługujący wielu użytkowników jednocześnie.
+    reload_interval: co ile sekund sprawdzać zmiany pytań i modułów quizów (None - bez przeładowywania)
+    spaced_repetition: wybór pytań według harmonogramu powtórek zamiast losowania
+    """
+    import asyncio
+    from core.quiz_server import QuizServer
+
+    # Przy wielu sesjach wyniki są zapisywane partiami przez wątek w tle
+    user_progress = UserProgress(buffered=True)
+    quiz_manager = create_quiz_manager(spaced_repetition)
+    if reload_interval:
+        quiz_manager.enable_hot_reload(reload_interval)
+    quiz_server = QuizServer(quiz_manager, user_progress)
+    try:
+        asyncio.run(quiz_server.serve_forever(host, port, unix_path))
+    except KeyboardInterrupt:
+        print("Serwer zatrzymany.")
+    finally:
+        if quiz_manager.reloader is not None:
+            quiz_manager.reloader.stop()
+        user_progress.close()
+
+
+def run_client(host, port, unix_path=None, user_id=None):
+    """Uruchamia konsolowego klienta serwera quizów."""
+    import asyncio
+    from core.quiz_client import run_console_client
+
+    try:
+        asyncio.run(run_console_client(host, port, unix_path, user_id))
+    except ConnectionError as e:
+        print(f"Błąd połączenia z serwerem: {e}")
+    except ValueError as e:
+        print(f"Błąd: {e}")
+
+
+def render_charts(output_dir, workers=None, user_id=None):
+    """Renderuje bez ekranu wykresy postępów (ogólny i dla każdego quizu) do podanego katalogu."""
+    paths = UserProgress(user_id=user_id).render_charts(output_dir, workers)
+    if paths.get(None) is None:
+        print("Brak danych do wygenerowania wykresu.")
+        return
+    saved = [path for path in paths.values() if path]
+    print(f"Zapisano wykresów: {len(saved)} w katalogu {os.path.abspath(output_dir)}")
+
+
+def parse_args(argv=None):
+    from core.quiz_server import DEFAULT_HOST, DEFAULT_PORT
+
+    parser = argparse.ArgumentParser(description="Trener Matematyczny")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--serve", action="store_true", help="uruchom serwer quizów dla wielu użytkowników")
+    mode.add_argument("--client", action="store_true", help="połącz się z serwerem quizów")
+    mode.add_argument("--charts", metavar="KATALOG", help="zapisz wykresy postępów do katalogu (bez okna)")
+    mode.add_argument("--skrypt", metavar="PLIK",
+                      help="sesja konsolowa z wyborami i odpowiedziami czytanymi z pliku (jedna na wiersz)")
+    parser.add_argument("--reload", type=float, metavar="SEKUNDY",
+                        help="serwer: przeładowuj zmienione pytania i quizy co podaną liczbę sekund")
+    parser.add_argument("--powtorki", dest="spaced", action="store_true",
+                        help="wybieraj pytania według harmonogramu powtórek (SM-2) zamiast losowo")
+    parser.add_argument("--user", help="identyfikator użytkownika, którego wyniki są zapisywane i analizowane")
+    parser.add_argument("--metryki", metavar="PLIK",
+                        help="zbieraj metryki czasów operacji i zapisz je przy wyjściu do pliku "
+                             "(.json - JSON, inne - format tekstowy Prometheus)")
+    parser.add_argument("--profile", metavar="KATALOG", nargs="?", const="profile",
+                        help="profiluj sesję (cProfile i tracemalloc) i zapisz wyniki do katalogu "
+                             "(domyślnie %(const)s)")
+    parser.add_argument("--workers", type=int, help="liczba procesów renderujących wykresy")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="adres serwera (domyślnie %(default)s)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port serwera (domyślnie %(default)s)")
+    parser.add_argument("--unix", metavar="ŚCIEŻKA", help="użyj gniazda Unix zamiast TCP")
+    return parser.parse_args(argv)
+
+
+def run_session(args):
+    """Uruchamia tryb pracy wybrany argumentami wiersza poleceń."""
+    if args.serve:
+        run_server(args.host, args.port, args.unix, args.reload, args.spaced)
+    elif args.client:
+        run_client(args.host, args.port, args.unix, args.user)
+    elif args.charts:
+        render_charts(args.charts, args.workers, args.user)
+    elif args.skrypt:
+        run_script(args.skrypt, args.spaced, args.user)
+    else:
+        main(args.spaced, args.user)
+
+
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    if args.metryki:
+        from core import metrics
+        metrics.enable()
+    try:
+        if args.profile:
+            from core.profiling import SessionProfiler
+
+            with SessionProfiler(args.profile):
+                run_session(args)
+        else:
+            run_session(args)
+    finally:
+        if args.metryki:
+            metrics.REGISTRY.save(args.metryki)
@@ -1,11 +1,26 @@
+import random
+
+from core.answer_matchers import arithmetic_answer
+from core.batch_grading import grade_int_batch
+from core.question_batch import QuestionBatch
+from core.quiz_registry import register_quiz
+
+
+@register_quiz
 class BasicArithmeticQuiz:
     """Klasa reprezentująca quiz z podstawowej arytmetyki."""
 
+    # Statyczna nazwa quizu - odczytywana przy wykrywaniu quizów bez importowania modułu
+    quiz_name = "Podstawowa Arytmetyka"
+
+    # Dostępne działania; dzielenie generuje zawsze wynik całkowity
+    OPERATIONS = "+-*/"
+
     def __init__(self):
         pass # Pytania są teraz ładowane z JSON
 
     def get_name(self):
-        return "Podstawowa Arytmetyka"
+        return self.quiz_name
 
     def check_answer(self, user_answer_str, correct_answer):
         """
@@ -14,20 +29,94 @@ class BasicArithmeticQuiz:
         correct_answer: poprawna odpowiedź (z JSON, może być int/float)
         """
         try:
-            if isinstance(correct_answer, float):
-                user_answer = float(user_answer_str)
-                # Porównanie z tolerancją dla floatów
-                return abs(user_answer - correct_answer) < 1e-6
-            elif isinstance(correct_answer, int):
-                user_answer = int(user_answer_str)
-                return user_answer == correct_answer
-            else:
-                # Fallback, jeśli typ z JSON jest nieoczekiwany
-                return user_answer_str == str(correct_answer)
+            # Matcher wybiera porównanie według typu odpowiedzi: float z tolerancją, int albo napis
+            return arithmetic_answer(correct_answer).matches(user_answer_str)
         except ValueError:
             # Użytkownik wprowadził coś, co nie jest liczbą
             return False
         except Exception as e:
             # Ogólna obsługa błędów, np. ZeroDivisionError jeśli w jakiś sposób dojdzie do eval(1/0)
             print(f"Błąd podczas sprawdzania odpowiedzi: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    def check_answers(self, user_answers, correct_answers):
+        """
+        Sprawdza wiele odpowiedzi naraz (parsowanie liczb całkowitych na tablicach NumPy).
+        Zwraca listę wartości bool identyczną z wywołaniem check_answer dla każdej pary.
+        """
+        return grade_int_batch(user_answers, correct_answers, self.check_answer)
+
+    @classmethod
+    def _check_difficulty(cls, min_operand, max_operand, operations):
+        if min_operand > max_operand:
+            raise ValueError("Minimalny operand nie może być większy od maksymalnego.")
+        if not operations or any(op not in cls.OPERATIONS for op in operations):
+            raise ValueError(f"Dozwolone działania to: {cls.OPERATIONS}")
+        if '/' in operations and max_operand < 1:
+            raise ValueError("Dzielenie wymaga dodatniego maksymalnego operandu.")
+
+    @staticmethod
+    def _format_question(left, operation, right):
+        return f"Ile to {left} {operation} {right}?"
+
+    def generate_questions(self, count=None, seed=None, min_operand=1, max_operand=20, operations=OPERATIONS):
+        """
+        Generuje pytania arytmetyczne z odpowiedziami obliczonymi w chwili generowania.
+        count: liczba pytań (None oznacza nieskończony generator)
+        seed: ziarno losowania dla powtarzalnych zestawów
+        min_operand, max_operand: zakres operandów (dla dzielenia - zakres dzielnika i wyniku)
+        operations: napis z działaniami do losowania, np. "+-"
+        """
+        self._check_difficulty(min_operand, max_operand, operations)
+        rng = random.Random(seed)
+        generated = 0
+        while count is None or generated < count:
+            operation = rng.choice(operations)
+            left = rng.randint(min_operand, max_operand)
+            if operation == '/':
+                right = rng.randint(max(1, min_operand), max_operand)
+                answer = left
+                left = left * right
+            else:
+                right = rng.randint(min_operand, max_operand)
+                if operation == '+':
+                    answer = left + right
+                elif operation == '-':
+                    answer = left - right
+                else:
+                    answer = left * right
+            yield {"question": self._format_question(left, operation, right), "answer": answer}
+            generated += 1
+
+    def generate_batch(self, size, seed=None, min_operand=1, max_operand=20, operations=OPERATIONS):
+        """
+        Generuje partię pytań wektorowo (NumPy). Parametry jak w generate_questions.
+        Zwraca QuestionBatch z kolumnami 'left', 'operation', 'right' i 'answer'.
+        """
+        import numpy as np
+
+        self._check_difficulty(min_operand, max_operand, operations)
+        rng = np.random.default_rng(seed)
+        codes = np.frombuffer(operations.encode('ascii'), dtype=np.uint8)
+        operation = codes[rng.integers(0, len(codes), size)]
+        left = rng.integers(min_operand, max_operand, size, dtype=np.int64, endpoint=True)
+        right = rng.integers(min_operand, max_operand, size, dtype=np.int64, endpoint=True)
+
+        division = operation == ord('/')
+        if division.any():
+            divisors = rng.integers(max(1, min_operand), max_operand, size, dtype=np.int64, endpoint=True)
+            right = np.where(division, divisors, right)
+
+        # Przy dzieleniu wylosowany lewy operand jest wynikiem, a dzielna to jego iloczyn z dzielnikiem
+        answer = np.select(
+            [operation == ord('+'), operation == ord('-'), operation == ord('*')],
+            [left + right, left - right, left * right],
+            default=left
+        )
+        left = np.where(division, left * right, left)
+
+        return QuestionBatch(
+            {"left": left, "operation": operation, "right": right, "answer": answer},
+            lambda row: self._format_question(row["left"], chr(row["operation"]), row["right"]),
+            lambda row: row["answer"]
+        )
@@ -1,13 +1,26 @@
+import random
 from fractions import Fraction
 
+from core.answer_matchers import fraction_answer
+from core.batch_grading import grade_fraction_batch
+from core.question_batch import QuestionBatch
+from core.quiz_registry import register_quiz
+
+
+@register_quiz
 class FractionsQuiz:
     """Klasa reprezentująca quiz z ułamków."""
 
+    quiz_name = "Ułamki"
+
+    OPERATIONS = "+-*"
+    DENOMINATORS = (2, 3, 4, 5, 6, 8, 10, 12)
+
     def __init__(self):
         pass
 
     def get_name(self):
-        return "Ułamki"
+        return self.quiz_name
 
     def check_answer(self, user_answer_str, correct_answer):
         """
@@ -16,12 +29,101 @@ class FractionsQuiz:
         correct_answer: poprawna odpowiedź (z JSON, oczekujemy stringa "licznik/mianownik")
         """
         try:
-            user_fraction = Fraction(user_answer_str)
             # Zakładamy, że correct_answer z JSON jest stringiem "licznik/mianownik"
-            correct_fraction = Fraction(str(correct_answer))
-            return user_fraction == correct_fraction
+            return fraction_answer(correct_answer).matches(user_answer_str)
         except ValueError:
             return False
         except Exception as e:
             print(f"Błąd podczas sprawdzania odpowiedzi: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    def check_answers(self, user_answers, correct_answers):
+        """
+        Sprawdza wiele odpowiedzi naraz (parsowanie ułamków porównywanych przez mnożenie na krzyż).
+        Zwraca listę wartości bool identyczną z wywołaniem check_answer dla każdej pary.
+        """
+        return grade_fraction_batch(user_answers, correct_answers, self.check_answer)
+
+    @classmethod
+    def _check_difficulty(cls, denominators, operations):
+        if not denominators or any(d < 2 for d in denominators):
+            raise ValueError("Mianowniki muszą być liczbami całkowitymi większymi od 1.")
+        if max(denominators) > 10 ** 6:
+            raise ValueError("Mianowniki nie mogą przekraczać 1000000.")
+        if not operations or any(op not in cls.OPERATIONS for op in operations):
+            raise ValueError(f"Dozwolone działania to: {cls.OPERATIONS}")
+
+    @staticmethod
+    def _format_question(a, b, operation, c, d):
+        return f"Ile to {a}/{b} {operation} {c}/{d}?"
+
+    @staticmethod
+    def _format_answer(numerator, denominator):
+        # Ten sam zapis co str(Fraction): "3/4" albo "2" dla liczby całkowitej
+        return str(numerator) if denominator == 1 else f"{numerator}/{denominator}"
+
+    def generate_questions(self, count=None, seed=None, denominators=DENOMINATORS, operations=OPERATIONS):
+        """
+        Generuje pytania o działania na ułamkach właściwych z odpowiedziami w postaci skróconej.
+        count: liczba pytań (None oznacza nieskończony generator)
+        seed: ziarno losowania dla powtarzalnych zestawów
+        denominators: mianowniki do losowania
+        operations: napis z działaniami do losowania, np. "+-"
+        Przy odejmowaniu większy ułamek jest zawsze pierwszy, więc wynik jest nieujemny.
+        """
+        self._check_difficulty(denominators, operations)
+        rng = random.Random(seed)
+        generated = 0
+        while count is None or generated < count:
+            operation = rng.choice(operations)
+            b, d = rng.choice(denominators), rng.choice(denominators)
+            a, c = rng.randint(1, b - 1), rng.randint(1, d - 1)
+            if operation == '-' and Fraction(a, b) < Fraction(c, d):
+                a, b, c, d = c, d, a, b
+            if operation == '+':
+                result = Fraction(a, b) + Fraction(c, d)
+            elif operation == '-':
+                result = Fraction(a, b) - Fraction(c, d)
+            else:
+                result = Fraction(a, b) * Fraction(c, d)
+            yield {
+                "question": self._format_question(a, b, operation, c, d),
+                "answer": self._format_answer(result.numerator, result.denominator)
+            }
+            generated += 1
+
+    def generate_batch(self, size, seed=None, denominators=DENOMINATORS, operations=OPERATIONS):
+        """
+        Generuje partię pytań wektorowo (NumPy). Parametry jak w generate_questions.
+        Zwraca QuestionBatch z kolumnami operandów oraz skróconym licznikiem i mianownikiem wyniku.
+        """
+        import numpy as np
+
+        self._check_difficulty(denominators, operations)
+        rng = np.random.default_rng(seed)
+        denominator_values = np.asarray(denominators, dtype=np.int64)
+        codes = np.frombuffer(operations.encode('ascii'), dtype=np.uint8)
+        operation = codes[rng.integers(0, len(codes), size)]
+        b = denominator_values[rng.integers(0, len(denominator_values), size)]
+        d = denominator_values[rng.integers(0, len(denominator_values), size)]
+        # Liczniki z zakresu [1, mianownik - 1] dają ułamki właściwe
+        a = 1 + (rng.random(size) * (b - 1)).astype(np.int64)
+        c = 1 + (rng.random(size) * (d - 1)).astype(np.int64)
+
+        swap = (operation == ord('-')) & (a * d < c * b)
+        a, b, c, d = np.where(swap, c, a), np.where(swap, d, b), np.where(swap, a, c), np.where(swap, b, d)
+
+        multiplication = operation == ord('*')
+        cross = np.where(operation == ord('-'), -c * b, c * b)
+        numerator = np.where(multiplication, a * c, a * d + cross)
+        denominator = b * d
+        divisor = np.gcd(numerator, denominator)
+        numerator //= divisor
+        denominator //= divisor
+
+        return QuestionBatch(
+            {"a": a, "b": b, "operation": operation, "c": c, "d": d,
+             "answer_numerator": numerator, "answer_denominator": denominator},
+            lambda row: self._format_question(row["a"], row["b"], chr(row["operation"]), row["c"], row["d"]),
+            lambda row: self._format_answer(row["answer_numerator"], row["answer_denominator"])
+        )
@@ -1,13 +1,22 @@
 import random
 
+from core.answer_matchers import parse_int
+from core.batch_grading import grade_int_batch
+from core.question_batch import QuestionBatch
+from core.quiz_registry import register_quiz
+
+
+@register_quiz
 class PowersQuiz:
     """Klasa reprezentująca quiz z potęg."""
 
+    quiz_name = "Potęgi"
+
     def __init__(self):
         pass
 
     def get_name(self):
-        return "Potęgi"
+        return self.quiz_name
 
     def check_answer(self, user_answer_str, correct_answer):
         """
@@ -16,10 +25,68 @@ class PowersQuiz:
         correct_answer: poprawna odpowiedź (z JSON, int)
         """
         try:
-            user_answer = int(user_answer_str)
-            return user_answer == correct_answer
+            # Poprawna odpowiedź jest liczbą całkowitą i nie wymaga kompilacji do matchera;
+            # najczęstszy zapis (same cyfry ASCII) sprawdzamy bez wywoływania parse_int
+            if user_answer_str.__class__ is str and user_answer_str.isdigit() and user_answer_str.isascii():
+                return int(user_answer_str) == correct_answer
+            user_answer = parse_int(user_answer_str)
+            return user_answer is not None and user_answer == correct_answer
         except ValueError:
             return False
         except Exception as e:
             print(f"Błąd podczas sprawdzania odpowiedzi: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    def check_answers(self, user_answers, correct_answers):
+        """
+        Sprawdza wiele odpowiedzi naraz (parsowanie liczb całkowitych na tablicach NumPy).
+        Zwraca listę wartości bool identyczną z wywołaniem check_answer dla każdej pary.
+        """
+        return grade_int_batch(user_answers, correct_answers, self.check_answer)
+
+    @staticmethod
+    def _check_difficulty(min_base, max_base, min_exponent, max_exponent):
+        if min_base > max_base or min_exponent > max_exponent:
+            raise ValueError("Wartości minimalne nie mogą być większe od maksymalnych.")
+        if min_exponent < 0:
+            raise ValueError("Wykładnik musi być nieujemny.")
+        if max(abs(min_base), abs(max_base)) ** max_exponent >= 2 ** 63:
+            raise ValueError("Zakres podstaw i wykładników przekracza zakres liczb 64-bitowych.")
+
+    @staticmethod
+    def _format_question(base, exponent):
+        return f"Ile to {base} do potęgi {exponent} ({base}^{exponent})?"
+
+    def generate_questions(self, count=None, seed=None, min_base=2, max_base=10, min_exponent=0, max_exponent=4):
+        """
+        Generuje pytania o potęgi z odpowiedziami obliczonymi w chwili generowania.
+        count: liczba pytań (None oznacza nieskończony generator)
+        seed: ziarno losowania dla powtarzalnych zestawów
+        min_base, max_base: zakres podstaw
+        min_exponent, max_exponent: zakres wykładników
+        """
+        self._check_difficulty(min_base, max_base, min_exponent, max_exponent)
+        rng = random.Random(seed)
+        generated = 0
+        while count is None or generated < count:
+            base = rng.randint(min_base, max_base)
+            exponent = rng.randint(min_exponent, max_exponent)
+            yield {"question": self._format_question(base, exponent), "answer": base ** exponent}
+            generated += 1
+
+    def generate_batch(self, size, seed=None, min_base=2, max_base=10, min_exponent=0, max_exponent=4):
+        """
+        Generuje partię pytań wektorowo (NumPy). Parametry jak w generate_questions.
+        Zwraca QuestionBatch z kolumnami 'base', 'exponent' i 'answer'.
+        """
+        import numpy as np
+
+        self._check_difficulty(min_base, max_base, min_exponent, max_exponent)
+        rng = np.random.default_rng(seed)
+        base = rng.integers(min_base, max_base, size, dtype=np.int64, endpoint=True)
+        exponent = rng.integers(min_exponent, max_exponent, size, dtype=np.int64, endpoint=True)
+        return QuestionBatch(
+            {"base": base, "exponent": exponent, "answer": np.power(base, exponent)},
+            lambda row: self._format_question(row["base"], row["exponent"]),
+            lambda row: row["answer"]
+        )
@@ -0,0 +1,88 @@
+import unittest
+import os
+import sys
+from fractions import Fraction
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from math_trainer.core.answer_matchers import (FractionAnswer, arithmetic_answer, fraction_answer, int_answer,
+                                               parse_fraction, parse_int)
+
+USER_ANSWERS = ["12", " 12 ", "-3", "+4", "007", "1_2", "١٢", "", "abc", "1.5", " .5", "1e1", "3/4",
+                " -3/4 ", "6/8", "3/0", "3 / 4", "0.75", "inf", "nan", "\x1c12", "12\n", "٣/٤", "1/2/3"]
+CORRECT_ANSWERS = [12, -3, 12.0, 1.5, 0.75, 10.0, True, "3/4", "-3/4", "12", "abc", "1/0", None]
+
+
+def outcome(function, *args):
+    """Zwraca wynik wywołania albo typ zgłoszonego wyjątku."""
+    try:
+        return function(*args)
+    except Exception as e:
+        return type(e)
+
+
+def reference_arithmetic(user_answer_str, correct_answer):
+    if isinstance(correct_answer, float):
+        return abs(float(user_answer_str) - correct_answer) < 1e-6
+    if isinstance(correct_answer, int):
+        return int(user_answer_str) == correct_answer
+    return user_answer_str == str(correct_answer)
+
+
+def reference_fraction(user_answer_str, correct_answer):
+    return Fraction(user_answer_str) == Fraction(str(correct_answer))
+
+
+def reference_int(user_answer_str, correct_answer):
+    return int(user_answer_str) == correct_answer
+
+
+class TestAnswerMatchers(unittest.TestCase):
+    """Testy zgodności matcherów z bezpośrednim użyciem int(), float() i Fraction()."""
+
+    def assert_same_as_reference(self, matcher, reference):
+        for correct_answer in CORRECT_ANSWERS:
+            for user_answer in USER_ANSWERS:
+                with self.subTest(user_answer=user_answer, correct_answer=correct_answer):
+                    expected = outcome(reference, user_answer, correct_answer)
+                    # Odpowiedź nieprawidłowa (ValueError) jest w quizach oceniana jako błędna
+                    if expected is ValueError:
+                        expected = False
+                    actual = outcome(lambda: matcher(correct_answer).matches(user_answer))
+                    self.assertEqual(False if actual is ValueError else actual, expected)
+
+    def test_arithmetic(self):
+        """Testuje zgodność matchera arytmetyki z dotychczasowym sprawdzaniem odpowiedzi."""
+        self.assert_same_as_reference(arithmetic_answer, reference_arithmetic)
+
+    def test_fraction(self):
+        """Testuje zgodność matchera ułamków z porównaniem obiektów Fraction."""
+        self.assert_same_as_reference(fraction_answer, reference_fraction)
+
+    def test_int(self):
+        """Testuje zgodność matchera liczb całkowitych z porównaniem int()."""
+        self.assert_same_as_reference(int_answer, reference_int)
+
+    def test_parsers(self):
+        """Testuje parsowanie odpowiedzi bez wyjątków dla nieprawidłowych zapisów."""
+        self.assertEqual(parse_int(" -07 "), -7)
+        self.assertIsNone(parse_int("abc"))
+        self.assertEqual(parse_int("1_000"), 1000)
+        self.assertEqual(parse_fraction("6/8"), (6, 8))
+        self.assertEqual(parse_fraction("0.75"), (3, 4))
+        self.assertIsNone(parse_fraction("3 / 4"))
+        with self.assertRaises(ZeroDivisionError):
+            parse_fraction("1/0")
+
+    def test_matchers_are_cached(self):
+        """Testuje zapamiętywanie matcherów według typu i wartości odpowiedzi."""
+        self.assertIs(fraction_answer("3/4"), fraction_answer("3/4"))
+        self.assertIsNot(arithmetic_answer(1), arithmetic_answer(1.0))
+        matcher = FractionAnswer("6/8")
+        self.assertEqual((matcher.numerator, matcher.denominator), (3, 4))
+        # Odpowiedź niehaszowalna jest kompilowana bez pamięci podręcznej
+        self.assertFalse(int_answer([1]).matches("1"))
+
+
+if __name__ == '__main__':
+    unittest.main()
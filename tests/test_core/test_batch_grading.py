@@ -0,0 +1,57 @@
+import unittest
+import os
+import sys
+import random
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from math_trainer.core.batch_grading import parse_int_batch, parse_fraction_batch
+from math_trainer.quizzes.basic_arithmetic import BasicArithmeticQuiz
+from math_trainer.quizzes.fractionss import FractionsQuiz
+from math_trainer.quizzes.powers import PowersQuiz
+
+
+class TestBatchGrading(unittest.TestCase):
+    """Testy dla wektorowego oceniania odpowiedzi."""
+
+    INT_INPUTS = ['5', '-5', '+5', ' 7 ', '\t8\n', '007', '0', '1_000', 'abc', '', '  ', '+', '--5', '4.0',
+                  '٣', '\x1c5', '5\x00', '1 2', '5/1', '99999999999999999999', None, 5]
+    FRACTION_INPUTS = ['3/4', '6/8', '-3/4', '+1/2', ' 3/4 ', '2', '0/5', '3/-4', '1/0', '3 / 4', '0.5', '1_0/2',
+                       '/2', '1/', '3/4/5', '9999999999/3', '', 'abc', None]
+
+    def test_parse_int_batch(self):
+        """Testuje parsowanie liczb całkowitych i maskę szybkiej ścieżki."""
+        values, ok = parse_int_batch(['12', ' -7 ', '+3', '1_000', 'x', '٣'])
+        self.assertEqual(ok.tolist(), [True, True, True, False, False, False])
+        self.assertEqual(values[ok].tolist(), [12, -7, 3])
+
+    def test_parse_fraction_batch(self):
+        """Testuje parsowanie ułamków na pary licznik/mianownik."""
+        numerators, denominators, ok = parse_fraction_batch(['3/4', '-2', '1/0', '3 / 4', ' 5/10'])
+        self.assertEqual(ok.tolist(), [True, True, False, False, True])
+        self.assertEqual(list(zip(numerators[ok].tolist(), denominators[ok].tolist())), [(3, 4), (-2, 1), (5, 10)])
+
+    @patch('builtins.print')
+    def test_batch_matches_scalar_path(self, mock_print):
+        """Testuje, czy wyniki check_answers są identyczne z wywołaniami check_answer."""
+        rng = random.Random(0)
+        cases = [
+            (BasicArithmeticQuiz(), self.INT_INPUTS, [5, -5, 7, 8, 0, 1000, 4.0, 2.5, True, 10 ** 20, 'x', None]),
+            (PowersQuiz(), self.INT_INPUTS, [5, -5, 7, 8, 0, 1000, 4.0, 10 ** 20, '5']),
+            (FractionsQuiz(), self.FRACTION_INPUTS, ['3/4', '1/2', 2, 0, '-3/4', 0.5, '1/0', 'abc', True, None]),
+        ]
+        for quiz, user_pool, correct_pool in cases:
+            user_answers = [rng.choice(user_pool) for _ in range(3000)]
+            correct_answers = [rng.choice(correct_pool) for _ in range(3000)]
+            expected = [quiz.check_answer(u, c) for u, c in zip(user_answers, correct_answers)]
+            self.assertEqual(quiz.check_answers(user_answers, correct_answers), expected, quiz.get_name())
+
+    def test_length_mismatch(self):
+        """Testuje odrzucenie list odpowiedzi o różnej długości."""
+        with self.assertRaises(ValueError):
+            PowersQuiz().check_answers(['1', '2'], [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
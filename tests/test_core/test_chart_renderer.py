@@ -0,0 +1,86 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from math_trainer.core.chart_renderer import (ChartRenderer, chart_filename, render_progress_charts,
+                                              results_to_columns)
+
+RESULTS = [
+    {'Timestamp': '2023-01-01 10:00:00', 'Quiz': 'Quiz A', 'Score': 5, 'TotalQuestions': 10},
+    {'Timestamp': '2023-01-02 11:00:00', 'Quiz': 'Quiz B/1', 'Score': 8, 'TotalQuestions': 10},
+    {'Timestamp': '2023-01-03 12:00:00', 'Quiz': 'Quiz A', 'Score': 7, 'TotalQuestions': 10}
+]
+
+
+def is_png(path):
+    with open(path, 'rb') as f:
+        return f.read(8) == b"\x89PNG\r\n\x1a\n"
+
+
+class TestChartRenderer(unittest.TestCase):
+    """Testy dla renderowania wykresów bez ekranu."""
+
+    def setUp(self):
+        """Konfiguracja przed każdym testem."""
+        self.output_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Czyszczenie po każdym teście."""
+        shutil.rmtree(self.output_dir)
+
+    def test_chart_filename(self):
+        """Testuje bezpieczne i jednoznaczne nazwy plików wykresów."""
+        self.assertEqual(chart_filename(None), "postepy_ogolne.png")
+        self.assertNotIn("/", chart_filename("Quiz B/1"))
+        self.assertNotEqual(chart_filename("Quiz A"), chart_filename("Quiz_A"))
+
+    def test_results_to_columns(self):
+        """Testuje zamianę wyników na kolumny numpy."""
+        timestamps, quiz_ids, scores, totals, quiz_names = results_to_columns(RESULTS)
+        self.assertEqual(quiz_names, ["Quiz A", "Quiz B/1"])
+        self.assertEqual(quiz_ids.tolist(), [0, 1, 0])
+        self.assertEqual(scores.tolist(), [5, 8, 7])
+        self.assertEqual(int(timestamps[1] - timestamps[0]), 25 * 3600)
+
+    @patch('matplotlib.pyplot.show')
+    @patch('matplotlib.pyplot.figure')
+    def test_render_dataset_reuses_figure(self, mock_figure, mock_show):
+        """Testuje renderowanie wszystkich wykresów na jednej figurze bez wyświetlania."""
+        renderer = ChartRenderer(self.output_dir)
+        figure = renderer.figure
+        paths = renderer.render_dataset(*results_to_columns(RESULTS))
+
+        self.assertEqual(set(paths), {None, "Quiz A", "Quiz B/1"})
+        self.assertTrue(all(is_png(path) for path in paths.values()))
+        self.assertIs(renderer.figure, figure)
+        self.assertEqual(len(figure.axes), 1)
+        mock_figure.assert_not_called()
+        mock_show.assert_not_called()
+
+    def test_render_empty_series(self):
+        """Testuje pominięcie wykresu bez danych."""
+        renderer = ChartRenderer(self.output_dir)
+        self.assertIsNone(renderer.render([], [], []))
+
+    @patch('builtins.print')
+    def test_render_error_is_reported(self, mock_print):
+        """Testuje zgłoszenie błędu zapisu wykresu."""
+        renderer = ChartRenderer(self.output_dir)
+        renderer.output_dir = os.path.join(self.output_dir, "brak")
+        self.assertIsNone(renderer.render([0], [1], [2]))
+        self.assertTrue(mock_print.call_args[0][0].startswith("Błąd zapisu wykresu"))
+
+    def test_render_with_process_pool(self):
+        """Testuje renderowanie wykresów w procesach roboczych."""
+        paths = render_progress_charts(self.output_dir, *results_to_columns(RESULTS), workers=2, bucket="day")
+        self.assertEqual(set(paths), {None, "Quiz A", "Quiz B/1"})
+        self.assertTrue(all(is_png(path) for path in paths.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+import unittest
+import os
+import sys
+import csv
+import shutil
+import tempfile
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from math_trainer.core.columnar_results import (ColumnarResults, BufferedColumnarWriter, csv_to_columnar,
+                                                columnar_to_csv, timestamp_to_epoch, epoch_to_timestamp)
+from math_trainer.core.user_progress import UserProgress
+
+ROWS = [
+    ["2023-01-01 10:00:00", "Quiz A", 5, 10],
+    ["2023-01-02 11:00:00", "Quiz B", 8, 10],
+    ["2023-01-03 12:00:00", "Quiz A", 7, 10],
+]
+
+
+class TestColumnarResults(unittest.TestCase):
+    """Testy dla kolumnowego formatu wyników."""
+
+    def setUp(self):
+        """Konfiguracja przed każdym testem."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.directory = os.path.join(self.temp_dir, "results_columns")
+
+    def tearDown(self):
+        """Czyszczenie po każdym teście."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_timestamp_round_trip(self):
+        """Testuje zamianę znacznika czasu na sekundy i z powrotem."""
+        epoch = timestamp_to_epoch("2023-03-26 02:30:00")
+        self.assertEqual(epoch_to_timestamp(epoch), "2023-03-26 02:30:00")
+
+    def test_append_and_columns(self):
+        """Testuje dopisywanie wyników i odczyt kolumn."""
+        store = ColumnarResults(self.directory)
+        store.append(ROWS)
+
+        self.assertEqual(len(store), 3)
+        self.assertEqual(store.quiz_names(), ["Quiz A", "Quiz B"])
+        columns = store.columns()
+        self.assertEqual(columns['quiz_ids'].tolist(), [0, 1, 0])
+        self.assertEqual(columns['scores'].tolist(), [5, 8, 7])
+        self.assertEqual(columns['totals'].tolist(), [10, 10, 10])
+        self.assertEqual(columns['timestamps'][1] - columns['timestamps'][0], 25 * 3600)
+
+    def test_to_results_matches_rows(self):
+        """Testuje zgodność wyników ze słownikami w formacie pliku CSV."""
+        store = ColumnarResults(self.directory)
+        store.append(ROWS)
+        self.assertEqual(store.to_results(), [
+            {'Timestamp': row[0], 'Quiz': row[1], 'Score': row[2], 'TotalQuestions': row[3]} for row in ROWS])
+
+    def test_empty_store(self):
+        """Testuje pusty magazyn wyników kolumnowych."""
+        store = ColumnarResults(self.directory)
+        self.assertEqual(len(store), 0)
+        self.assertEqual(store.to_results(), [])
+        self.assertEqual(store.summaries(), {})
+
+    def test_summaries(self):
+        """Testuje podsumowania wyników per quiz liczone na kolumnach."""
+        store = ColumnarResults(self.directory)
+        store.append(ROWS)
+        self.assertEqual(store.summaries()["Quiz A"], {
+            'count': 2, 'total_score': 12, 'total_questions': 20,
+            'min_score': 5, 'max_score': 7, 'last_timestamp': "2023-01-03 12:00:00"})
+
+    def test_interrupted_append_is_repaired(self):
+        """Testuje naprawę przerwanego dopisywania kolumn."""
+        store = ColumnarResults(self.directory)
+        store.append(ROWS[:1])
+        # Symulacja przerwanego zapisu: tylko jedna kolumna została wydłużona
+        with open(os.path.join(self.directory, "scores.i4"), 'ab') as f:
+            f.write(b"\x01\x00\x00\x00")
+        self.assertEqual(len(store), 1)
+
+        store.append(ROWS[1:2])
+        self.assertEqual(store.columns()['scores'].tolist(), [5, 8])
+
+    def test_invalid_quiz_name(self):
+        """Testuje odrzucenie nazwy quizu ze znakiem nowej linii."""
+        store = ColumnarResults(self.directory)
+        with self.assertRaises(ValueError):
+            store.append([["2023-01-01 10:00:00", "Zła\nnazwa", 1, 1]])
+
+    def test_csv_round_trip(self):
+        """Testuje konwersję pliku CSV do formatu kolumnowego z pominięciem błędnych wierszy."""
+        csv_path = os.path.join(self.temp_dir, "results.csv")
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Timestamp', 'Quiz', 'Score', 'TotalQuestions'])
+            writer.writerows(ROWS)
+            writer.writerow(["2023-01-04 10:00:00", "Quiz A", "x", 10])
+
+        with patch('builtins.print'):
+            self.assertEqual(csv_to_columnar(csv_path, self.directory, chunk_size=2), 3)
+        output_path = os.path.join(self.temp_dir, "out.csv")
+        self.assertEqual(columnar_to_csv(self.directory, output_path), 3)
+
+        with open(output_path, 'r', newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], ['Timestamp', 'Quiz', 'Score', 'TotalQuestions'])
+        self.assertEqual(rows[1:], [[str(value) for value in row] for row in ROWS])
+
+    def test_buffered_writer(self):
+        """Testuje zapis z opóźnieniem do magazynu kolumnowego."""
+        store = ColumnarResults(self.directory)
+        writer = BufferedColumnarWriter(store, flush_interval=60)
+        for row in ROWS:
+            writer.write(row)
+        writer.flush()
+        self.assertEqual(len(store), 3)
+        writer.close()
+
+    @patch('builtins.print')
+    def test_user_progress_columnar_backend(self, mock_print):
+        """Testuje UserProgress z wynikami w formacie kolumnowym."""
+        user_progress = UserProgress(data_file=os.path.join(self.temp_dir, "results.csv"), backend="columnar")
+        user_progress.save_results("Quiz A", 5, 10)
+        user_progress.save_results("Quiz B", 8, 10)
+
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, "results.csv")))
+        self.assertEqual([r['Quiz'] for r in user_progress.load_results()], ["Quiz A", "Quiz B"])
+
+        with patch('core.visualization.plot_progress_columns') as mock_plot:
+            user_progress.analyze_progress("Quiz B", visualize=True)
+        mock_print.assert_any_call("Łączna liczba poprawnych odpowiedzi: 8")
+        self.assertEqual(mock_plot.call_args[0][1].tolist(), [8])
+
+        user_progress.analyze_progress()
+        mock_print.assert_any_call("  Quiz A: 5/10 (50.00%)")
+
+    def test_user_progress_unknown_backend(self):
+        """Testuje błąd dla nieznanego formatu wyników."""
+        with self.assertRaises(ValueError):
+            UserProgress(data_file=os.path.join(self.temp_dir, "results.csv"), backend="xml")
+
+
+if __name__ == '__main__':
+    unittest.main()
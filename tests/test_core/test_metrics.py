@@ -0,0 +1,119 @@
+import unittest
+import os
+import sys
+import json
+import shutil
+import tempfile
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from math_trainer.core.metrics import ALL_QUIZZES, LATENCY_BUCKETS, Histogram, MetricsRegistry
+from math_trainer.core.quiz_manager import QuizManager
+from math_trainer.core.quiz_session import QuizSession
+from math_trainer.core.user_progress import UserProgress
+
+# Kod aplikacji importuje moduły jako core.*, więc instrumentację włączamy w tym module
+runtime_metrics = sys.modules['core.metrics']
+
+
+def histogram(snapshot, name, **labels):
+    for entry in snapshot['histograms']:
+        if entry['name'] == name and entry['labels'] == labels:
+            return entry
+    return None
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Testy dla liczników, histogramów i eksportu metryk."""
+
+    def test_histogram_buckets(self):
+        """Testuje skumulowane liczniki przedziałów histogramu."""
+        h = Histogram()
+        for value in (0.000001, 0.002, 0.002, 100.0):
+            h.observe(value)
+        buckets = dict(h.cumulative())
+        self.assertEqual(buckets[LATENCY_BUCKETS[0]], 1)
+        self.assertEqual(buckets[0.005], 3)
+        self.assertEqual(buckets["+Inf"], 4)
+        self.assertEqual(h.count, 4)
+
+    def test_prometheus_text(self):
+        """Testuje eksport metryk w formacie tekstowym Prometheusa."""
+        registry = MetricsRegistry()
+        registry.inc("answers_total", quiz='Quiz "A"', result="correct")
+        registry.observe("results_save_seconds", 0.003, quiz="Quiz A")
+        text = registry.to_prometheus()
+        self.assertIn("# TYPE math_trainer_answers_total counter", text)
+        self.assertIn('math_trainer_answers_total{quiz="Quiz \\"A\\"",result="correct"} 1', text)
+        self.assertIn('math_trainer_results_save_seconds_bucket{quiz="Quiz A",le="0.005"} 1', text)
+        self.assertIn('math_trainer_results_save_seconds_count{quiz="Quiz A"} 1', text)
+
+    def test_save_json_and_text(self):
+        """Testuje zapis metryk do plików JSON i Prometheusa."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        registry = MetricsRegistry()
+        registry.observe("plot_progress_seconds", 0.2)
+        registry.save(os.path.join(temp_dir, "metrics.json"))
+        registry.save(os.path.join(temp_dir, "metrics.prom"))
+        with open(os.path.join(temp_dir, "metrics.json"), 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['histograms'][0]['count'], 1)
+        with open(os.path.join(temp_dir, "metrics.prom"), 'r', encoding='utf-8') as f:
+            self.assertIn("math_trainer_plot_progress_seconds_sum 0.2", f.read())
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Testy dla pomiarów w QuizManager, QuizSession i UserProgress."""
+
+    def setUp(self):
+        """Konfiguracja przed każdym testem."""
+        self.temp_dir = tempfile.mkdtemp()
+        runtime_metrics.REGISTRY.reset()
+
+    def tearDown(self):
+        """Czyszczenie po każdym teście."""
+        runtime_metrics.disable()
+        runtime_metrics.REGISTRY.reset()
+        shutil.rmtree(self.temp_dir)
+
+    @patch('builtins.print')
+    def test_disabled_records_nothing(self, mock_print):
+        """Testuje, czy wyłączone metryki niczego nie rejestrują."""
+        quiz_manager = QuizManager()
+        quiz_instance, questions = quiz_manager.get_quiz_instance_and_questions("Potęgi", 2)
+        QuizSession(quiz_instance, questions).run(["0", "0"])
+        self.assertEqual(runtime_metrics.REGISTRY.snapshot(), {'counters': [], 'histograms': []})
+
+    @patch('builtins.print')
+    def test_hot_paths_are_measured_per_quiz(self, mock_print):
+        """Testuje pomiary najczęściej wykonywanych ścieżek z podziałem na quizy."""
+        runtime_metrics.enable()
+        quiz_manager = QuizManager()
+        quiz_instance, questions = quiz_manager.get_quiz_instance_and_questions("Potęgi", 2)
+        QuizSession(quiz_instance, questions).run([str(questions[0]['answer']), "zła"])
+        with self.assertRaises(ValueError):
+            quiz_manager.get_quiz_instance_and_questions("Brak", 2)
+
+        user_progress = UserProgress(data_file=os.path.join(self.temp_dir, "results.csv"))
+        user_progress.save_results("Potęgi", 1, 2)
+        user_progress.load_results()
+        with patch('core.visualization.plot_progress'):
+            user_progress.analyze_progress(visualize=True)
+
+        snapshot = runtime_metrics.REGISTRY.snapshot()
+        self.assertEqual(histogram(snapshot, "quiz_definitions_load_seconds")['count'], 1)
+        self.assertEqual(histogram(snapshot, "quiz_questions_load_seconds")['count'], 1)
+        self.assertEqual(histogram(snapshot, "quiz_questions_select_seconds", quiz="Potęgi")['count'], 1)
+        self.assertEqual(histogram(snapshot, "check_answer_seconds", quiz="Potęgi")['count'], 2)
+        self.assertEqual(histogram(snapshot, "results_save_seconds", quiz="Potęgi")['count'], 1)
+        self.assertEqual(histogram(snapshot, "results_load_seconds")['count'], 1)
+        self.assertEqual(histogram(snapshot, "progress_analyze_seconds", quiz=ALL_QUIZZES)['count'], 1)
+        counters = {(c['name'], tuple(sorted(c['labels'].items()))): c['value'] for c in snapshot['counters']}
+        self.assertEqual(counters[("answers_total", (("quiz", "Potęgi"), ("result", "correct")))], 1)
+        self.assertEqual(counters[("answers_total", (("quiz", "Potęgi"), ("result", "incorrect")))], 1)
+        self.assertEqual(counters[("quiz_questions_select_errors_total", (("quiz", "Brak"),))], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,71 +1,111 @@
-
 import unittest
-import time
-import random
-import gc
+import os
+import sys
+import json
+import shutil
+import tempfile
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from math_trainer.core.benchmarks import (BenchmarkSuite, compare_results, generate_answers, generate_questions,
+                                          generate_results_file, load_results, main, run_benchmarks, save_results)
+from math_trainer.core.user_progress import UserProgress
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), '..', '..', 'benchmarks', 'baseline.json')
+
 
+def document(**medians):
+    return {'version': 1, 'results': {name: {'median': median, 'min': median, 'runs': 1}
+                                      for name, median in medians.items()}}
 
-class TestSortingPerformance(unittest.TestCase):
-    """
-    Łagodne testy wydajnościowe sortowania – działają na każdej maszynie.
-    """
+
+class TestBenchmarkData(unittest.TestCase):
+    """Testy dla generatorów danych syntetycznych."""
 
     def setUp(self):
-        """Wyłączamy GC na czas testu, by pomiar był nieco dokładniejszy."""
-        gc.disable()
+        """Konfiguracja przed każdym testem."""
+        self.temp_dir = tempfile.mkdtemp()
 
     def tearDown(self):
-        """Włączamy GC po teście."""
-        gc.enable()
-
-    def _generate_random_list(self, size):
-        """Tworzy listę losowych liczb całkowitych."""
-        return [random.randint(0, size * 10) for _ in range(size)]
-
-    def _measure_sort_time(self, data):
-        """Zwraca czas sortowania listy."""
-        start = time.perf_counter()
-        data.sort()
-        end = time.perf_counter()
-        return end - start
-
-    def _print_result(self, size, duration):
-        print(f"✅ Posortowano {size:,} elementów w {duration:.6f} sekundy.")
-
-    def _assert_sorted(self, data):
-        self.assertTrue(all(data[i] <= data[i + 1] for i in range(len(data) - 1)),
-                        "Lista nie została posortowana poprawnie.")
-
-    def test_sort_tiny_list(self):
-        size = 100
-        data = self._generate_random_list(size)
-        duration = self._measure_sort_time(data)
-        self._print_result(size, duration)
-        self._assert_sorted(data)
-
-    def test_sort_small_list(self):
-        size = 1_000
-        data = self._generate_random_list(size)
-        duration = self._measure_sort_time(data)
-        self._print_result(size, duration)
-        self._assert_sorted(data)
-
-    def test_sort_medium_list(self):
-        size = 10_000
-        data = self._generate_random_list(size)
-        duration = self._measure_sort_time(data)
-        self._print_result(size, duration)
-        self._assert_sorted(data)
-
-    def test_sort_big_but_easy_list(self):
-        size = 50_000  # Wciąż lekkie dla większości laptopów
-        data = self._generate_random_list(size)
-        duration = self._measure_sort_time(data)
-        self._print_result(size, duration)
-        self._assert_sorted(data)
+        """Czyszczenie po każdym teście."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_generated_questions_and_answers(self):
+        """Testuje powtarzalne generowanie pytań i odpowiedzi."""
+        questions = generate_questions(30)
+        self.assertEqual(sum(len(q) for q in questions.values()), 30)
+        self.assertEqual(generate_questions(30), questions)
+        self.assertEqual(len(generate_answers("Ułamki", 8)), 8)
+
+    def test_generated_results_file_is_readable(self):
+        """Testuje, czy wygenerowany plik wyników wczytuje UserProgress."""
+        data_file = os.path.join(self.temp_dir, "results.csv")
+        generate_results_file(data_file, 50)
+        results = UserProgress(data_file=data_file).load_results()
+        self.assertEqual(len(results), 50)
+        self.assertLess(results[0]['Timestamp'], results[-1]['Timestamp'])
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """Testy dla zestawu pomiarów wydajności i porównania z wzorcem."""
+
+    def test_suite_measures_hot_paths(self):
+        """Testuje pomiary najczęściej wykonywanych ścieżek aplikacji."""
+        with patch('math_trainer.core.benchmarks.CHECK_ANSWER_CALLS', 10), \
+                patch('math_trainer.core.benchmarks.SAVE_RESULTS_CALLS', 2):
+            results = run_benchmarks(sizes=[60], runs=1, only="[")['results']
+        self.assertEqual(set(results), {
+            "questions.load[60]", "questions.sample[60]", "questions.memory[60]", "check_answer[Podstawowa Arytmetyka]",
+            "check_answer[Ułamki]", "check_answer[Potęgi]", "results.load[60]", "results.memory[60]",
+            "results.analyze[60]", "chart_render[60]", "results.save[60]"})
+        self.assertTrue(all(result['median'] > 0 for result in results.values()))
+
+    def test_benchmark_names(self):
+        """Testuje jednoznaczne nazwy pomiarów."""
+        names = [name for name, _ in BenchmarkSuite(tempfile.gettempdir(), sizes=[10, 100]).benchmarks()]
+        self.assertIn("quiz_manager.init", names)
+        self.assertIn("quiz_registry.discover_cold", names)
+        self.assertIn("results.save[10]", names)
+        self.assertIn("results.save[100]", names)
+        self.assertIn("results.analyze[100]", names)
+        self.assertEqual(len(names), len(set(names)))
+
+    def test_compare_with_baseline(self):
+        """Testuje wykrywanie regresji względem wzorca."""
+        baseline = document(a=1.0, b=1.0, c=1.0)
+        current = document(a=1.2, b=1.5, d=9.0)
+        self.assertEqual(compare_results(current, baseline, threshold=0.25), [("b", 1.0, 1.5)])
+        self.assertEqual(compare_results(current, baseline, threshold=0.1), [("a", 1.0, 1.2), ("b", 1.0, 1.5)])
+
+    def test_stored_baseline_covers_benchmarks(self):
+        """Testuje, czy wzorzec w benchmarks/baseline.json obejmuje wszystkie pomiary dla zapisanych rozmiarów."""
+        baseline = load_results(BASELINE_FILE)
+        names = [name for name, _ in BenchmarkSuite(tempfile.gettempdir(), sizes=baseline['sizes']).benchmarks()]
+        self.assertEqual(sorted(baseline['results']), sorted(names))
+
+    @patch('builtins.print')
+    def test_cli_reports_regressions(self, mock_print):
+        """Testuje kod wyjścia wiersza poleceń przy regresji i bez niej."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        baseline_file = os.path.join(temp_dir, "baseline.json")
+        output_file = os.path.join(temp_dir, "current.json")
+        save_results(document(**{"results.save[10]": 1e-12}), baseline_file)
+
+        self.assertEqual(main(["--tylko", "results.save", "--rozmiary", "10", "--powtorzenia", "1",
+                               "--wynik", output_file, "--wzorzec", baseline_file]), 1)
+        self.assertIn("results.save[10]", load_results(output_file)['results'])
+
+        save_results(document(**{"results.save[10]": 1e3}), baseline_file)
+        self.assertEqual(main(["--tylko", "results.save", "--rozmiary", "10", "--powtorzenia", "1",
+                               "--wzorzec", baseline_file]), 0)
+
+        with open(baseline_file, 'w', encoding='utf-8') as f:
+            json.dump({'version': 0, 'results': {}}, f)
+        with self.assertRaises(ValueError):
+            load_results(baseline_file)
 
 
 if __name__ == '__main__':
     unittest.main()
-# Aby uruchomić ten test z poziomu terminala:
-# python -m unittest performance_sort_test.py
@@ -0,0 +1,96 @@
+import unittest
+import os
+import sys
+import pstats
+import shutil
+import subprocess
+import tempfile
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from math_trainer.core.profiling import (ALLOCATIONS_FILE, COLLAPSED_FILE, PSTATS_FILE, SessionProfiler,
+                                         collapsed_stacks)
+from math_trainer.core.startup_benchmark import PROJECT_DIR
+
+MAIN = ("main.py", 1, "main")
+QUIZ = ("quiz.py", 10, "run_quiz")
+CHECK = ("quiz.py", 20, "check_answer")
+
+
+def allocate(count):
+    return [str(i) * 10 for i in range(count)]
+
+
+class TestCollapsedStacks(unittest.TestCase):
+    """Testy odtwarzania stosów wywołań ze statystyk cProfile."""
+
+    def test_time_is_split_between_callers(self):
+        """Testuje podział czasu funkcji między wywołujących."""
+        # (wywołania pierwotne, wszystkie wywołania, czas własny, czas łączny, wywołujący)
+        stats = {
+            MAIN: (1, 1, 0.001, 0.010, {}),
+            QUIZ: (1, 1, 0.002, 0.006, {MAIN: (1, 1, 0.002, 0.006)}),
+            CHECK: (4, 4, 0.004, 0.004, {MAIN: (1, 1, 0.001, 0.001), QUIZ: (3, 3, 0.003, 0.003)}),
+        }
+        self.assertEqual(dict(collapsed_stacks(stats)), {
+            "main (main.py:1)": 1000,
+            "main (main.py:1);check_answer (quiz.py:20)": 1000,
+            "main (main.py:1);run_quiz (quiz.py:10)": 2000,
+            "main (main.py:1);run_quiz (quiz.py:10);check_answer (quiz.py:20)": 3000,
+        })
+
+    def test_recursion_is_not_expanded(self):
+        """Testuje, czy rekurencja nie jest rozwijana w stosach."""
+        recursive = ("utils.py", 5, "factorial_recursive")
+        stats = {
+            MAIN: (1, 1, 0.0, 0.005, {}),
+            recursive: (1, 5, 0.005, 0.005, {MAIN: (1, 1, 0.001, 0.005), recursive: (0, 4, 0.004, 0.004)}),
+        }
+        self.assertEqual(collapsed_stacks(stats), [("main (main.py:1);factorial_recursive (utils.py:5)", 5000)])
+
+
+class TestSessionProfiler(unittest.TestCase):
+    """Testy dla profilowania sesji i trybu --profile w main.py."""
+
+    def setUp(self):
+        """Konfiguracja przed każdym testem."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Czyszczenie po każdym teście."""
+        shutil.rmtree(self.temp_dir)
+
+    @patch('builtins.print')
+    def test_profiler_writes_reports(self, mock_print):
+        """Testuje zapis plików profilu czasu i alokacji."""
+        with SessionProfiler(self.temp_dir):
+            data = allocate(20_000)
+        self.assertEqual(len(data), 20_000)
+
+        stats = pstats.Stats(os.path.join(self.temp_dir, PSTATS_FILE))
+        self.assertTrue(any(name == "allocate" for _, _, name in stats.stats))
+        with open(os.path.join(self.temp_dir, COLLAPSED_FILE), 'r', encoding='utf-8') as f:
+            self.assertIn("allocate (test_profiling.py:", f.read())
+        with open(os.path.join(self.temp_dir, ALLOCATIONS_FILE), 'r', encoding='utf-8') as f:
+            report = f.read()
+        self.assertIn("Szczytowe zużycie pamięci", report)
+        self.assertIn("test_profiling.py", report)
+
+    def test_scripted_session_is_profiled(self):
+        """Testuje profilowanie sesji ze skryptu odpowiedzi uruchomionej przez main.py."""
+        script_file = os.path.join(self.temp_dir, "sesja.txt")
+        output_dir = os.path.join(self.temp_dir, "profil")
+        # Nieprawidłowa opcja, a następnie wyjście - sesja nie zmienia danych aplikacji
+        with open(script_file, 'w', encoding='utf-8') as f:
+            f.write("9\n4\n")
+        completed = subprocess.run([sys.executable, "main.py", "--skrypt", script_file, "--profile", output_dir],
+                                   cwd=PROJECT_DIR, capture_output=True, text=True, encoding='utf-8', timeout=60)
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        self.assertIn("Nieprawidłowa opcja", completed.stdout)
+        self.assertIn("Dziękujemy za skorzystanie", completed.stdout)
+        self.assertEqual(sorted(os.listdir(output_dir)), sorted([ALLOCATIONS_FILE, COLLAPSED_FILE, PSTATS_FILE]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from math_trainer.core.progress_aggregates import ProgressAggregates
+
+
+class TestProgressAggregates(unittest.TestCase):
+    """Testy dla agregatów wyników per quiz."""
+
+    def setUp(self):
+        """Konfiguracja przed każdym testem."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "aggregates.json")
+
+    def tearDown(self):
+        """Czyszczenie po każdym teście."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_summary_per_quiz_and_overall(self):
+        """Testuje podsumowania per quiz i łączne."""
+        aggregates = ProgressAggregates(self.path)
+        aggregates.rebuild([
+            {'Timestamp': "2024-01-01 10:00:00", 'Quiz': "A", 'Score': 5, 'TotalQuestions': 10},
+            {'Timestamp': "2024-01-02 10:00:00", 'Quiz': "B", 'Score': 8, 'TotalQuestions': 10},
+            {'Timestamp': "2024-01-03 10:00:00", 'Quiz': "A", 'Score': 2, 'TotalQuestions': 5},
+        ], (100, 1))
+
+        self.assertEqual(aggregates.summary("A"), {
+            'count': 2, 'total_score': 7, 'total_questions': 15,
+            'min_score': 2, 'max_score': 5, 'last_timestamp': "2024-01-03 10:00:00"})
+        overall = aggregates.summary()
+        self.assertEqual((overall['count'], overall['min_score'], overall['max_score']), (3, 2, 8))
+        self.assertEqual(list(aggregates.per_quiz()), ["A", "B"])
+        self.assertEqual(aggregates.summary("C")['count'], 0)
+
+    def test_persisted_and_loaded(self):
+        """Testuje zapis i wczytanie agregatów z pliku JSON."""
+        aggregates = ProgressAggregates(self.path)
+        aggregates.rebuild([{'Timestamp': "t", 'Quiz': "A", 'Score': 1, 'TotalQuestions': 2}], (10, 20))
+
+        loaded = ProgressAggregates(self.path)
+        self.assertTrue(loaded.load())
+        self.assertTrue(loaded.is_current((10, 20)))
+        self.assertEqual(loaded.summary("A")['total_questions'], 2)
+
+    def test_record_append_follows_signature_chain(self):
+        """Testuje aktualizację agregatów po dopisaniu wierszy i unieważnienie przy niezgodnej sygnaturze."""
+        aggregates = ProgressAggregates(self.path)
+        aggregates.rebuild([], (10, 1))
+
+        aggregates.record_append([["t1", "A", 3, 5]], (10, 1), (20, 2))
+        self.assertTrue(aggregates.is_current((20, 2)))
+        self.assertEqual(aggregates.summary("A")['total_score'], 3)
+
+        # Plik zmienił się poza agregatami - agregaty stają się nieaktualne
+        aggregates.record_append([["t2", "A", 4, 5]], (30, 3), (40, 4))
+        self.assertFalse(aggregates.is_current((40, 4)))
+
+    def test_load_corrupted_file(self):
+        """Testuje wczytywanie uszkodzonego pliku agregatów."""
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write("{nie json")
+        self.assertFalse(ProgressAggregates(self.path).load())
+
+
+if __name__ == '__main__':
+    unittest.main()
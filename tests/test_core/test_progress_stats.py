@@ -0,0 +1,226 @@
+import unittest
+import os
+import sys
+import csv
+import random
+import shutil
+import statistics
+import tempfile
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from math_trainer.core.progress_stats import RollingStats, ProgressStats, DAY
+from math_trainer.core.columnar_results import epoch_to_timestamp
+from math_trainer.core.user_progress import UserProgress
+
+START = 1_700_000_000
+
+
+class CountingFile:
+    """Plik zliczający przeczytane bajty (w trybie tekstowym - znaki)."""
+
+    def __init__(self, f, counter):
+        self._f = f
+        self._counter = counter
+
+    def _count(self, data):
+        self._counter[0] += len(data)
+        return data
+
+    def read(self, *args):
+        return self._count(self._f.read(*args))
+
+    def readline(self, *args):
+        return self._count(self._f.readline(*args))
+
+    def __iter__(self):
+        return (self._count(line) for line in self._f)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return self._f.__exit__(*exc_info)
+
+    def __getattr__(self, name):
+        return getattr(self._f, name)
+
+
+def expected(percentages):
+    """Statystyki okna policzone wprost (do porównania z wersją przyrostową)."""
+    n = len(percentages)
+    xs = list(range(n))
+    mean_x = sum(xs) / n
+    mean_y = sum(percentages) / n
+    slope = (sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, percentages)) /
+             sum((x - mean_x) ** 2 for x in xs)) if n > 1 else None
+    return mean_y, statistics.pvariance(percentages), min(percentages), max(percentages), slope
+
+
+class TestRollingStats(unittest.TestCase):
+    """Testy dla statystyk kroczących."""
+
+    def assertMatches(self, snapshot, percentages):
+        mean, variance, minimum, maximum, slope = expected(percentages)
+        self.assertEqual(snapshot['window_count'], len(percentages))
+        self.assertAlmostEqual(snapshot['mean'], mean)
+        self.assertAlmostEqual(snapshot['variance'], variance, places=6)
+        self.assertEqual((snapshot['min'], snapshot['max']), (minimum, maximum))
+        if slope is None:
+            self.assertIsNone(snapshot['trend'])
+        else:
+            self.assertAlmostEqual(snapshot['trend'], slope, places=6)
+
+    def test_attempt_window_matches_direct_computation(self):
+        """Testuje zgodność statystyk okna podejść z obliczeniami wprost."""
+        rng = random.Random(7)
+        stats = RollingStats(window=10)
+        history = []
+        for i in range(300):
+            score = rng.randint(0, 10)
+            stats.add(epoch_to_timestamp(START + i), score, 10)
+            history.append(score * 10.0)
+            self.assertMatches(stats.snapshot(), history[-10:])
+        self.assertEqual(stats.snapshot()['count'], 300)
+
+    def test_day_window(self):
+        """Testuje okno obejmujące podejścia z ostatnich dni."""
+        stats = RollingStats(window=None, days=2)
+        for day, score in enumerate([2, 4, 6, 8]):
+            stats.add(epoch_to_timestamp(START + day * DAY), score, 10)
+        self.assertMatches(stats.snapshot(), [60.0, 80.0])
+
+    def test_streaks_and_empty_quizzes(self):
+        """Testuje serie dobrych wyników i podejścia do quizów bez pytań."""
+        stats = RollingStats(window=5)
+        for score, total in [(9, 10), (8, 10), (3, 10), (10, 10), (0, 0), (9, 10), (10, 10)]:
+            stats.add("2024-01-01 10:00:00", score, total)
+        snapshot = stats.snapshot()
+        self.assertEqual((snapshot['current_streak'], snapshot['best_streak']), (3, 3))
+        self.assertEqual(snapshot['count'], 7)
+        self.assertEqual(snapshot['window_count'], 5)
+
+    def test_empty_snapshot(self):
+        """Testuje statystyki bez żadnych wyników."""
+        snapshot = ProgressStats().snapshot("Quiz A")
+        self.assertEqual(snapshot['count'], 0)
+        self.assertIsNone(snapshot['mean'])
+        with self.assertRaises(ValueError):
+            RollingStats(window=None)
+
+
+class TestUserProgressRollingStatistics(unittest.TestCase):
+    """Testy dla statystyk kroczących w UserProgress."""
+
+    def setUp(self):
+        """Konfiguracja przed każdym testem."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_file = os.path.join(self.temp_dir, "results.csv")
+
+    def tearDown(self):
+        """Czyszczenie po każdym teście."""
+        shutil.rmtree(self.temp_dir)
+
+    def append(self, rows):
+        with open(self.data_file, 'a', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows(rows)
+
+    def test_incremental_update_for_each_backend(self):
+        """Testuje przyrostową aktualizację statystyk we wszystkich formatach wyników."""
+        for backend in ("csv", "columnar", "sqlite"):
+            with self.subTest(backend=backend), patch('builtins.print'):
+                user_progress = UserProgress(data_file=os.path.join(self.temp_dir, backend, "results.csv"),
+                                             backend=backend)
+                user_progress.save_results("Quiz A", 5, 10)
+                user_progress.save_results("Quiz B", 9, 10)
+                self.assertEqual(user_progress.rolling_statistics()['mean'], 70.0)
+
+                tracked = list(user_progress._stats.values())
+
+                user_progress.save_results("Quiz A", 7, 10)
+                self.assertEqual(user_progress.rolling_statistics()['count'], 3)
+                # Nowy wynik został dołączony do istniejących statystyk, bez liczenia ich od nowa
+                self.assertEqual(list(user_progress._stats.values()), tracked)
+
+                self.assertEqual(user_progress.rolling_statistics("Quiz A")['trend'], 20.0)
+                self.assertEqual(list(user_progress.rolling_statistics_per_quiz()), ["Quiz A", "Quiz B"])
+                user_progress.close()
+
+    def test_partial_line_is_read_later(self):
+        """Testuje odczyt niedokończonej linii dopiero po jej dopisaniu."""
+        user_progress = UserProgress(data_file=self.data_file)
+        self.append([["2024-01-01 10:00:00", "Quiz A", 5, 10]])
+        with open(self.data_file, 'a', encoding='utf-8') as f:
+            f.write("2024-01-01 10:05:00,Quiz A,")
+        self.assertEqual(user_progress.rolling_statistics()['count'], 1)
+        with open(self.data_file, 'a', encoding='utf-8') as f:
+            f.write("7,10\n")
+        self.assertEqual(user_progress.rolling_statistics()['mean'], 60.0)
+
+    def test_replaced_file_is_recomputed(self):
+        """Testuje ponowne wyliczenie statystyk po zastąpieniu pliku wyników."""
+        user_progress = UserProgress(data_file=self.data_file)
+        self.append([["2024-01-01 10:00:00", "Quiz A", 5, 10], ["2024-01-02 10:00:00", "Quiz A", 6, 10]])
+        self.assertEqual(user_progress.rolling_statistics()['count'], 2)
+
+        replacement = self.data_file + ".new"
+        with open(replacement, 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows([['Timestamp', 'Quiz', 'Score', 'TotalQuestions'],
+                                     ["2024-01-03 10:00:00", "Quiz B", 1, 10]])
+        os.replace(replacement, self.data_file)
+        stats = user_progress.rolling_statistics()
+        self.assertEqual((stats['count'], stats['mean']), (1, 10.0))
+
+    def test_statistics_are_persisted(self):
+        """Testuje zapis statystyk i ich aktualizację po wczytaniu w nowym obiekcie."""
+        first = UserProgress(data_file=self.data_file)
+        self.append([["2024-01-01 10:00:00", "Quiz A", 5, 10], ["2024-01-02 10:00:00", "Quiz B", 9, 10]])
+        expected_stats = first.rolling_statistics_per_quiz()
+        self.append([["2024-01-03 10:00:00", "Quiz A", 7, 10]])
+
+        user_progress = UserProgress(data_file=self.data_file)
+        stats = user_progress._progress_stats(20, None)
+        self.assertEqual(stats.quizzes["Quiz B"].snapshot(), expected_stats["Quiz B"])
+        self.assertEqual(stats.snapshot("Quiz A")['count'], 2)
+        self.assertEqual(stats.snapshot("Quiz A")['trend'], 20.0)
+
+    @patch('builtins.print')
+    def test_analyze_progress_in_new_process_reads_only_appended_rows(self, mock_print):
+        """Testuje, czy analiza w nowym uruchomieniu czyta tylko dopisane wyniki."""
+        first = UserProgress(data_file=self.data_file)
+        self.append([[f"2024-01-01 {i // 3600:02d}:{i // 60 % 60:02d}:{i % 60:02d}", f"Quiz {i % 3}", i % 11, 10]
+                     for i in range(5000)])
+        first.analyze_progress()
+
+        # Nowy obiekt odpowiada nowemu uruchomieniu aplikacji: agregaty i statystyki są wczytywane z plików JSON
+        user_progress = UserProgress(data_file=self.data_file)
+        user_progress.save_results("Quiz 1", 9, 10)
+        with open(self.data_file, 'rb') as f:
+            last_line = f.readlines()[-1]
+
+        counter = [0]
+        real_open = open
+
+        def counting_open(file, *args, **kwargs):
+            f = real_open(file, *args, **kwargs)
+            return CountingFile(f, counter) if file == self.data_file else f
+
+        with patch('math_trainer.core.user_progress.open', counting_open, create=True), \
+                patch('math_trainer.core.result_records.open', counting_open, create=True):
+            user_progress.analyze_progress()
+        self.assertEqual(counter[0], len(last_line))
+        mock_print.assert_any_call("Łączna liczba pytań: 50010")
+
+    @patch('builtins.print')
+    def test_analyze_progress_prints_rolling_statistics(self, mock_print):
+        """Testuje wypisywanie statystyk kroczących w analizie postępów."""
+        user_progress = UserProgress(data_file=self.data_file)
+        self.append([["2024-01-01 10:00:00", "Quiz A", 8, 10], ["2024-01-02 10:00:00", "Quiz A", 10, 10]])
+        user_progress.analyze_progress("Quiz A")
+        mock_print.assert_any_call("Trend: +20.00 pkt proc. na podejście")
+        mock_print.assert_any_call("Seria wyników co najmniej 80%: obecna 2, najdłuższa 2")
+
+
+if __name__ == '__main__':
+    unittest.main()
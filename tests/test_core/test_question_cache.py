@@ -0,0 +1,128 @@
+import unittest
+import os
+import sys
+import shutil
+import threading
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from math_trainer.core.question_cache import LazyQuestionCache, estimate_questions_size
+from math_trainer.core.question_store import JsonQuestionStore, LogQuestionStore
+
+
+class TestLazyQuestionCache(unittest.TestCase):
+    """Testy dla leniwej pamięci podręcznej pytań."""
+
+    def setUp(self):
+        """Konfiguracja przed każdym testem."""
+        self.test_root_dir = os.path.join(os.path.dirname(__file__), 'temp_question_cache')
+        self.store = LogQuestionStore(self.test_root_dir)
+        for quiz_name in ("Quiz A", "Quiz B", "Quiz C"):
+            self.store.append_many([(quiz_name, f"{i}+{i}?", 2 * i) for i in range(50)])
+
+    def tearDown(self):
+        """Czyszczenie po każdym teście."""
+        shutil.rmtree(self.test_root_dir, ignore_errors=True)
+
+    def test_keys_without_loading(self):
+        """Testuje, czy lista quizów nie wymaga wczytania pytań."""
+        cache = LazyQuestionCache(self.store)
+        self.assertEqual(list(cache.keys()), ["Quiz A", "Quiz B", "Quiz C"])
+        self.assertEqual(cache.cached_quizzes(), [])
+        self.assertEqual(cache.memory_usage, 0)
+
+    def test_loads_only_requested_quiz(self):
+        """Testuje wczytywanie wyłącznie żądanego quizu i trafienia w pamięci podręcznej."""
+        cache = LazyQuestionCache(self.store)
+        self.assertEqual(len(cache["Quiz B"]), 50)
+        self.assertEqual(len(cache.get("Quiz B")), 50)
+        self.assertEqual(cache.cached_quizzes(), ["Quiz B"])
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertIsNone(cache.get("Brak"))
+
+    def test_memory_based_eviction(self):
+        """Testuje usuwanie najdawniej używanych quizów po przekroczeniu limitu pamięci."""
+        one_quiz_size = estimate_questions_size(self.store.load_quiz("Quiz A"))
+        cache = LazyQuestionCache(self.store, max_bytes=int(one_quiz_size * 2.5))
+        cache["Quiz A"]
+        cache["Quiz B"]
+        cache["Quiz A"]
+        cache["Quiz C"]
+        self.assertEqual(cache.cached_quizzes(), ["Quiz A", "Quiz C"])
+        self.assertEqual(cache.evictions, 1)
+        self.assertLessEqual(cache.memory_usage, cache.max_bytes)
+
+    def test_add_question_updates_cached_quiz(self):
+        """Testuje uwzględnianie nowych pytań w zestawie trzymanym w pamięci."""
+        cache = LazyQuestionCache(self.store)
+        questions = cache["Quiz A"]
+        usage = cache.memory_usage
+        record = self.store.append("Quiz A", "100+100?", 200)
+        cache.add_question("Quiz A", record)
+        self.assertEqual(len(questions), 51)
+        self.assertGreater(cache.memory_usage, usage)
+
+    def test_peek_does_not_touch_lru(self):
+        """Testuje podgląd zestawu bez zmiany statystyk i kolejności LRU."""
+        cache = LazyQuestionCache(self.store)
+        cache["Quiz A"]
+        cache["Quiz B"]
+        self.assertEqual(len(cache.peek("Quiz A")), 50)
+        self.assertIsNone(cache.peek("Quiz C"))
+        self.assertEqual(cache.cached_quizzes(), ["Quiz A", "Quiz B"])
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+    def test_concurrent_reads_and_invalidation(self):
+        """Testuje odczyty w wielu wątkach równolegle z unieważnianiem quizów przez inny wątek."""
+        cache = LazyQuestionCache(self.store)
+        errors = []
+        stop = threading.Event()
+
+        def read():
+            try:
+                while not stop.is_set():
+                    for quiz_name in ("Quiz A", "Quiz B", "Quiz C"):
+                        self.assertEqual(len(cache[quiz_name]), 50)
+            except Exception as e:
+                errors.append(e)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in readers:
+                thread.start()
+            for _ in range(2000):
+                cache.invalidate("Quiz A")
+                cache.invalidate()
+        finally:
+            stop.set()
+            for thread in readers:
+                thread.join()
+            sys.setswitchinterval(switch_interval)
+
+        self.assertEqual(errors, [])
+        expected = sum(estimate_questions_size(cache.peek(name)) for name in cache.cached_quizzes())
+        self.assertEqual(cache.memory_usage, expected)
+
+    def test_quiz_names_cached_until_store_changes(self):
+        """Testuje, czy plik JSON nie jest wczytywany przy każdym sprawdzeniu nazw quizów."""
+        store = JsonQuestionStore(os.path.join(self.test_root_dir, "quiz_data.json"))
+        store.append("Quiz A", "1+1?", 2)
+        cache = LazyQuestionCache(store)
+        with patch.object(store, 'list_quizzes', wraps=store.list_quizzes) as list_quizzes:
+            self.assertEqual(list(cache), ["Quiz A"])
+            self.assertEqual(len(cache), 1)
+            self.assertIn("Quiz A", cache)
+            self.assertNotIn("Quiz B", cache)
+            self.assertEqual(list_quizzes.call_count, 1)
+
+            store.append("Quiz B", "2+2?", 4)
+            self.assertIn("Quiz B", cache)
+            self.assertEqual(len(cache), 2)
+            self.assertEqual(list_quizzes.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+import os
+import sys
+import json
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from math_trainer.core.question_cache import estimate_questions_size
+from math_trainer.core.question_list import QuestionList
+from math_trainer.core.quiz_manager import QuizManager
+
+# Kod aplikacji importuje moduły jako core.*, więc pytania z QuizManager i magazynów są instancjami tej klasy
+RuntimeQuestionList = sys.modules['core.question_list'].QuestionList
+
+QUESTIONS = [{"question": "2+2?", "answer": 4}, {"question": "1/2 + 1/2?", "answer": "1/1"},
+             {"question": "3^2?", "answer": 9}]
+
+
+class TestQuestionList(unittest.TestCase):
+    """Testy dla kolumnowej listy pytań."""
+
+    def test_reads_return_question_dicts(self):
+        """Testuje odczyt pytań jako słowników przez indeks, wycinek i iterację."""
+        questions = QuestionList(QUESTIONS)
+        self.assertEqual(len(questions), 3)
+        self.assertIsInstance(questions[0], dict)
+        self.assertEqual(questions[-1], QUESTIONS[-1])
+        self.assertEqual(questions[1:], QUESTIONS[1:])
+        self.assertEqual(list(questions), QUESTIONS)
+        self.assertEqual(questions.answers, [4, "1/1", 9])
+        self.assertFalse(hasattr(questions, '__dict__'))
+
+    def test_equality_and_append(self):
+        """Testuje porównanie z listą słowników i dopisywanie pytań."""
+        questions = QuestionList(QUESTIONS[:2])
+        self.assertEqual(questions, QUESTIONS[:2])
+        self.assertNotEqual(questions, QUESTIONS)
+        questions.append(QUESTIONS[2])
+        self.assertEqual(questions, QuestionList(QUESTIONS))
+        self.assertEqual(QuestionList(), [])
+
+    def test_smaller_than_list_of_dicts(self):
+        """Testuje mniejsze zużycie pamięci niż lista słowników."""
+        questions = [{"question": f"Ile to {i} + {i}?", "answer": 2 * i} for i in range(1000)]
+        self.assertLess(estimate_questions_size(RuntimeQuestionList(questions)), estimate_questions_size(questions) / 2)
+
+
+class TestQuizManagerQuestionList(unittest.TestCase):
+    """Testy dla pytań QuizManager przechowywanych w QuestionList."""
+
+    def setUp(self):
+        """Konfiguracja przed każdym testem."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_file = os.path.join(self.temp_dir, "quiz_data.json")
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            json.dump({"Potęgi": [{"question": f"{i}^2?", "answer": i * i} for i in range(10)]}, f)
+        self.quiz_manager = QuizManager(quiz_data_file=self.data_file)
+
+    def tearDown(self):
+        """Czyszczenie po każdym teście."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_load_sample_and_grade(self):
+        """Testuje wczytanie, losowanie i ocenianie pytań przechowywanych kolumnowo."""
+        questions = self.quiz_manager.quiz_questions["Potęgi"]
+        self.assertIsInstance(questions, RuntimeQuestionList)
+        _, selected = self.quiz_manager.get_quiz_instance_and_questions("Potęgi", 3, seed=1)
+        self.assertEqual(len(selected), 3)
+        self.assertTrue(all(isinstance(q, dict) and q in questions for q in selected))
+        self.assertEqual(self.quiz_manager.grade_batch("Potęgi", questions, [str(i * i) for i in range(10)]),
+                         [True] * 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
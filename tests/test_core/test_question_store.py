@@ -0,0 +1,85 @@
+import unittest
+import os
+import sys
+import json
+import shutil
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from math_trainer.core.question_store import LogQuestionStore
+
+
+class TestLogQuestionStore(unittest.TestCase):
+    """Testy dla magazynu pytań opartego na dzienniku."""
+
+    def setUp(self):
+        """Konfiguracja przed każdym testem."""
+        self.test_root_dir = os.path.join(os.path.dirname(__file__), 'temp_question_store')
+        self.store_dir = os.path.join(self.test_root_dir, 'store')
+        os.makedirs(self.test_root_dir, exist_ok=True)
+        self.store = LogQuestionStore(self.store_dir)
+
+    def tearDown(self):
+        """Czyszczenie po każdym teście."""
+        shutil.rmtree(self.test_root_dir, ignore_errors=True)
+
+    def test_append_and_load_quiz(self):
+        """Testuje dopisywanie pytań i wczytywanie pojedynczego quizu."""
+        self.store.append("Quiz A", "1+1?", 2)
+        self.store.append("Quiz B", "2^2?", 4)
+        self.store.append("Quiz A", "ąę 3/4?", "3/4")
+
+        self.assertEqual(self.store.list_quizzes(), ["Quiz A", "Quiz B"])
+        self.assertEqual(self.store.count("Quiz A"), 2)
+        self.assertEqual(self.store.load_quiz("Quiz A"), [
+            {"question": "1+1?", "answer": 2},
+            {"question": "ąę 3/4?", "answer": "3/4"}
+        ])
+        self.assertEqual(self.store.load_quiz("Nieistniejący"), [])
+
+    def test_reopen_store(self):
+        """Testuje, czy dane są widoczne po ponownym otwarciu magazynu."""
+        self.store.append_many([("Quiz A", f"{i}+1?", i + 1) for i in range(100)])
+        reopened = LogQuestionStore(self.store_dir)
+        questions = reopened.load_all()["Quiz A"]
+        self.assertEqual(len(questions), 100)
+        self.assertEqual(questions[42], {"question": "42+1?", "answer": 43})
+
+    @patch('builtins.print')
+    def test_import_legacy_json(self, mock_print):
+        """Testuje import pytań z dotychczasowego pliku quiz_data.json."""
+        legacy_file = os.path.join(self.test_root_dir, 'quiz_data.json')
+        with open(legacy_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                "Potęgi": [{"question": "2^3?", "answer": 8}, {"bez": "odpowiedzi"}],
+                "Ułamki": [{"question": "1/2 + 1/4?", "answer": "3/4"}]
+            }, f)
+
+        imported = self.store.import_json(legacy_file)
+
+        self.assertEqual(imported, 2)
+        self.assertEqual(self.store.load_quiz("Potęgi"), [{"question": "2^3?", "answer": 8}])
+        self.assertEqual(self.store.list_quizzes(), ["Potęgi", "Ułamki"])
+
+    def test_sample_from_index(self):
+        """Testuje powtarzalne losowanie pytań bezpośrednio z indeksu."""
+        self.store.append_many([("Quiz A", f"{i}+1?", i + 1) for i in range(1000)])
+        self.store.append("Quiz B", "2^2?", 4)
+
+        sample = self.store.sample("Quiz A", 5, seed=3)
+        self.assertEqual(len(sample), 5)
+        self.assertEqual(sample, self.store.sample("Quiz A", 5, seed=3))
+        for q in sample:
+            self.assertEqual(q["answer"], int(q["question"].split("+")[0]) + 1)
+        self.assertEqual(self.store.sample("Quiz B", 5), [{"question": "2^2?", "answer": 4}])
+        self.assertEqual(self.store.sample("Brak", 5), [])
+
+    def test_invalid_quiz_name(self):
+        """Testuje odrzucenie nazwy quizu, której nie da się zapisać w manifeście."""
+        with self.assertRaises(ValueError):
+            self.store.append("Quiz\nA", "1+1?", 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,6 +11,7 @@ from unittest.mock import patch
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
 
 from math_trainer.core.quiz_manager import QuizManager
+from math_trainer.core.question_store import LogQuestionStore
 
 class TestQuizManager(unittest.TestCase):
     """Testy dla klasy QuizManager."""
@@ -164,6 +165,96 @@ class TestPowersQuiz:
             temp_quiz_manager.get_quiz_instance_and_questions("Test Quiz Arytmetyka")
         self.assertIn("Brak pytań dla quizu 'Test Quiz Arytmetyka' w pliku quiz_data.json.", str(cm.exception))
 
+    @patch('builtins.print')
+    def test_add_question_to_quiz_updates_memory(self, mock_print):
+        """Testuje, czy dodane pytanie jest od razu widoczne bez ponownego wczytania pliku."""
+        self.quiz_manager.add_question_to_quiz("Test Quiz Potęgi", "3^2?", 9)
+        self.quiz_manager.add_question_to_quiz("Nowy Quiz", "1+2?", 3)
+
+        self.assertEqual(len(self.quiz_manager.quiz_questions["Test Quiz Potęgi"]), 2)
+        self.assertIn("Nowy Quiz", self.quiz_manager.list_quizzes())
+        with open(self.test_data_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(data["Test Quiz Potęgi"][-1], {"question": "3^2?", "answer": 9})
+        self.assertEqual(data["Nowy Quiz"], [{"question": "1+2?", "answer": 3}])
+
+    def test_lazy_mode_loads_questions_on_demand(self):
+        """Testuje tryb leniwy: lista quizów bez wczytywania pytań, pytania dopiero przy wyborze."""
+        lazy_manager = QuizManager(
+            quiz_dir=self.test_quiz_dir,
+            quiz_data_file=self.test_data_file,
+            lazy=True
+        )
+        self.assertCountEqual(lazy_manager.list_quizzes(), ["Test Quiz Arytmetyka", "Test Quiz Potęgi"])
+        self.assertEqual(lazy_manager.quiz_questions.cached_quizzes(), [])
+
+        _, questions = lazy_manager.get_quiz_instance_and_questions("Test Quiz Potęgi", num_questions=1)
+        self.assertEqual(questions, [{"question": "2^2?", "answer": 4}])
+        self.assertEqual(lazy_manager.quiz_questions.cached_quizzes(), ["Test Quiz Potęgi"])
+
+    def test_get_quiz_questions_with_seed(self):
+        """Testuje powtarzalność losowania pytań przy podanym ziarnie."""
+        _, first = self.quiz_manager.get_quiz_instance_and_questions("Test Quiz Arytmetyka", 1, seed=5)
+        _, second = self.quiz_manager.get_quiz_instance_and_questions("Test Quiz Arytmetyka", 1, seed=5)
+        self.assertEqual(first, second)
+
+    def test_disk_sampling_with_log_store(self):
+        """Testuje losowanie pytań bezpośrednio z indeksu magazynu, bez wczytywania quizu."""
+        store = LogQuestionStore(os.path.join(self.test_root_dir, "store"))
+        store.import_json(self.test_data_file)
+        manager = QuizManager(quiz_dir=self.test_quiz_dir, quiz_data_file=self.test_data_file,
+                              question_store=store, lazy=True, disk_sampling=True)
+
+        _, questions = manager.get_quiz_instance_and_questions("Test Quiz Arytmetyka", 1, seed=1)
+        self.assertEqual(len(questions), 1)
+        self.assertIn(questions[0], [{"question": "1+1?", "answer": 2}, {"question": "2*2?", "answer": 4}])
+        self.assertEqual(manager.quiz_questions.cached_quizzes(), [])
+
+    @patch('builtins.print')
+    def test_invalid_questions_skipped_at_load(self, mock_print):
+        """Testuje, czy nieprawidłowe pytania są odrzucane raz, przy wczytywaniu danych."""
+        with open(self.test_data_file, 'w', encoding='utf-8') as f:
+            json.dump({"Test Quiz Potęgi": [{"question": "2^2?", "answer": 4}, {"question": "bez odpowiedzi"}]}, f)
+        manager = QuizManager(quiz_dir=self.test_quiz_dir, quiz_data_file=self.test_data_file)
+
+        self.assertEqual(manager.quiz_questions["Test Quiz Potęgi"], [{"question": "2^2?", "answer": 4}])
+        _, questions = manager.get_quiz_instance_and_questions("Test Quiz Potęgi", 5)
+        self.assertEqual(questions, [{"question": "2^2?", "answer": 4}])
+
+    def test_generated_questions_require_generator(self):
+        """Testuje odmowę generowania pytań dla quizu bez generatora."""
+        with self.assertRaises(ValueError) as cm:
+            self.quiz_manager.get_quiz_instance_and_generated_questions("Test Quiz Potęgi", 3)
+        self.assertIn("nie obsługuje generowania pytań", str(cm.exception))
+
+    def test_generated_questions_sampled_from_pool(self):
+        """Testuje losowanie wygenerowanych pytań z puli strumieniowo i powtarzalnie przy tym samym ziarnie."""
+        generated = []
+
+        class GeneratorQuiz:
+            def generate_questions(self, count=None, seed=None):
+                for i in range(count):
+                    generated.append(i)
+                    yield {"question": f"{i}+0?", "answer": i}
+
+        with patch.object(self.quiz_manager, 'available_quizzes', {"Generator": GeneratorQuiz}):
+            _, questions = self.quiz_manager.get_quiz_instance_and_generated_questions(
+                "Generator", 5, seed=3, pool=1000)
+            self.assertEqual(len(generated), 1000)
+            self.assertEqual(len({q["answer"] for q in questions}), 5)
+            _, again = self.quiz_manager.get_quiz_instance_and_generated_questions("Generator", 5, seed=3, pool=1000)
+            self.assertEqual(again, questions)
+            _, small = self.quiz_manager.get_quiz_instance_and_generated_questions("Generator", 5, seed=3, pool=2)
+            self.assertEqual(len(small), 5)
+
+    def test_grade_batch_falls_back_to_check_answer(self):
+        """Testuje ocenianie wielu odpowiedzi dla quizu bez metody check_answers."""
+        questions = self.quiz_manager.quiz_questions["Test Quiz Arytmetyka"]
+        results = self.quiz_manager.grade_batch("Test Quiz Arytmetyka", questions, ['2', '5'])
+        self.assertEqual(results, [True, False])
+        with self.assertRaises(ValueError):
+            self.quiz_manager.grade_batch("Test Quiz Arytmetyka", questions, ['2'])
+
     @patch('builtins.input', side_effect=['2', '4'])
     @patch('builtins.print')
     def test_run_quiz_correct_answers(self, mock_print, mock_input):
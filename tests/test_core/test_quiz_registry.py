@@ -0,0 +1,162 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from math_trainer.core.quiz_registry import QuizRegistry, LazyQuizClasses, register_quiz
+
+DECORATED_QUIZ = '''
+from core.quiz_registry import register_quiz
+
+
+@register_quiz
+class RegistryDecoratedQuiz:
+    quiz_name = "Quiz z dekoratorem"
+
+    def get_name(self):
+        return self.quiz_name
+'''
+
+NAMED_DECORATOR_QUIZ = '''
+from core.quiz_registry import register_quiz
+
+
+@register_quiz("Quiz z nazwą w dekoratorze")
+class RegistryNamedQuiz:
+    def get_name(self):
+        return self.quiz_name
+'''
+
+LEGACY_QUIZ = '''
+class RegistryLegacyQuiz:
+    def get_name(self):
+        """Nazwa quizu."""
+        return "Stary quiz"
+
+
+class RegistryHelper:
+    pass
+'''
+
+DYNAMIC_QUIZ = '''
+class RegistryDynamicQuiz:
+    def get_name(self):
+        return "Quiz " + "dynamiczny"
+'''
+
+
+class TestQuizRegistry(unittest.TestCase):
+    """Testy dla wykrywania klas quizów i pamięci podręcznej rejestru."""
+
+    def setUp(self):
+        """Konfiguracja przed każdym testem."""
+        self.quiz_dir = tempfile.mkdtemp()
+        self.modules = {"registry_decorated": DECORATED_QUIZ, "registry_named": NAMED_DECORATOR_QUIZ,
+                        "registry_legacy": LEGACY_QUIZ}
+        for module_name, source in self.modules.items():
+            self.write_module(module_name, source)
+
+    def tearDown(self):
+        """Czyszczenie po każdym teście."""
+        shutil.rmtree(self.quiz_dir)
+        for module_name in list(self.modules) + ["registry_dynamic"]:
+            sys.modules.pop(module_name, None)
+
+    def write_module(self, module_name, source):
+        with open(os.path.join(self.quiz_dir, module_name + ".py"), 'w', encoding='utf-8') as f:
+            f.write(source)
+
+    def test_discover_without_importing(self):
+        """Testuje wykrywanie quizów bez importowania modułów."""
+        registry = QuizRegistry(self.quiz_dir)
+        discovered = registry.discover()
+
+        self.assertEqual(discovered, {
+            "Quiz z dekoratorem": ("registry_decorated", "RegistryDecoratedQuiz"),
+            "Quiz z nazwą w dekoratorze": ("registry_named", "RegistryNamedQuiz"),
+            "Stary quiz": ("registry_legacy", "RegistryLegacyQuiz"),
+        })
+        self.assertEqual(registry.scanned_files, 3)
+        self.assertEqual(registry.imported_files, 0)
+        for module_name in self.modules:
+            self.assertNotIn(module_name, sys.modules)
+
+    def test_cache_skips_unchanged_files(self):
+        """Testuje pomijanie niezmienionych plików dzięki pamięci podręcznej rejestru."""
+        QuizRegistry(self.quiz_dir).discover()
+
+        registry = QuizRegistry(self.quiz_dir)
+        with patch('math_trainer.core.quiz_registry.QuizRegistry.scan_file') as mock_scan:
+            discovered = registry.discover()
+        mock_scan.assert_not_called()
+        self.assertEqual(registry.cached_files, 3)
+        self.assertIn("Stary quiz", discovered)
+
+    def test_changed_and_removed_files_are_rescanned(self):
+        """Testuje ponowne skanowanie zmienionych i usuniętych plików."""
+        QuizRegistry(self.quiz_dir).discover()
+        self.write_module("registry_legacy", LEGACY_QUIZ.replace("Stary quiz", "Nowy quiz") + "\n")
+        os.remove(os.path.join(self.quiz_dir, "registry_named.py"))
+
+        registry = QuizRegistry(self.quiz_dir)
+        discovered = registry.discover()
+        self.assertEqual(registry.scanned_files, 1)
+        self.assertEqual(set(discovered), {"Quiz z dekoratorem", "Nowy quiz"})
+
+    def test_dynamic_name_is_imported_once(self):
+        """Testuje jednokrotny import modułu z nazwą quizu wyliczaną dynamicznie."""
+        self.write_module("registry_dynamic", DYNAMIC_QUIZ)
+        registry = QuizRegistry(self.quiz_dir)
+        self.assertIn("Quiz dynamiczny", registry.discover())
+        self.assertEqual(registry.imported_files, 1)
+
+        registry = QuizRegistry(self.quiz_dir)
+        self.assertIn("Quiz dynamiczny", registry.discover())
+        self.assertEqual(registry.imported_files, 0)
+
+    @patch('builtins.print')
+    def test_broken_module_is_reported(self, mock_print):
+        """Testuje zgłoszenie błędu dla uszkodzonego modułu quizu."""
+        self.write_module("registry_broken", "class BrokenQuiz(:\n")
+        discovered = QuizRegistry(self.quiz_dir).discover()
+        self.assertEqual(len(discovered), 3)
+        self.assertTrue(mock_print.call_args[0][0].startswith(
+            "Błąd ładowania definicji quizu z pliku registry_broken.py"))
+
+    def test_lazy_classes_import_on_first_use(self):
+        """Testuje import klasy quizu dopiero przy pierwszym użyciu."""
+        registry = QuizRegistry(self.quiz_dir)
+        classes = LazyQuizClasses(registry, registry.discover())
+
+        self.assertIn("Stary quiz", classes)
+        self.assertEqual(len(classes), 3)
+        self.assertEqual(classes.loaded(), [])
+        self.assertNotIn("registry_legacy", sys.modules)
+
+        quiz_class = classes["Stary quiz"]
+        self.assertTrue(isinstance(quiz_class, type))
+        self.assertEqual(quiz_class().get_name(), "Stary quiz")
+        self.assertEqual(classes.loaded(), ["Stary quiz"])
+        self.assertNotIn("registry_decorated", sys.modules)
+        self.assertIsNone(classes.get("Nieznany quiz"))
+
+    def test_decorated_class_name(self):
+        """Testuje nazwę quizu podaną w dekoratorze."""
+        registry = QuizRegistry(self.quiz_dir)
+        classes = LazyQuizClasses(registry, registry.discover())
+        self.assertEqual(classes["Quiz z nazwą w dekoratorze"]().get_name(), "Quiz z nazwą w dekoratorze")
+
+    def test_register_quiz_requires_name(self):
+        """Testuje błąd dekoratora użytego bez nazwy quizu."""
+        with self.assertRaises(TypeError):
+            @register_quiz
+            class UnnamedQuiz:
+                pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+import unittest
+import os
+import sys
+import json
+import shutil
+import tempfile
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from math_trainer.core.quiz_manager import QuizManager
+from math_trainer.core.question_store import LogQuestionStore
+from math_trainer.core.quiz_reloader import QuizReloader
+
+QUIZ_MODULE = '''
+class ReloadQuiz:
+    def get_name(self):
+        return "Quiz przeładowywany"
+
+    def check_answer(self, user_answer, correct_answer):
+        return user_answer == str(correct_answer) + "{suffix}"
+'''
+
+
+class TestQuizReloader(unittest.TestCase):
+    """Testy dla przeładowywania pytań i modułów quizów w działającym procesie."""
+
+    def setUp(self):
+        """Konfiguracja przed każdym testem."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.quiz_dir = os.path.join(self.temp_dir, "quizzes")
+        os.makedirs(self.quiz_dir)
+        self.data_file = os.path.join(self.temp_dir, "quiz_data.json")
+        self.write_data({
+            "Quiz przeładowywany": [{"question": "1+1?", "answer": 2}],
+            "Inny quiz": [{"question": "2+2?", "answer": 4}],
+        })
+        self.write_module("")
+        self.quiz_manager = QuizManager(quiz_dir=self.quiz_dir, quiz_data_file=self.data_file)
+
+    def tearDown(self):
+        """Czyszczenie po każdym teście."""
+        if self.quiz_manager.reloader is not None:
+            self.quiz_manager.reloader.stop()
+        shutil.rmtree(self.temp_dir)
+        sys.modules.pop("reload_quiz", None)
+
+    @staticmethod
+    def touch(path):
+        # Gwarantuje zmianę sygnatury nawet przy zgrubnej rozdzielczości czasu modyfikacji
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def write_data(self, data):
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        if hasattr(self, 'quiz_manager'):
+            self.touch(self.data_file)
+
+    def write_module(self, suffix):
+        path = os.path.join(self.quiz_dir, "reload_quiz.py")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(QUIZ_MODULE.replace("{suffix}", suffix))
+        if hasattr(self, 'quiz_manager'):
+            self.touch(path)
+
+    def test_no_changes(self):
+        """Testuje sprawdzenie zmian, gdy żaden plik się nie zmienił."""
+        reloader = QuizReloader(self.quiz_manager)
+        self.assertEqual(reloader.check(), [])
+        self.assertEqual(reloader.metrics()['reloads'], 0)
+        self.assertEqual(reloader.metrics()['checks'], 1)
+
+    def test_changed_questions_are_swapped(self):
+        """Testuje podmianę pytań po zmianie pliku pytań."""
+        reloader = QuizReloader(self.quiz_manager)
+        old_questions = self.quiz_manager.quiz_questions
+        unchanged = old_questions["Inny quiz"]
+
+        self.write_data({
+            "Quiz przeładowywany": [{"question": "1+1?", "answer": 2}, {"question": "3+3?", "answer": 6}],
+            "Inny quiz": [{"question": "2+2?", "answer": 4}],
+        })
+        self.assertEqual(reloader.check(), ["Quiz przeładowywany"])
+
+        questions = self.quiz_manager.quiz_questions
+        self.assertIsNot(questions, old_questions)
+        self.assertEqual(len(questions["Quiz przeładowywany"]), 2)
+        self.assertIs(questions["Inny quiz"], unchanged)
+        # Trwająca sesja nadal korzysta ze starej wersji
+        self.assertEqual(len(old_questions["Quiz przeładowywany"]), 1)
+
+        metrics = reloader.metrics()
+        self.assertEqual(metrics['reloads'], 1)
+        self.assertEqual(metrics['reloaded_quizzes'], 1)
+        self.assertGreater(metrics['last_reload_time'], 0)
+
+    @patch('builtins.print')
+    def test_own_writes_do_not_duplicate_questions(self, mock_print):
+        """Testuje, czy pytania dodane przez menedżera nie są wczytywane podwójnie."""
+        reloader = QuizReloader(self.quiz_manager)
+        self.quiz_manager.add_question_to_quiz("Inny quiz", "5+5?", 10)
+        self.touch(self.data_file)
+
+        self.assertEqual(reloader.check(), [])
+        self.assertEqual(len(self.quiz_manager.quiz_questions["Inny quiz"]), 2)
+
+    def test_changed_module_is_reimported(self):
+        """Testuje ponowny import zmienionego modułu quizu."""
+        quiz_class = self.quiz_manager.available_quizzes["Quiz przeładowywany"]
+        self.assertTrue(quiz_class().check_answer("2", 2))
+        reloader = QuizReloader(self.quiz_manager)
+
+        self.write_module("!")
+        self.assertEqual(reloader.check(), ["Quiz przeładowywany"])
+
+        new_class = self.quiz_manager.available_quizzes["Quiz przeładowywany"]
+        self.assertIsNot(new_class, quiz_class)
+        self.assertTrue(new_class().check_answer("2!", 2))
+        self.assertEqual(reloader.metrics()['reloaded_modules'], 1)
+
+    def test_new_and_removed_modules(self):
+        """Testuje uwzględnienie nowych i usuniętych modułów quizów."""
+        reloader = QuizReloader(self.quiz_manager)
+        with open(os.path.join(self.quiz_dir, "extra_quiz.py"), 'w', encoding='utf-8') as f:
+            f.write("class ExtraQuiz:\n    def get_name(self):\n        return 'Dodatkowy quiz'\n")
+        os.remove(os.path.join(self.quiz_dir, "reload_quiz.py"))
+
+        self.assertEqual(reloader.check(), ["Dodatkowy quiz", "Quiz przeładowywany"])
+        self.assertEqual(list(self.quiz_manager.available_quizzes), ["Dodatkowy quiz"])
+        sys.modules.pop("extra_quiz", None)
+
+    @patch('builtins.print')
+    def test_broken_file_keeps_previous_version(self, mock_print):
+        """Testuje zachowanie poprzednich pytań po błędzie wczytywania pliku."""
+        reloader = QuizReloader(self.quiz_manager)
+        questions = self.quiz_manager.quiz_questions
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            f.write("{")
+        self.touch(self.data_file)
+
+        self.assertEqual(reloader.check(), [])
+        self.assertIs(self.quiz_manager.quiz_questions, questions)
+        self.assertEqual(reloader.metrics()['errors'], 1)
+
+        # Po naprawieniu pliku zmiana jest wykrywana przy kolejnym sprawdzeniu
+        self.write_data({"Inny quiz": [{"question": "2+2?", "answer": 4}]})
+        self.assertEqual(reloader.check(), ["Quiz przeładowywany"])
+
+    def test_lazy_log_store_invalidates_changed_quizzes(self):
+        """Testuje unieważnianie w pamięci podręcznej tylko zmienionych quizów."""
+        store = LogQuestionStore(os.path.join(self.temp_dir, "store"))
+        store.append("Quiz przeładowywany", "1+1?", 2)
+        store.append("Inny quiz", "2+2?", 4)
+        quiz_manager = QuizManager(quiz_dir=self.quiz_dir, question_store=store, lazy=True)
+        quiz_manager.quiz_questions["Quiz przeładowywany"]
+        quiz_manager.quiz_questions["Inny quiz"]
+        reloader = QuizReloader(quiz_manager)
+
+        LogQuestionStore(store.location).append("Inny quiz", "3+3?", 6)
+        self.assertEqual(reloader.check(), ["Inny quiz"])
+        self.assertEqual(quiz_manager.quiz_questions.cached_quizzes(), ["Quiz przeładowywany"])
+        # Sprawdzenie zmian nie jest liczone jako trafienie w pamięci podręcznej
+        self.assertEqual(quiz_manager.quiz_questions.hits, 0)
+        self.assertEqual(len(quiz_manager.quiz_questions["Inny quiz"]), 2)
+
+    def test_background_reload(self):
+        """Testuje przeładowywanie w wątku w tle."""
+        reloader = self.quiz_manager.enable_hot_reload(interval=0.01)
+        self.write_data({"Nowy quiz": [{"question": "1?", "answer": 1}]})
+
+        deadline = time.monotonic() + 5
+        while "Nowy quiz" not in self.quiz_manager.quiz_questions and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertIn("Nowy quiz", self.quiz_manager.list_quizzes())
+        self.assertGreaterEqual(reloader.metrics()['last_latency'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,228 @@
+import unittest
+import os
+import sys
+import asyncio
+import json
+import threading
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from math_trainer.core.quiz_server import QuizServer
+from math_trainer.core.quiz_client import QuizClient, _print_server_message, simulate_clients
+
+
+class MockQuiz:
+    def get_name(self):
+        return "Mock Quiz"
+
+    def check_answer(self, user_answer_str, correct_answer):
+        return int(user_answer_str) == correct_answer
+
+
+class MockQuizManager:
+    QUESTIONS = [{"question": f"{i}+1?", "answer": i + 1} for i in range(5)]
+
+    def __init__(self):
+        self.threads = set()
+
+    def list_quizzes(self):
+        self.threads.add(threading.current_thread().name)
+        return ["Mock Quiz"]
+
+    def get_quiz_instance_and_questions(self, quiz_name, num_questions=5, user_id=None):
+        self.threads.add(threading.current_thread().name)
+        if quiz_name != "Mock Quiz":
+            raise ValueError(f"Quiz '{quiz_name}' nie istnieje.")
+        return MockQuiz(), self.QUESTIONS[:num_questions]
+
+
+class MockUserProgress:
+    def __init__(self):
+        self.saved = []
+        self.threads = set()
+        self._lock = threading.Lock()
+
+    def save_results(self, quiz_name, score, total_questions):
+        with self._lock:
+            self.saved.append((quiz_name, score, total_questions))
+            self.threads.add(threading.current_thread().name)
+
+    def for_user(self, user_id):
+        progress = self
+
+        class UserResults:
+            def save_results(self, quiz_name, score, total_questions):
+                progress.save_results(f"{user_id}: {quiz_name}", score, total_questions)
+
+        return UserResults()
+
+
+def answer_correctly(number, question):
+    return int(question.split('+')[0]) + 1
+
+
+class TestQuizServer(unittest.TestCase):
+    """Testy dla serwera quizów asyncio i dołączonego klienta."""
+
+    def setUp(self):
+        """Konfiguracja przed każdym testem."""
+        self.user_progress = MockUserProgress()
+        self.quiz_server = QuizServer(MockQuizManager(), self.user_progress)
+
+    def tearDown(self):
+        """Czyszczenie po każdym teście."""
+        self.quiz_server.close()
+
+    def run_with_server(self, scenario):
+        async def main():
+            server = await self.quiz_server.start(port=0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                return await scenario(port)
+        return asyncio.run(main())
+
+    def test_list_and_play(self):
+        """Testuje pobranie listy quizów i rozegranie quizu przez klienta."""
+        async def scenario(port):
+            client = await QuizClient.connect(port=port)
+            quizzes = await client.list_quizzes()
+            result = await client.play("Mock Quiz", 3, answer_correctly)
+            await client.close()
+            return client.server_name, quizzes, result
+
+        server_name, quizzes, result = self.run_with_server(scenario)
+        self.assertEqual(server_name, "Trener Matematyczny")
+        self.assertEqual(quizzes, ["Mock Quiz"])
+        self.assertEqual(result, (3, 3))
+        self.assertEqual(self.user_progress.saved, [("Mock Quiz", 3, 3)])
+        # Zapis wyników oraz wczytywanie listy quizów i pytań odbywa się poza wątkiem pętli zdarzeń
+        self.assertNotIn(threading.main_thread().name, self.user_progress.threads)
+        self.assertTrue(self.quiz_server.quiz_manager.threads)
+        self.assertNotIn(threading.main_thread().name, self.quiz_server.quiz_manager.threads)
+
+    def test_events_include_incorrect_answers(self):
+        """Testuje przekazywanie klientowi zdarzeń o błędnych odpowiedziach."""
+        async def scenario(port):
+            messages = []
+            client = await QuizClient.connect(port=port)
+            result = await client.play("Mock Quiz", 2, lambda number, question: "0", messages.append)
+            await client.close()
+            return result, [message['type'] for message in messages]
+
+        result, kinds = self.run_with_server(scenario)
+        self.assertEqual(result, (0, 2))
+        self.assertEqual(kinds, ['start', 'question', 'incorrect', 'question', 'incorrect', 'finish'])
+
+    def test_unknown_quiz_and_bad_command(self):
+        """Testuje komunikaty błędów dla nieznanego quizu i nieznanego polecenia."""
+        async def scenario(port):
+            client = await QuizClient.connect(port=port)
+            with self.assertRaises(ValueError):
+                await client.play("Nieistniejący", 2, answer_correctly)
+            await client._send("HELP")
+            reply = await client._receive()
+            await client.close()
+            return reply
+
+        reply = self.run_with_server(scenario)
+        self.assertEqual(reply['type'], 'error')
+        self.assertEqual(self.user_progress.saved, [])
+
+    def test_command_error_is_reported_and_connection_stays_open(self):
+        """Testuje, czy błąd obsługi polecenia jest zgłaszany klientowi bez zamykania połączenia."""
+        async def scenario(port):
+            client = await QuizClient.connect(port=port)
+            with patch.object(MockQuizManager, 'list_quizzes', side_effect=RuntimeError("awaria")):
+                await client._send("LIST")
+                reply = await client._receive()
+            quizzes = await client.list_quizzes()
+            await client.close()
+            return reply, quizzes
+
+        reply, quizzes = self.run_with_server(scenario)
+        self.assertEqual(reply, {'type': 'error', 'message': "Błąd serwera: awaria"})
+        self.assertEqual(quizzes, ["Mock Quiz"])
+
+    def test_invalid_utf8_closes_connection(self):
+        """Testuje zamknięcie połączenia po linii niepoprawnej w UTF-8."""
+        async def scenario(port):
+            client = await QuizClient.connect(port=port)
+            client._writer.write(b"\xff\xfe\n")
+            await client._writer.drain()
+            with self.assertRaises(ConnectionError):
+                await client._receive()
+            client._writer.close()
+
+        self.run_with_server(scenario)
+
+    def test_invalid_utf8_mid_quiz_closes_connection(self):
+        """Testuje zamknięcie połączenia i brak zapisu wyniku po niepoprawnej linii w trakcie quizu."""
+        async def scenario(port):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            await reader.readline()
+            writer.write(b"START 3 Mock Quiz\n\xff\xfe\n")
+            await writer.drain()
+            messages = []
+            while True:
+                # Bez zamknięcia połączenia przez serwer odczyt kończy się przekroczeniem czasu
+                line = await asyncio.wait_for(reader.readline(), 5)
+                if not line:
+                    break
+                messages.append(json.loads(line)['type'])
+            writer.close()
+            return messages
+
+        self.assertEqual(self.run_with_server(scenario), ['start', 'question'])
+        self.assertEqual(self.user_progress.saved, [])
+
+    @patch('builtins.print')
+    def test_server_messages_are_printed_like_session_events(self, mock_print):
+        """Testuje wypisywanie wiadomości serwera tak jak zdarzeń lokalnej sesji."""
+        _print_server_message({'type': 'question', 'number': 1, 'total_questions': 2, 'question': "1+1?"})
+        _print_server_message({'type': 'finish', 'quiz_name': "Mock Quiz", 'score': 1, 'total_questions': 2})
+        self.assertEqual([c.args[0] for c in mock_print.call_args_list],
+                         ["\nPytanie 1/2: 1+1?", "\n--- Koniec quizu: Mock Quiz ---", "Twój wynik: 1/2"])
+
+    def test_results_are_saved_for_user(self):
+        """Testuje zapis wyników dla użytkownika wybranego poleceniem USER."""
+        async def scenario(port):
+            client = await QuizClient.connect(port=port)
+            await client.set_user("ala")
+            result = await client.play("Mock Quiz", 2, answer_correctly)
+            with self.assertRaises(ValueError):
+                await client.set_user(" ")
+            await client.close()
+            return result
+
+        self.assertEqual(self.run_with_server(scenario), (2, 2))
+        self.assertEqual(self.user_progress.saved, [("ala: Mock Quiz", 2, 2)])
+
+    def test_disconnect_mid_quiz_does_not_save(self):
+        """Testuje, czy przerwany quiz nie jest zapisywany."""
+        async def scenario(port):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            await reader.readline()
+            writer.write(b"START 3 Mock Quiz\n1\n")
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+            while self.quiz_server.active_connections:
+                await asyncio.sleep(0.01)
+
+        self.run_with_server(scenario)
+        self.assertEqual(self.user_progress.saved, [])
+
+    def test_many_concurrent_sessions(self):
+        """Testuje obsługę wielu równoczesnych sesji klientów."""
+        async def scenario(port):
+            return await simulate_clients(200, "Mock Quiz", 5, answer_correctly, port=port)
+
+        results = self.run_with_server(scenario)
+        self.assertEqual(results, [(5, 5)] * 200)
+        self.assertEqual(len(self.user_progress.saved), 200)
+        self.assertEqual(self.quiz_server.completed_sessions, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
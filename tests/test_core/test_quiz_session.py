@@ -0,0 +1,79 @@
+import unittest
+import os
+import sys
+import asyncio
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from math_trainer.core.quiz_session import QuizSession
+
+
+class MockQuiz:
+    def get_name(self):
+        return "Mock Quiz"
+
+    def check_answer(self, user_answer_str, correct_answer):
+        if user_answer_str == "err":
+            raise ValueError("Niepoprawny format")
+        return int(user_answer_str) == correct_answer
+
+
+QUESTIONS = [
+    {"question": "1+1?", "answer": 2},
+    {"question": "2*2?", "answer": 4},
+    {"question": "3*3?", "answer": 9}
+]
+
+
+class TestQuizSession(unittest.TestCase):
+    """Testy dla silnika sesji quizu niezależnego od konsoli."""
+
+    def test_run_with_iterator_and_events(self):
+        """Testuje przebieg quizu z odpowiedziami z iteratora i listą zdarzeń."""
+        events = []
+        session = QuizSession(MockQuiz(), QUESTIONS)
+        score, total = session.run(iter(["2", "5", "err"]), events.append)
+
+        self.assertEqual((score, total), (1, 3))
+        self.assertEqual([e.kind for e in events],
+                         ['start', 'question', 'correct', 'question', 'incorrect', 'question', 'input_error',
+                          'finish'])
+        self.assertEqual(events[4].data['correct_answer'], 4)
+        self.assertEqual(session.outcomes, [True, False, None])
+
+    def test_run_with_callback(self):
+        """Testuje źródło odpowiedzi w postaci funkcji zwrotnej."""
+        answers = {"1+1?": "2", "2*2?": "4", "3*3?": "9"}
+        session = QuizSession(MockQuiz(), QUESTIONS)
+        self.assertEqual(session.run(lambda number, question: answers[question]), (3, 3))
+
+    def test_exhausted_source_finishes_quiz(self):
+        """Testuje zakończenie quizu po wyczerpaniu odpowiedzi."""
+        events = []
+        score, total = QuizSession(MockQuiz(), QUESTIONS).run(["2"], events.append)
+        self.assertEqual((score, total), (1, 3))
+        self.assertEqual(events[-1].kind, 'finish')
+
+    def test_run_async_many_sessions(self):
+        """Testuje wiele równoczesnych sesji z asynchronicznym źródłem odpowiedzi."""
+        async def answers():
+            for answer in ("2", "4", "0"):
+                await asyncio.sleep(0)
+                yield answer
+
+        async def main():
+            sessions = [QuizSession(MockQuiz(), QUESTIONS) for _ in range(500)]
+            return await asyncio.gather(*(s.run_async(answers()) for s in sessions))
+
+        results = asyncio.run(main())
+        self.assertEqual(len(results), 500)
+        self.assertTrue(all(result == (2, 3) for result in results))
+
+    def test_invalid_quiz_instance(self):
+        """Testuje odrzucenie obiektu quizu bez metody check_answer."""
+        with self.assertRaises(TypeError):
+            QuizSession(object(), QUESTIONS)
+
+
+if __name__ == '__main__':
+    unittest.main()
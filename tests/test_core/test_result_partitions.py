@@ -0,0 +1,125 @@
+import unittest
+import os
+import sys
+import csv
+import shutil
+import tempfile
+import threading
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from math_trainer.core.result_partitions import (DEFAULT_USER, list_users, migrate_legacy_results,
+                                                 partition_file, partitions_dir)
+from math_trainer.core.user_progress import UserProgress
+
+
+class TestResultPartitions(unittest.TestCase):
+    """Testy dla podziału wyników na partycje użytkowników."""
+
+    def setUp(self):
+        """Konfiguracja przed każdym testem."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_file = os.path.join(self.temp_dir, "results.csv")
+
+    def tearDown(self):
+        """Czyszczenie po każdym teście."""
+        shutil.rmtree(self.temp_dir)
+
+    def progress(self, user_id=None, **options):
+        return UserProgress(data_file=self.data_file, user_id=user_id, **options)
+
+    def test_partition_file(self):
+        """Testuje bezpieczne i jednoznaczne nazwy plików partycji."""
+        self.assertEqual(partition_file(self.data_file, DEFAULT_USER), self.data_file)
+        path = partition_file(self.data_file, "Ala/../Kot")
+        self.assertEqual(os.path.dirname(path), partitions_dir(self.data_file))
+        self.assertNotEqual(path, partition_file(self.data_file, "Ala_Kot"))
+        with self.assertRaises(ValueError):
+            partition_file(self.data_file, "a\nb")
+
+    @patch('builtins.print')
+    def test_users_read_only_their_partition(self, mock_print):
+        """Testuje, czy każdy użytkownik czyta tylko własne wyniki."""
+        self.progress().save_results("Quiz A", 1, 10)
+        self.progress("ala").save_results("Quiz A", 7, 10)
+        self.progress("ola").save_results("Quiz B", 9, 10)
+
+        self.assertEqual([r['Score'] for r in self.progress("ala").load_results()], [7])
+        self.assertEqual([r['Score'] for r in self.progress().load_results()], [1])
+        self.assertEqual(list_users(self.data_file), [DEFAULT_USER, "ala", "ola"])
+
+        self.progress("ola").analyze_progress()
+        mock_print.assert_any_call("  Quiz B: 9/10 (90.00%)")
+
+    def test_legacy_file_belongs_to_default_user(self):
+        """Testuje przypisanie dotychczasowego pliku wyników użytkownikowi domyślnemu."""
+        with open(self.data_file, 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows([['Timestamp', 'Quiz', 'Score', 'TotalQuestions'],
+                                     ["2023-01-01 10:00:00", "Quiz A", 5, 10]])
+        self.assertEqual(len(self.progress(DEFAULT_USER).load_results()), 1)
+        self.assertEqual(self.progress("ala").load_results(), [])
+
+    def test_migrate_legacy_results(self):
+        """Testuje przeniesienie dotychczasowych wyników do partycji użytkownika."""
+        with open(self.data_file, 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows([['Timestamp', 'Quiz', 'Score', 'TotalQuestions'],
+                                     ["2023-01-01 10:00:00", "Quiz A", 5, 10],
+                                     ["2023-01-02 10:00:00", "Quiz B", 6, 10]])
+
+        self.assertEqual(migrate_legacy_results(self.data_file, "ala"), 2)
+        self.assertEqual([r['Score'] for r in self.progress("ala").load_results()], [5, 6])
+        self.assertEqual(self.progress().load_results(), [])
+        self.assertTrue(os.path.exists(self.data_file + ".migrated"))
+
+    @patch('builtins.print')
+    def test_for_user_shares_settings(self, mock_print):
+        """Testuje obiekty innych użytkowników z tymi samymi ustawieniami."""
+        progress = self.progress(buffered=True, flush_interval=60)
+        ala = progress.for_user("ala")
+        self.assertIs(progress.for_user("ala"), ala)
+        self.assertIs(progress.for_user(None), progress)
+
+        ala.save_results("Quiz A", 3, 5)
+        self.assertEqual([r['Score'] for r in ala.load_results()], [3])
+        progress.close()
+
+    @patch('builtins.print')
+    def test_for_user_shares_one_writer_thread(self, mock_print):
+        """Testuje zapis wyników wszystkich użytkowników przez jeden wątek."""
+        for backend in ("csv", "columnar", "sqlite"):
+            with self.subTest(backend=backend):
+                data_file = os.path.join(self.temp_dir, backend, "results.csv")
+                progress = UserProgress(data_file=data_file, buffered=True, flush_interval=60, backend=backend)
+                threads = threading.active_count()
+                for number in range(20):
+                    progress.for_user(f"user{number}").save_results("Quiz A", number, 20)
+                self.assertEqual(threading.active_count(), threads)
+                progress.flush()
+                self.assertEqual([r['Score'] for r in progress.for_user("user7").load_results()], [7])
+                progress.close()
+
+    @patch('builtins.print')
+    def test_for_user_evicts_least_recently_used(self, mock_print):
+        """Testuje zamykanie najdawniej używanych obiektów użytkowników."""
+        progress = self.progress(buffered=True, flush_interval=60)
+        with patch('math_trainer.core.user_progress.USER_CACHE_SIZE', 2):
+            ala = progress.for_user("ala")
+            progress.for_user("ola").save_results("Quiz A", 4, 5)
+            self.assertIs(progress.for_user("ala"), ala)
+            progress.for_user("ela")
+        self.assertEqual(list(progress._users), ["ala", "ela"])
+        # Wyniki zamkniętego obiektu zostały zapisane
+        self.assertEqual([r['Score'] for r in self.progress("ola").load_results()], [4])
+        progress.close()
+
+    def test_columnar_partition(self):
+        """Testuje partycję użytkownika w formacie kolumnowym."""
+        progress = self.progress("ala", backend="columnar")
+        progress.save_results("Quiz A", 4, 5)
+        self.assertTrue(os.path.isdir(os.path.splitext(partition_file(self.data_file, "ala"))[0] + "_columns"))
+        self.assertEqual([r['Score'] for r in progress.load_results()], [4])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import unittest
+import os
+import sys
+import csv
+import shutil
+import tempfile
+from datetime import date
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from math_trainer.core.result_records import ResultRecord, read_csv_records, timestamp_bound
+from math_trainer.core.user_progress import UserProgress
+
+ROWS = [
+    ["2023-01-01 10:00:00", "Quiz A", 5, 10],
+    ["2023-01-02 11:00:00", "Quiz B", 8, 10],
+    ["2023-01-03 12:00:00", "Quiz A", 7, 10],
+    ["2023-01-04 09:30:00", "Quiz A", 9, 10],
+]
+
+
+class TestResultRecord(unittest.TestCase):
+    """Testy dla rekordu wyniku."""
+
+    def test_fields_and_column_names(self):
+        """Testuje dostęp do pól rekordu przez atrybuty, nazwy kolumn i indeksy."""
+        record = ResultRecord(*ROWS[0])
+        self.assertEqual(record.score, 5)
+        self.assertEqual(record['TotalQuestions'], 10)
+        self.assertEqual(record[1], "Quiz A")
+        self.assertEqual(record.as_dict(), {'Timestamp': "2023-01-01 10:00:00", 'Quiz': "Quiz A", 'Score': 5,
+                                            'TotalQuestions': 10})
+        self.assertFalse(hasattr(record, '__dict__'))
+
+    def test_dict_compatibility(self):
+        """Testuje zgodność rekordu ze słownikiem."""
+        record = ResultRecord(*ROWS[1])
+        self.assertEqual(dict(record), record.as_dict())
+        self.assertEqual(dict(record.items()), record.as_dict())
+        self.assertEqual(record.get('Score'), 8)
+        self.assertIsNone(record.get('Brak'))
+
+    def test_quiz_names_are_shared(self):
+        """Testuje współdzielenie napisów nazw quizów przez rekordy."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        data_file = os.path.join(temp_dir, "results.csv")
+        with open(data_file, 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows([['Timestamp', 'Quiz', 'Score', 'TotalQuestions']] + ROWS)
+        results = UserProgress(data_file=data_file).load_results()
+        self.assertEqual(type(results[0]).__name__, "ResultRecord")
+        self.assertIs(results[0]['Quiz'], results[2]['Quiz'])
+
+    def test_timestamp_bound(self):
+        """Testuje zamianę granic przedziału czasu na znaczniki czasu."""
+        self.assertEqual(timestamp_bound("2023-01-02"), "2023-01-02 00:00:00")
+        self.assertEqual(timestamp_bound(date(2023, 1, 2)), "2023-01-02 00:00:00")
+        self.assertIsNone(timestamp_bound(None))
+        with self.assertRaises(ValueError):
+            timestamp_bound("02.01.2023")
+
+
+class TestIterResults(unittest.TestCase):
+    """Testy dla strumieniowego odczytu wyników we wszystkich formatach."""
+
+    def setUp(self):
+        """Konfiguracja przed każdym testem."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_file = os.path.join(self.temp_dir, "results.csv")
+
+    def tearDown(self):
+        """Czyszczenie po każdym teście."""
+        shutil.rmtree(self.temp_dir)
+
+    def progress(self, backend):
+        user_progress = UserProgress(data_file=self.data_file, backend=backend)
+        if backend == "csv":
+            with open(self.data_file, 'a', newline='', encoding='utf-8') as f:
+                csv.writer(f).writerows(ROWS)
+        elif backend == "columnar":
+            from math_trainer.core.columnar_results import timestamp_to_epoch
+            user_progress._columnar.append([[timestamp_to_epoch(row[0])] + row[1:] for row in ROWS])
+        else:
+            user_progress._sqlite.append(ROWS)
+        self.addCleanup(user_progress.close)
+        return user_progress
+
+    def test_filters_for_each_backend(self):
+        """Testuje filtrowanie wyników we wszystkich formatach."""
+        for backend in ("csv", "columnar", "sqlite"):
+            with self.subTest(backend=backend):
+                user_progress = self.progress(backend)
+                self.assertEqual(list(user_progress.iter_results()), [ResultRecord(*row) for row in ROWS])
+                self.assertEqual([r.score for r in user_progress.iter_results("Quiz A")], [5, 7, 9])
+                self.assertEqual([r.score for r in user_progress.iter_results(
+                    since="2023-01-02", until="2023-01-04")], [8, 7])
+                self.assertEqual([r.score for r in user_progress.iter_results("Quiz A", limit=2)], [5, 7])
+                self.assertEqual([r.score for r in user_progress.iter_results(newest_first=True)], [9, 7, 8, 5])
+                self.assertEqual([r.score for r in user_progress.last_results(2, "Quiz A")], [7, 9])
+                self.assertEqual(list(user_progress.iter_results("Quiz C")), [])
+
+    def test_tail_read_crosses_blocks(self):
+        """Testuje odczyt od końca pliku przez granice bloków."""
+        user_progress = self.progress("csv")
+        rows = [[f"2023-02-01 10:{i // 60:02d}:{i % 60:02d}", f"Quiz {i % 3}", i, 100] for i in range(500)]
+        with open(self.data_file, 'a', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows(rows)
+
+        with patch('math_trainer.core.result_records.TAIL_BLOCK_SIZE', 64):
+            records = list(read_csv_records(self.data_file, newest_first=True))
+        self.assertEqual(len(records), len(ROWS) + 500)
+        self.assertEqual([r.score for r in records[:3]], [499, 498, 497])
+        self.assertEqual(records[-1], ResultRecord(*ROWS[0]))
+        self.assertEqual([r.score for r in user_progress.last_results(3)], [497, 498, 499])
+
+    @patch('builtins.print')
+    def test_invalid_rows_are_skipped(self, mock_print):
+        """Testuje pomijanie nieprawidłowych wierszy."""
+        user_progress = self.progress("csv")
+        with open(self.data_file, 'a', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows([["2023-01-05 10:00:00", "Quiz A", "x", 10], ["za", "mało"]])
+        self.assertEqual(len(list(user_progress.iter_results(newest_first=True))), len(ROWS))
+        self.assertEqual(len(user_progress.load_results()), len(ROWS))
+
+    @patch('builtins.print')
+    def test_analyze_progress_streams_records(self, mock_print):
+        """Testuje przekazywanie rekordów do wykresu bez wczytywania listy wyników."""
+        user_progress = self.progress("csv")
+        with patch('core.visualization.plot_progress') as mock_plot:
+            user_progress.analyze_progress("Quiz B", visualize=True)
+        self.assertEqual(list(mock_plot.call_args[0][0]), [ResultRecord(*ROWS[1])])
+
+
+if __name__ == '__main__':
+    unittest.main()
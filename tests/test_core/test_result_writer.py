@@ -0,0 +1,132 @@
+import unittest
+import os
+import sys
+import csv
+import time
+import shutil
+import tempfile
+import threading
+import multiprocessing
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from math_trainer.core.result_writer import BufferedResultWriter, _open_writers, append_rows, format_timestamp
+
+
+def _append_many(data_file, worker, count):
+    for i in range(count):
+        append_rows(data_file, [[f"w{worker}", "x" * 2000, i, count]])
+
+
+def read_rows(data_file):
+    with open(data_file, 'r', newline='', encoding='utf-8') as f:
+        return list(csv.reader(f))
+
+
+class TestResultWriter(unittest.TestCase):
+    """Testy dla buforowanego zapisu wyników."""
+
+    def setUp(self):
+        """Konfiguracja przed każdym testem."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_file = os.path.join(self.temp_dir, "results.csv")
+
+    def tearDown(self):
+        """Czyszczenie po każdym teście."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_format_timestamp(self):
+        """Testuje formatowanie znacznika czasu z pamięcią ostatniej sekundy."""
+        now = time.time()
+        self.assertEqual(format_timestamp(now), time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)))
+        self.assertEqual(format_timestamp(now + 3600),
+                         time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now + 3600)))
+
+    def test_flush_writes_all_rows(self):
+        """Testuje, czy flush zapisuje wszystkie wiersze z kolejki."""
+        writer = BufferedResultWriter(self.data_file, flush_interval=60, flush_size=1000)
+        for i in range(10):
+            writer.write(["2024-01-01 10:00:00", "Quiz A", i, 10])
+        writer.flush()
+        rows = read_rows(self.data_file)
+        self.assertEqual([int(row[2]) for row in rows], list(range(10)))
+        writer.close()
+
+    def test_rows_are_batched(self):
+        """Testuje zapis wierszy z kolejki jedną partią."""
+        writer = BufferedResultWriter(self.data_file, flush_interval=60, flush_size=1000)
+        with patch.object(writer, '_write_batch', wraps=writer._write_batch) as write_batch:
+            for i in range(50):
+                writer.write(["ts", "Quiz", i, 10])
+            writer.close()
+        self.assertEqual(write_batch.call_count, 1)
+        self.assertEqual(len(read_rows(self.data_file)), 50)
+
+    def test_flush_size_triggers_write(self):
+        """Testuje zapis partii po zebraniu flush_size wierszy."""
+        writer = BufferedResultWriter(self.data_file, flush_interval=60, flush_size=5)
+        for i in range(5):
+            writer.write(["ts", "Quiz", i, 10])
+        deadline = time.time() + 5
+        while not os.path.exists(self.data_file) and time.time() < deadline:
+            time.sleep(0.01)
+        writer.close()
+        self.assertEqual(len(read_rows(self.data_file)), 5)
+
+    def test_write_after_close_raises(self):
+        """Testuje błąd zapisu po zamknięciu obiektu zapisu."""
+        writer = BufferedResultWriter(self.data_file)
+        writer.close()
+        with self.assertRaises(ValueError):
+            writer.write(["ts", "Quiz", 1, 1])
+
+    @patch('builtins.print')
+    def test_failed_write_is_reported_and_retried(self, mock_print):
+        """Testuje zgłoszenie nieudanego zapisu i ponowienie go przy kolejnym flush."""
+        writer = BufferedResultWriter(os.path.join(self.temp_dir, "brak", "results.csv"), flush_interval=60)
+        writer.write(["ts", "Quiz", 1, 1])
+        with self.assertRaises(OSError):
+            writer.flush()
+        writer.data_file = self.data_file
+        writer.flush()
+        self.assertEqual(len(read_rows(self.data_file)), 1)
+        writer.close()
+
+    @patch('builtins.print')
+    def test_lost_rows_are_reported_on_close(self, mock_print):
+        """Testuje ostrzeżenie o wierszach, których nie udało się zapisać przed zamknięciem."""
+        writer = BufferedResultWriter(os.path.join(self.temp_dir, "brak", "results.csv"), flush_interval=60)
+        self.assertIn(writer, _open_writers)
+        writer.write(["ts", "Quiz", 1, 1])
+        writer.write(["ts", "Quiz", 2, 1])
+        writer.close()
+        self.assertNotIn(writer, _open_writers)
+        self.assertTrue(mock_print.call_args[0][0].startswith("Ostrzeżenie: Nie zapisano 2 wyników"))
+
+    def test_concurrent_threads(self):
+        """Testuje zapis wierszy z wielu wątków naraz."""
+        writer = BufferedResultWriter(self.data_file, flush_interval=0.01, flush_size=16)
+        threads = [threading.Thread(target=lambda t=t: [writer.write([t, "Quiz", i, 100]) for i in range(100)])
+                   for t in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        writer.close()
+        self.assertEqual(len(read_rows(self.data_file)), 800)
+
+    def test_concurrent_processes_do_not_interleave(self):
+        """Testuje, czy wiersze dopisywane przez kilka procesów się nie przeplatają."""
+        processes = [multiprocessing.Process(target=_append_many, args=(self.data_file, w, 50)) for w in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        rows = read_rows(self.data_file)
+        self.assertEqual(len(rows), 200)
+        self.assertTrue(all(len(row) == 4 and row[1] == "x" * 2000 for row in rows))
+
+
+if __name__ == '__main__':
+    unittest.main()
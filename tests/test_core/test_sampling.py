@@ -0,0 +1,47 @@
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from math_trainer.core.sampling import sample_indices, reservoir_sample
+
+
+class TestSampling(unittest.TestCase):
+    """Testy dla funkcji losowania pytań."""
+
+    def test_sample_indices_reproducible(self):
+        """Testuje powtarzalność losowania indeksów przy tym samym ziarnie."""
+        first = sample_indices(10 ** 9, 5, seed=42)
+        self.assertEqual(first, sample_indices(10 ** 9, 5, seed=42))
+        self.assertEqual(len(set(first)), 5)
+
+    def test_sample_indices_small_population(self):
+        """Testuje zwracanie wszystkich indeksów, gdy populacja jest mniejsza niż k."""
+        self.assertEqual(sample_indices(3, 5, seed=1), [0, 1, 2])
+
+    def test_reservoir_sample_generator(self):
+        """Testuje losowanie z generatora bez znajomości jego długości."""
+        source = (i for i in range(100_000))
+        sample = reservoir_sample(source, 10, seed=7)
+        self.assertEqual(len(sample), 10)
+        self.assertEqual(len(set(sample)), 10)
+        self.assertEqual(sample, reservoir_sample(range(100_000), 10, seed=7))
+
+    def test_reservoir_sample_uniform(self):
+        """Testuje, czy każdy element strumienia ma podobną szansę wylosowania."""
+        counts = [0] * 10
+        for seed in range(3000):
+            for item in reservoir_sample(range(10), 3, seed=seed):
+                counts[item] += 1
+        for count in counts:
+            self.assertAlmostEqual(count / 3000, 0.3, delta=0.05)
+
+    def test_reservoir_sample_short_stream(self):
+        """Testuje strumień krótszy niż rozmiar próbki."""
+        self.assertEqual(reservoir_sample(iter([1, 2]), 5), [1, 2])
+        self.assertEqual(reservoir_sample([1, 2, 3], 0), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
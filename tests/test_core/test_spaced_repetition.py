@@ -0,0 +1,140 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from math_trainer.core.spaced_repetition import (SpacedRepetitionScheduler, ReviewState, DAY, RELEARN_DELAY,
+                                                 MIN_EASINESS)
+from math_trainer.core.quiz_manager import QuizManager
+
+QUESTIONS = [{"question": f"{i}+{i}?", "answer": 2 * i} for i in range(10)]
+NOW = 1_700_000_000.0
+
+
+class TestReviewState(unittest.TestCase):
+    """Testy dla aktualizacji stanu powtórek według SM-2."""
+
+    def test_correct_answers_grow_interval(self):
+        """Testuje wydłużanie odstępu powtórek po poprawnych odpowiedziach."""
+        state = ReviewState()
+        intervals = []
+        for day in range(4):
+            state.update(True, NOW)
+            intervals.append(state.interval)
+        self.assertEqual(intervals[:2], [1.0, 6.0])
+        self.assertGreater(intervals[2], intervals[1])
+        self.assertGreater(intervals[3], intervals[2])
+        self.assertEqual(state.due, NOW + state.interval * DAY)
+
+    def test_incorrect_answer_resets(self):
+        """Testuje powrót do nauki po błędnych odpowiedziach."""
+        state = ReviewState()
+        state.update(True, NOW)
+        state.update(True, NOW)
+        for _ in range(10):
+            state.update(False, NOW)
+        self.assertEqual(state.repetitions, 0)
+        self.assertEqual(state.due, NOW + RELEARN_DELAY)
+        self.assertEqual(state.easiness, MIN_EASINESS)
+        self.assertAlmostEqual(state.weakness, 10 / 12)
+
+
+class TestSpacedRepetitionScheduler(unittest.TestCase):
+    """Testy dla wyboru pytań przez harmonogram powtórek."""
+
+    def setUp(self):
+        """Konfiguracja przed każdym testem."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_file = os.path.join(self.temp_dir, "question_log.csv")
+
+    def tearDown(self):
+        """Czyszczenie po każdym teście."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_new_questions_in_store_order(self):
+        """Testuje wybór nowych pytań w kolejności z magazynu."""
+        scheduler = SpacedRepetitionScheduler()
+        self.assertEqual(scheduler.select("Quiz", QUESTIONS, 3, now=NOW), QUESTIONS[:3])
+
+    def test_mastered_questions_are_skipped(self):
+        """Testuje pomijanie pytań, których termin powtórki jeszcze nie minął."""
+        scheduler = SpacedRepetitionScheduler()
+        scheduler.record_many("Quiz", [(q, True) for q in QUESTIONS[:3]], now=NOW)
+        self.assertEqual(scheduler.select("Quiz", QUESTIONS, 3, now=NOW + 60), QUESTIONS[3:6])
+
+    def test_due_questions_first_weakest_on_ties(self):
+        """Testuje wybór zaległych pytań, a przy równym terminie najsłabiej opanowanych."""
+        scheduler = SpacedRepetitionScheduler()
+        scheduler.record("Quiz", QUESTIONS[0], True, now=NOW)
+        scheduler.record("Quiz", QUESTIONS[1], False, now=NOW - RELEARN_DELAY)
+        scheduler.record("Quiz", QUESTIONS[2], True, now=NOW - DAY)
+        scheduler.record("Quiz", QUESTIONS[2], False, now=NOW - RELEARN_DELAY)
+
+        selected = scheduler.select("Quiz", QUESTIONS, 4, now=NOW)
+        # Pytania 1 i 2 mają ten sam termin; pytanie 1 ma więcej pomyłek (1/1 wobec 1/2)
+        self.assertEqual(selected, [QUESTIONS[1], QUESTIONS[2], QUESTIONS[3], QUESTIONS[4]])
+
+    def test_fills_with_upcoming_when_everything_is_known(self):
+        """Testuje uzupełnianie wyboru pytaniami z najbliższym terminem powtórki."""
+        scheduler = SpacedRepetitionScheduler()
+        questions = QUESTIONS[:3]
+        scheduler.record("Quiz", questions[0], True, now=NOW)
+        scheduler.record("Quiz", questions[1], True, now=NOW - DAY / 2)
+        scheduler.record("Quiz", questions[2], True, now=NOW - DAY / 4)
+        self.assertEqual(scheduler.select("Quiz", questions, 2, now=NOW), [questions[1], questions[2]])
+        # Wybór nie zmienia indeksu - bez odpowiedzi kolejne wywołanie zwraca to samo
+        self.assertEqual(scheduler.select("Quiz", questions, 2, now=NOW), [questions[1], questions[2]])
+
+    def test_users_are_independent(self):
+        """Testuje niezależne harmonogramy różnych użytkowników."""
+        scheduler = SpacedRepetitionScheduler()
+        scheduler.record("Quiz", QUESTIONS[0], True, user_id="ala", now=NOW)
+        self.assertEqual(scheduler.select("Quiz", QUESTIONS, 1, user_id="ala", now=NOW), [QUESTIONS[1]])
+        self.assertEqual(scheduler.select("Quiz", QUESTIONS, 1, user_id="ola", now=NOW), [QUESTIONS[0]])
+
+    def test_log_is_replayed(self):
+        """Testuje odtworzenie harmonogramu z dziennika odpowiedzi."""
+        scheduler = SpacedRepetitionScheduler(self.log_file)
+        scheduler.record_many("Quiz", [(QUESTIONS[0], True), (QUESTIONS[1], False), (QUESTIONS[2], None)],
+                              now=NOW)
+
+        restored = SpacedRepetitionScheduler(self.log_file)
+        self.assertEqual(restored.state("Quiz", QUESTIONS[0]).interval, 1.0)
+        self.assertEqual(restored.state("Quiz", QUESTIONS[1]).lapses, 1)
+        self.assertIsNone(restored.state("Quiz", QUESTIONS[2]))
+        self.assertEqual(restored.due_count("Quiz", now=NOW + RELEARN_DELAY), 1)
+
+    def test_stale_heap_entries_are_compacted(self):
+        """Testuje usuwanie nieaktualnych wpisów z kopca terminów."""
+        scheduler = SpacedRepetitionScheduler()
+        for _ in range(200):
+            scheduler.record("Quiz", QUESTIONS[0], False, now=NOW)
+        self.assertLess(len(scheduler._heaps[("default", "Quiz")]), 100)
+        self.assertEqual(scheduler.select("Quiz", QUESTIONS, 1, now=NOW + DAY), [QUESTIONS[0]])
+
+
+class TestQuizManagerScheduling(unittest.TestCase):
+    """Testy dla wyboru pytań w QuizManager przy włączonym harmonogramie powtórek."""
+
+    @patch('builtins.print')
+    @patch('builtins.input', side_effect=["0", "wrong"])
+    def test_scheduler_selection_and_recording(self, mock_input, mock_print):
+        """Testuje wybór pytań przez harmonogram i zapis odpowiedzi po quizie."""
+        scheduler = SpacedRepetitionScheduler()
+        quiz_manager = QuizManager(scheduler=scheduler, disk_sampling=True)
+        questions = quiz_manager.quiz_questions["Podstawowa Arytmetyka"]
+
+        quiz_instance, selected = quiz_manager.get_quiz_instance_and_questions("Podstawowa Arytmetyka", 2)
+        self.assertEqual(selected, questions[:2])
+
+        quiz_manager.run_quiz(quiz_instance, selected)
+        self.assertIsNotNone(scheduler.state("Podstawowa Arytmetyka", selected[0]))
+        self.assertEqual(scheduler.state("Podstawowa Arytmetyka", selected[1]).lapses, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
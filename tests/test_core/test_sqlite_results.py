@@ -0,0 +1,140 @@
+import unittest
+import os
+import sys
+import csv
+import shutil
+import sqlite3
+import tempfile
+import threading
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from math_trainer.core.sqlite_results import SqliteResults, BufferedSqliteWriter, csv_to_sqlite, sqlite_to_csv
+from math_trainer.core.user_progress import UserProgress
+
+ROWS = [
+    ["2023-01-01 10:00:00", "Quiz A", 5, 10],
+    ["2023-01-02 11:00:00", "Quiz B", 8, 10],
+    ["2023-01-03 12:00:00", "Quiz A", 7, 10],
+]
+
+
+class TestSqliteResults(unittest.TestCase):
+    """Testy dla wyników w bazie SQLite."""
+
+    def setUp(self):
+        """Konfiguracja przed każdym testem."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "results.sqlite3")
+        self.store = SqliteResults(self.db_path)
+
+    def tearDown(self):
+        """Czyszczenie po każdym teście."""
+        self.store.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_append_and_read(self):
+        """Testuje dopisywanie i odczyt wyników."""
+        self.store.append(ROWS)
+        self.assertEqual(len(self.store), 3)
+        self.assertEqual(self.store.quiz_names(), ["Quiz A", "Quiz B"])
+        self.assertEqual([list(row) for row in self.store.iter_rows()], ROWS)
+        self.assertEqual([r['Score'] for r in self.store.iter_records("Quiz A")], [5, 7])
+
+    def test_wal_mode_and_index(self):
+        """Testuje tryb WAL i użycie indeksu przy podsumowaniach."""
+        connection = sqlite3.connect(self.db_path)
+        try:
+            self.assertEqual(connection.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            plan = " ".join(row[-1] for row in connection.execute(
+                "EXPLAIN QUERY PLAN SELECT quiz, COUNT(*), SUM(score), MAX(timestamp) FROM results GROUP BY quiz"))
+        finally:
+            connection.close()
+        self.assertIn("COVERING INDEX results_quiz_timestamp", plan)
+
+    def test_summaries(self):
+        """Testuje podsumowania wyników per quiz liczone przez SQLite."""
+        self.store.append(ROWS)
+        self.assertEqual(self.store.summaries()["Quiz A"], {
+            'count': 2, 'total_score': 12, 'total_questions': 20,
+            'min_score': 5, 'max_score': 7, 'last_timestamp': "2023-01-03 12:00:00"})
+        self.assertEqual(list(self.store.summaries("Quiz B")), ["Quiz B"])
+        self.assertEqual(SqliteResults(os.path.join(self.temp_dir, "empty.sqlite3")).summaries(), {})
+
+    def test_concurrent_writers(self):
+        """Testuje równoczesny zapis z kilku połączeń."""
+        def write(offset):
+            store = SqliteResults(self.db_path)
+            for i in range(50):
+                store.append([["2023-01-01 10:00:00", f"Quiz {offset}", i, 50]])
+            store.close()
+
+        threads = [threading.Thread(target=write, args=(offset,)) for offset in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(self.store), 200)
+
+    def test_buffered_writer(self):
+        """Testuje zapis z opóźnieniem do bazy SQLite."""
+        writer = BufferedSqliteWriter(self.store, flush_interval=60)
+        for row in ROWS:
+            writer.write(row)
+        writer.flush()
+        self.assertEqual(len(self.store), 3)
+        writer.close()
+
+    def test_csv_round_trip(self):
+        """Testuje import pliku CSV z pominięciem błędnych wierszy."""
+        csv_path = os.path.join(self.temp_dir, "results.csv")
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Timestamp', 'Quiz', 'Score', 'TotalQuestions'])
+            writer.writerows(ROWS)
+            writer.writerow(["2023-01-04 10:00:00", "Quiz A", "x", 10])
+
+        db_path = os.path.join(self.temp_dir, "imported.sqlite3")
+        with patch('builtins.print'):
+            self.assertEqual(csv_to_sqlite(csv_path, db_path, chunk_size=2), 3)
+        output_path = os.path.join(self.temp_dir, "out.csv")
+        self.assertEqual(sqlite_to_csv(db_path, output_path), 3)
+
+        with open(output_path, 'r', newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], ['Timestamp', 'Quiz', 'Score', 'TotalQuestions'])
+        self.assertEqual(rows[1:], [[str(value) for value in row] for row in ROWS])
+
+    @patch('builtins.print')
+    def test_user_progress_sqlite_backend(self, mock_print):
+        """Testuje UserProgress z wynikami w bazie SQLite."""
+        user_progress = UserProgress(data_file=os.path.join(self.temp_dir, "progress.csv"), backend="sqlite")
+        user_progress.save_results("Quiz A", 5, 10)
+        user_progress.save_results("Quiz B", 8, 10)
+
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, "progress.csv")))
+        self.assertEqual([r['Quiz'] for r in user_progress.load_results()], ["Quiz A", "Quiz B"])
+
+        with patch('core.visualization.plot_progress') as mock_plot:
+            user_progress.analyze_progress("Quiz B", visualize=True)
+        mock_print.assert_any_call("Łączna liczba poprawnych odpowiedzi: 8")
+        self.assertEqual([r['Score'] for r in mock_plot.call_args[0][0]], [8])
+
+        user_progress.analyze_progress()
+        mock_print.assert_any_call("  Quiz A: 5/10 (50.00%)")
+        user_progress.analyze_progress("Quiz C")
+        mock_print.assert_called_with("Brak wyników dla quizu 'Quiz C'.")
+        user_progress.close()
+
+    def test_user_progress_sqlite_buffered(self):
+        """Testuje buforowany zapis UserProgress do bazy SQLite."""
+        user_progress = UserProgress(data_file=os.path.join(self.temp_dir, "progress.csv"), backend="sqlite",
+                                     buffered=True, flush_interval=60)
+        user_progress.save_results("Quiz A", 5, 10)
+        self.assertEqual(user_progress.get_aggregates().summary()['count'], 1)
+        user_progress.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
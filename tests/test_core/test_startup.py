@@ -0,0 +1,33 @@
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from math_trainer.core.startup_benchmark import (IMPORT_TIME_BUDGET, LAZY_MODULES, STARTUP_MODULES,
+                                                 loaded_modules, measure_first_menu, measure_import_time)
+
+
+class TestStartup(unittest.TestCase):
+    """Strażnik czasu uruchamiania: moduły startowe nie mogą importować ciężkich bibliotek."""
+
+    def test_startup_modules_do_not_import_heavy_libraries(self):
+        """Testuje, czy moduły startowe nie importują numpy ani matplotlib."""
+        loaded = loaded_modules(STARTUP_MODULES)
+        for module in LAZY_MODULES:
+            self.assertNotIn(module, loaded, f"Moduł {module} jest importowany przy starcie aplikacji.")
+
+    def test_import_time_budget(self):
+        """Testuje czas importu modułów startowych."""
+        # Najlepszy z trzech pomiarów ogranicza wpływ chwilowego obciążenia maszyny
+        for module in STARTUP_MODULES:
+            duration = min(measure_import_time(module) for _ in range(3))
+            self.assertLess(duration, IMPORT_TIME_BUDGET, f"Import {module} trwa {duration:.3f} s.")
+
+    def test_main_reaches_first_menu(self):
+        """Testuje dojście aplikacji do pierwszego menu."""
+        self.assertGreater(measure_first_menu(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
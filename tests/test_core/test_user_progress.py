@@ -1,6 +1,7 @@
 import unittest
 import os
 import csv
+import glob
 import sys
 from unittest.mock import patch, MagicMock
 
@@ -16,6 +17,7 @@ class TestUserProgress(unittest.TestCase):
         """Konfiguracja przed każdym testem."""
         self.test_data_dir = os.path.join(os.path.dirname(__file__), 'temp_test_data')
         self.test_data_file = os.path.join(self.test_data_dir, "test_results.csv")
+        self.test_aggregates_file = os.path.join(self.test_data_dir, "test_results_aggregates.json")
 
         os.makedirs(self.test_data_dir, exist_ok=True)
         # Ścieżka do pliku results.csv musi być teraz względna do math_trainer/core/
@@ -32,6 +34,10 @@ class TestUserProgress(unittest.TestCase):
         """Czyszczenie po każdym teście."""
         if os.path.exists(self.test_data_file):
             os.remove(self.test_data_file)
+        if os.path.exists(self.test_aggregates_file):
+            os.remove(self.test_aggregates_file)
+        for stats_file in glob.glob(os.path.join(self.test_data_dir, "test_results_stats_*.json")):
+            os.remove(stats_file)
         if os.path.exists(self.test_data_dir):
             os.rmdir(self.test_data_dir)
 
@@ -57,6 +63,17 @@ class TestUserProgress(unittest.TestCase):
         self.assertEqual(results[0]['TotalQuestions'], total_questions)
         self.assertIsInstance(results[0]['Timestamp'], str)
 
+    def test_save_results_buffered(self):
+        """Testuje zapis wyników przez kolejkę zapisu w tle."""
+        buffered_progress = UserProgress(data_file=self.test_data_file, buffered=True, flush_interval=60)
+        buffered_progress.save_results("Quiz A", 5, 10)
+        buffered_progress.save_results("Quiz B", 8, 10)
+
+        # load_results zapisuje najpierw wiersze oczekujące w kolejce
+        results = buffered_progress.load_results()
+        buffered_progress.close()
+        self.assertEqual([(r['Quiz'], r['Score']) for r in results], [("Quiz A", 5), ("Quiz B", 8)])
+
     def test_load_results_empty_file(self):
         """Testuje wczytywanie wyników z pustego pliku (tylko nagłówki)."""
         results = self.user_progress.load_results()
@@ -115,6 +132,32 @@ class TestUserProgress(unittest.TestCase):
         self.user_progress.analyze_progress("NonExistent Quiz")
         mock_print.assert_called_with("Brak wyników dla quizu 'NonExistent Quiz'.")
 
+    @patch('builtins.print')
+    def test_analyze_progress_uses_aggregates(self, mock_print):
+        """Testuje, że analiza nie wczytuje ponownie całego pliku wyników po zapisie."""
+        self.user_progress.save_results("Quiz A", 5, 10)
+        self.user_progress.analyze_progress()
+        self.user_progress.save_results("Quiz A", 9, 10)
+
+        with patch.object(self.user_progress, 'load_results', wraps=self.user_progress.load_results) as load:
+            self.user_progress.analyze_progress("Quiz A")
+            load.assert_not_called()
+        mock_print.assert_any_call("Łączna liczba poprawnych odpowiedzi: 14")
+        mock_print.assert_any_call("Najlepszy wynik w quizie: 9")
+        mock_print.assert_any_call("Najgorszy wynik w quizie: 5")
+
+    @patch('builtins.print')
+    def test_analyze_progress_rebuilds_after_external_change(self, mock_print):
+        """Testuje odbudowę agregatów, gdy plik wyników zmieniono z zewnątrz."""
+        self.user_progress.save_results("Quiz A", 5, 10)
+        self.user_progress.analyze_progress()
+        with open(self.test_data_file, 'a', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerow(["2024-01-01 10:00:00", "Quiz C", 2, 4])
+
+        self.user_progress.analyze_progress()
+        mock_print.assert_any_call("  Quiz C: 2/4 (50.00%)")
+        mock_print.assert_any_call("Łączna liczba poprawnych odpowiedzi: 7")
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,16 +1,28 @@
 import unittest
 import sys
 import os
+import shutil
+import tempfile
 from unittest.mock import patch, MagicMock
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
 
-from math_trainer.core.visualization import plot_progress
+from math_trainer.core.progress_series import bucket_series, lttb_indices
+from math_trainer.core.visualization import plot_progress, plot_progress_columns
 
 
 class TestVisualization(unittest.TestCase):
     """Testy dla modułu visualization."""
 
+    def setUp(self):
+        """Konfiguracja przed każdym testem."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.plot_path = os.path.join(self.temp_dir, "plot.png")
+
+    def tearDown(self):
+        """Czyszczenie po każdym teście."""
+        shutil.rmtree(self.temp_dir)
+
     @patch('matplotlib.pyplot.show')
     @patch('matplotlib.pyplot.figure')
     @patch('matplotlib.pyplot.plot')
@@ -29,7 +41,7 @@ class TestVisualization(unittest.TestCase):
             {'Timestamp': '2023-01-03 12:00:00', 'Quiz': 'Quiz A', 'Score': 7, 'TotalQuestions': 10}
         ]
 
-        plot_progress(results)
+        plot_progress(results, output_path=self.plot_path)
 
         mock_figure.assert_called_once_with(figsize=(10, 6))
         mock_plot.assert_called_once()
@@ -40,6 +52,7 @@ class TestVisualization(unittest.TestCase):
         mock_xticks.assert_called_once_with(rotation=45)
         mock_tight_layout.assert_called_once()
         mock_show.assert_called_once()
+        self.assertTrue(os.path.exists(self.plot_path))
 
         dates_arg = mock_plot.call_args[0][0]
         percentages_arg = mock_plot.call_args[0][1]
@@ -67,7 +80,7 @@ class TestVisualization(unittest.TestCase):
             {'Timestamp': '2023-01-03 12:00:00', 'Quiz': 'Quiz A', 'Score': 7, 'TotalQuestions': 10}
         ]
 
-        plot_progress(results, quiz_name="Quiz A")
+        plot_progress(results, quiz_name="Quiz A", output_path=self.plot_path)
 
         mock_title.assert_called_once_with('Postępy w quizie: Quiz A')
 
@@ -82,7 +95,7 @@ class TestVisualization(unittest.TestCase):
     @patch('matplotlib.pyplot.show')
     def test_plot_progress_no_results(self, mock_show, mock_print):
         """Testuje, czy funkcja obsługuje brak danych do wykresu."""
-        plot_progress([])
+        plot_progress([], output_path=self.plot_path)
         mock_print.assert_called_once_with("Brak danych do wygenerowania wykresu.")
         mock_show.assert_not_called()
 
@@ -94,13 +107,84 @@ class TestVisualization(unittest.TestCase):
             {'Timestamp': '2023-01-01 10:00:00', 'Quiz': 'Quiz C', 'Score': 0, 'TotalQuestions': 0},
             {'Timestamp': '2023-01-02 11:00:00', 'Quiz': 'Quiz C', 'Score': 5, 'TotalQuestions': 10}
         ]
-        plot_progress(results, quiz_name="Quiz C")
+        plot_progress(results, quiz_name="Quiz C", output_path=self.plot_path)
 
         percentages_arg = mock_plot.call_args[0][1]
         self.assertAlmostEqual(percentages_arg[0], 0.0)
         self.assertAlmostEqual(percentages_arg[1], 50.0)
         mock_show.assert_called_once()
 
+    @patch('matplotlib.pyplot.show')
+    @patch('matplotlib.pyplot.savefig')
+    @patch('matplotlib.pyplot.plot')
+    def test_plot_progress_columns(self, mock_plot, mock_savefig, mock_show):
+        """Testuje wykres z kolumn liczbowych (sortowanie po czasie, zerowa liczba pytań)."""
+        import numpy as np
+        timestamps = np.array([200, 100, 300], dtype=np.int64)
+        plot_progress_columns(timestamps, np.array([8, 5, 0]), np.array([10, 10, 0]), quiz_name="Quiz A")
+
+        dates_arg = mock_plot.call_args[0][0]
+        percentages_arg = mock_plot.call_args[0][1]
+        self.assertEqual(dates_arg.astype(np.int64).tolist(), [100, 200, 300])
+        self.assertEqual(percentages_arg.tolist(), [50.0, 80.0, 0.0])
+        mock_show.assert_called_once()
+
+    @patch('matplotlib.pyplot.show')
+    @patch('matplotlib.pyplot.savefig')
+    @patch('matplotlib.pyplot.plot')
+    def test_plot_progress_downsampled(self, mock_plot, mock_savefig, mock_show):
+        """Testuje ograniczenie liczby rysowanych punktów dla długiej historii."""
+        import numpy as np
+        timestamps = np.arange(50000, dtype=np.int64) * 60
+        scores = np.arange(50000) % 11
+        plot_progress_columns(timestamps, scores, np.full(50000, 10), max_points=800)
+
+        dates_arg = mock_plot.call_args[0][0]
+        self.assertEqual(len(dates_arg), 800)
+        self.assertEqual(dates_arg[0].astype(np.int64), 0)
+        self.assertEqual(dates_arg[-1].astype(np.int64), 49999 * 60)
+        self.assertIsNone(mock_plot.call_args[1]['marker'])
+
+    @patch('matplotlib.pyplot.show')
+    @patch('matplotlib.pyplot.savefig')
+    @patch('matplotlib.pyplot.fill_between')
+    @patch('matplotlib.pyplot.plot')
+    def test_plot_progress_daily_buckets(self, mock_plot, mock_fill_between, mock_savefig, mock_show):
+        """Testuje agregację dzienną ze średnią i pasmem min/max."""
+        results = [
+            {'Timestamp': '2023-01-01 10:00:00', 'Quiz': 'Quiz A', 'Score': 5, 'TotalQuestions': 10},
+            {'Timestamp': '2023-01-01 18:00:00', 'Quiz': 'Quiz A', 'Score': 9, 'TotalQuestions': 10},
+            {'Timestamp': '2023-01-02 11:00:00', 'Quiz': 'Quiz A', 'Score': 8, 'TotalQuestions': 10}
+        ]
+        plot_progress(results, bucket="day")
+
+        self.assertEqual(mock_plot.call_args[0][1].tolist(), [70.0, 80.0])
+        self.assertEqual(mock_fill_between.call_args[0][1].tolist(), [50.0, 80.0])
+        self.assertEqual(mock_fill_between.call_args[0][2].tolist(), [90.0, 80.0])
+
+    def test_bucket_series_weeks_start_on_monday(self):
+        """Testuje, że tygodnie zaczynają się w poniedziałek."""
+        import numpy as np
+        timestamps = np.array(['2023-01-01T12:00', '2023-01-02T08:00', '2023-01-08T23:00'],
+                              dtype='datetime64[s]').astype(np.int64)
+        starts, means, _, _ = bucket_series(timestamps, np.array([10.0, 20.0, 40.0]), "week")
+        self.assertEqual(starts.astype('datetime64[s]').astype(str).tolist(),
+                         ['2022-12-26T00:00:00', '2023-01-02T00:00:00'])
+        self.assertEqual(means.tolist(), [10.0, 30.0])
+        with self.assertRaises(ValueError):
+            bucket_series(timestamps, np.zeros(3), "month")
+
+    def test_lttb_keeps_peaks(self):
+        """Testuje, że LTTB zachowuje punkty skrajne serii."""
+        import numpy as np
+        x = np.arange(1000)
+        y = np.zeros(1000)
+        y[500] = 100.0
+        selected = lttb_indices(x, y, 20)
+        self.assertEqual(len(selected), 20)
+        self.assertIn(500, selected.tolist())
+        self.assertEqual(lttb_indices(x, y, None).tolist(), list(range(1000)))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
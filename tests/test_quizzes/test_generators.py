@@ -0,0 +1,69 @@
+import unittest
+import os
+import sys
+from fractions import Fraction
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from math_trainer.quizzes.basic_arithmetic import BasicArithmeticQuiz
+from math_trainer.quizzes.fractionss import FractionsQuiz
+from math_trainer.quizzes.powers import PowersQuiz
+
+
+class TestQuestionGenerators(unittest.TestCase):
+    """Testy generatorów pytań w klasach quizów."""
+
+    def _operands(self, question):
+        # "Ile to 7 + 3?" -> ["7", "+", "3"]
+        return question[len("Ile to "):-1].split(" ")[:3]
+
+    def test_arithmetic_generator_answers(self):
+        """Testuje poprawność odpowiedzi generowanych pytań arytmetycznych."""
+        quiz = BasicArithmeticQuiz()
+        for q in quiz.generate_questions(500, seed=1, min_operand=1, max_operand=30):
+            left, operation, right = self._operands(q["question"])
+            left, right = int(left), int(right)
+            expected = {'+': left + right, '-': left - right, '*': left * right}.get(operation)
+            if operation == '/':
+                self.assertEqual(left % right, 0)
+                expected = left // right
+            self.assertEqual(q["answer"], expected)
+            self.assertTrue(quiz.check_answer(str(expected), q["answer"]))
+
+    def test_generators_are_reproducible(self):
+        """Testuje powtarzalność generowanych zestawów przy tym samym ziarnie."""
+        for quiz in (BasicArithmeticQuiz(), PowersQuiz(), FractionsQuiz()):
+            self.assertEqual(list(quiz.generate_questions(20, seed=9)), list(quiz.generate_questions(20, seed=9)))
+            self.assertEqual(quiz.generate_batch(20, seed=9).to_list(), quiz.generate_batch(20, seed=9).to_list())
+
+    def test_powers_difficulty_bounds(self):
+        """Testuje przestrzeganie zakresów podstaw i wykładników."""
+        batch = PowersQuiz().generate_batch(10_000, seed=2, min_base=3, max_base=5, min_exponent=1, max_exponent=3)
+        self.assertEqual(len(batch), 10_000)
+        self.assertTrue(((batch.columns["base"] >= 3) & (batch.columns["base"] <= 5)).all())
+        self.assertTrue((batch.columns["answer"] == batch.columns["base"] ** batch.columns["exponent"]).all())
+        with self.assertRaises(ValueError):
+            PowersQuiz().generate_batch(1, max_base=10, max_exponent=30)
+
+    def test_fractions_batch_matches_fraction(self):
+        """Testuje, czy wektorowo obliczone wyniki ułamków zgadzają się z klasą Fraction."""
+        quiz = FractionsQuiz()
+        for q in quiz.generate_batch(2_000, seed=4, denominators=(2, 3, 7, 9)):
+            a, operation, c = self._operands(q["question"])
+            result = {'+': Fraction(a) + Fraction(c), '-': Fraction(a) - Fraction(c),
+                      '*': Fraction(a) * Fraction(c)}[operation]
+            self.assertGreaterEqual(result, 0)
+            self.assertEqual(q["answer"], str(result))
+            self.assertTrue(quiz.check_answer(q["answer"], q["answer"]))
+
+    def test_arithmetic_batch_division_exact(self):
+        """Testuje, czy dzielenie w partii pytań zawsze daje wynik całkowity."""
+        batch = BasicArithmeticQuiz().generate_batch(10_000, seed=5, operations="/", min_operand=0)
+        columns = batch.columns
+        self.assertTrue((columns["right"] >= 1).all())
+        self.assertTrue((columns["left"] == columns["answer"] * columns["right"]).all())
+        self.assertEqual(batch[-1]["answer"], int(columns["answer"][-1]))
+
+
+if __name__ == '__main__':
+    unittest.main()